@@ -1,6 +1,13 @@
 """
 Calendar SSE MCP - A Model Context Protocol server for macOS Calendar.app
 """
+import logging
+
+# Records go only where logs.py routes them (the CLI prints warnings, the
+# server writes JSON lines), never to the root handler FastMCP installs
+_logger = logging.getLogger(__name__)
+_logger.addHandler(logging.NullHandler())
+_logger.propagate = False
 
 from .date_utils import parse_date_string, create_date_range, format_iso
 from .models import (
@@ -17,10 +17,14 @@ import dateparser
 import re
 
 from . import calendar_store, __version__
-from .calendar_store import CalendarStoreError
+from .calendar_store import CalendarStoreError, EventConflictError
 from .server import mcp, get_calendar_store
 from .launch_agent import create_launch_agent, check_launch_agent, uninstall_launch_agent
+from .log_tail import LogFilter, follow, format_line, tail_lines
+from .logs import configure_cli_logging, configure_logging
+from .profiler import PROFILER
 from .date_utils import create_date_range, format_iso
+from .text_index import TextQuery, normalize_text, tokenize
 
 
 # Load environment variables from .env file if it exists
@@ -77,11 +81,27 @@ def add_events_parser(subparsers):
     parser.add_argument("calendar", help="Name of the calendar")
     parser.add_argument("--start-date", help="Start date in flexible format (e.g. 'yesterday', '2023-01-01')")
     parser.add_argument("--end-date", help="End date in flexible format (e.g. 'tomorrow', '2023-12-31')")
-    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.add_argument(
+        "--fields",
+        help="Comma-separated event fields to include in JSON output (e.g. 'id,summary,start')"
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Output in JSON format")
+    output.add_argument("--ndjson", action="store_true", help="Stream events as newline-delimited JSON")
     parser.set_defaults(func=get_events_command)
     return parser
 
 
+def add_event_parser(subparsers):
+    """Add the event command parser"""
+    parser = subparsers.add_parser("event", help="Show a single event by ID")
+    parser.add_argument("event_id", help="ID of the event")
+    parser.add_argument("--calendar", help="Calendar the event must belong to")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.set_defaults(func=get_event_command)
+    return parser
+
+
 def add_create_parser(subparsers):
     """Add the create command parser"""
     parser = subparsers.add_parser("create", help="Create a new event")
@@ -97,6 +117,10 @@ def add_create_parser(subparsers):
     parser.add_argument("--duration", type=str, help="Duration (e.g. '60min', '1h', '1.5 hours', default: 60min)")
     parser.add_argument("--location", help="Event location")
     parser.add_argument("--description", help="Event description")
+    parser.add_argument(
+        "--conflicts", choices=["off", "report", "block"], default="off",
+        help="Check for overlapping busy events: 'report' lists them, 'block' refuses to create the event"
+    )
     parser.add_argument("--json", action="store_true", help="Output in JSON format")
     parser.set_defaults(func=create_event_command_v2)
     return parser
@@ -132,15 +156,79 @@ def add_search_parser(subparsers):
     """Add the search command parser"""
     parser = subparsers.add_parser("search", help="Search for events")
     parser.add_argument("query", help="Search term (case-insensitive)")
+    parser.add_argument(
+        "--mode", choices=["substring", "query"], default="substring",
+        help="'substring' matches anywhere in the text; 'query' matches whole words "
+             "and supports \"phrases\" and OR"
+    )
     parser.add_argument("--calendar", help="Specific calendar to search in")
     parser.add_argument("--start-date", help="Start date in flexible format")
     parser.add_argument("--end-date", help="End date in flexible format")
     parser.add_argument("--duration", help="Duration from start date (e.g., '3d', '1 week')")
-    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Output in JSON format")
+    output.add_argument("--ndjson", action="store_true", help="Stream matching events as newline-delimited JSON")
     parser.set_defaults(func=search_events_command)
     return parser
 
 
+def add_batch_parser(subparsers):
+    """Add the batch command parser"""
+    parser = subparsers.add_parser("batch", help="Create, update or delete many events with one commit")
+    parser.add_argument(
+        "action", choices=["create", "update", "delete", "check"],
+        help="Operation to apply to every item ('check' reports conflicts without writing)"
+    )
+    parser.add_argument(
+        "file", nargs="?", default="-",
+        help="JSON file with a list of items using the MCP tool field names (default: stdin)"
+    )
+    parser.add_argument(
+        "--conflicts", choices=["off", "report", "block"], default="off",
+        help="For create: 'report' lists overlapping events, 'block' skips events that overlap"
+    )
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.set_defaults(func=batch_events_command)
+    return parser
+
+
+def add_freebusy_parser(subparsers):
+    """Add the freebusy command parser"""
+    parser = subparsers.add_parser("freebusy", help="Show merged busy blocks and free time across calendars")
+    parser.add_argument(
+        "--calendar", action="append", dest="calendars",
+        help="Calendar to include (repeatable; default: all calendars)"
+    )
+    parser.add_argument("--start-date", help="Start date in flexible format (default: today)")
+    parser.add_argument("--end-date", help="End date in flexible format (default: 7 days after start)")
+    parser.add_argument("--include-all-day", action="store_true", help="Count busy all-day events as busy time")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.set_defaults(func=free_busy_command)
+    return parser
+
+
+def add_slots_parser(subparsers):
+    """Add the slots command parser"""
+    parser = subparsers.add_parser("slots", help="Find meeting slots when all calendars are free")
+    parser.add_argument("duration", type=int, help="Meeting length in minutes")
+    parser.add_argument(
+        "--calendar", action="append", dest="calendars",
+        help="Calendar that must be free (repeatable; default: all calendars)"
+    )
+    parser.add_argument("--start-date", help="Earliest slot start in flexible format (default: now)")
+    parser.add_argument("--end-date", help="Latest slot end in flexible format (default: 7 days after start)")
+    parser.add_argument("--work-start", default="09:00", help="Start of the working day as HH:MM (default: 09:00)")
+    parser.add_argument("--work-end", default="17:00", help="End of the working day as HH:MM (default: 17:00)")
+    parser.add_argument("--buffer", type=int, default=0, help="Free minutes required around existing events")
+    parser.add_argument("--days", help="Comma-separated weekdays slots may fall on (default: mon-fri)")
+    parser.add_argument("--prefer", help="Comma-separated weekdays whose slots are listed first")
+    parser.add_argument("--limit", type=int, default=5, help="Maximum number of slots (default: 5)")
+    parser.add_argument("--include-all-day", action="store_true", help="Count busy all-day events as busy time")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.set_defaults(func=find_slots_command)
+    return parser
+
+
 def create_cli_parser(subparsers):
     """Create the CLI command parser"""
     cli_parser = subparsers.add_parser("cli", help="Direct calendar operations")
@@ -150,10 +238,14 @@ def create_cli_parser(subparsers):
     # Add calendar operations to cli_subparsers
     add_calendars_parser(cli_subparsers)
     add_events_parser(cli_subparsers)
+    add_event_parser(cli_subparsers)
     add_create_parser(cli_subparsers)
     add_update_parser(cli_subparsers)
     add_delete_parser(cli_subparsers)
     add_search_parser(cli_subparsers)
+    add_batch_parser(cli_subparsers)
+    add_freebusy_parser(cli_subparsers)
+    add_slots_parser(cli_subparsers)
     
     return cli_parser
 
@@ -232,9 +324,13 @@ def add_logs_parser(subparsers):
     """Add the logs command parser"""
     parser = subparsers.add_parser("logs", help="Display server logs")
     parser.add_argument("--name", default="com.calendar-sse-mcp", help="Launch Agent name")
-    parser.add_argument("--level", choices=["info", "error", "all"], default="all", 
-                       help="Log level to display (info=stdout, error=stderr, all=both)")
+    parser.add_argument("--level", choices=["debug", "info", "warning", "error", "all"], default="all", 
+                       help="Minimum level of server log records; info also shows stdout, warning/error stderr")
     parser.add_argument("--lines", type=int, default=10, help="Number of log lines to show")
+    parser.add_argument("--since", help="Only server log records from this time (e.g. '1 hour ago')")
+    parser.add_argument("--until", help="Only server log records up to this time")
+    parser.add_argument("--follow", "-f", action="store_true", help="Keep printing new lines as they are logged")
+    parser.add_argument("--json", action="store_true", help="Print server log records as raw JSON lines")
     parser.set_defaults(func=server_logs_command)
     return parser
 
@@ -245,10 +341,31 @@ def add_run_parser(subparsers):
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=27212, help="Port to bind to")
     parser.add_argument("--dev", action="store_true", help="Run on development port (27213)")
+    parser.add_argument(
+        "--profile", type=float, nargs="?", const=0.1, metavar="RATE",
+        help="Profile a fraction of tool and resource calls (default rate: 0.1; "
+             "see 'server profiles')"
+    )
     parser.set_defaults(func=run_server_command)
     return parser
 
 
+def add_profiles_parser(subparsers):
+    """Add the profiles command parser"""
+    parser = subparsers.add_parser("profiles", help="List or show the slowest profiled calls")
+    parser.add_argument("profile", nargs="?", help="Profile ID or rank (1 = slowest) to show in detail")
+    parser.add_argument("--dir", help="Profile directory (default: SERVER_PROFILE_DIR or ~/.calendar-sse-mcp/profiles)")
+    parser.add_argument(
+        "--sort", default="cumulative", choices=["cumulative", "tottime", "calls"],
+        help="Sort order of the detailed listing (default: cumulative)"
+    )
+    parser.add_argument("--lines", type=int, default=30, help="Functions shown in the detailed listing (default: 30)")
+    parser.add_argument("--clear", action="store_true", help="Delete all kept profiles")
+    parser.add_argument("--json", action="store_true", help="Output the profile list in JSON format")
+    parser.set_defaults(func=server_profiles_command)
+    return parser
+
+
 def create_server_parser(subparsers):
     """Create the server command parser"""
     server_parser = subparsers.add_parser("server", help="Server management operations")
@@ -262,6 +379,7 @@ def create_server_parser(subparsers):
     add_uninstall_dev_parser(server_subparsers)
     add_logs_parser(server_subparsers)
     add_run_parser(server_subparsers)
+    add_profiles_parser(server_subparsers)
     
     return server_parser
 
@@ -310,16 +428,35 @@ def get_events_command(args: argparse.Namespace) -> None:
         if end_date and len(end_date) == 10:  # YYYY-MM-DD format (10 chars)
             end_date = f"{end_date}T23:59:59"
             
+        # The text listing only shows start, summary and ID
+        if args.json or args.ndjson:
+            fields = [field.strip() for field in args.fields.split(",")] if args.fields else None
+        else:
+            fields = ["id", "summary", "start"]
+        
         # Create a CalendarStore instance
         store = get_calendar_store()
-        events = store.get_events(
-            calendar_name=args.calendar,
-            start_date=start_date,
-            end_date=end_date
-        )
         
         if args.json:
+            events = store.get_events(
+                calendar_name=args.calendar,
+                start_date=start_date,
+                end_date=end_date,
+                fields=fields
+            )
             print(json.dumps(events, indent=2, ensure_ascii=False))
+            return
+        
+        # Stream window by window so long ranges use constant memory
+        events = store.iter_events(
+            calendar_name=args.calendar,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields
+        )
+        if args.ndjson:
+            for event in events:
+                print(json.dumps(event, ensure_ascii=False))
         else:
             print(f"Events in calendar '{args.calendar}':")
             for event in events:
@@ -333,6 +470,31 @@ def get_events_command(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def get_event_command(args: argparse.Namespace) -> None:
+    """Show a single event by ID"""
+    try:
+        store = get_calendar_store()
+        event = store.get_event(args.event_id, calendar_name=args.calendar)
+        
+        if args.json:
+            print(json.dumps(event, indent=2, ensure_ascii=False))
+        else:
+            print(f"{event['summary']} (ID: {event['id']})")
+            print(f"  Calendar: {event['calendar']}")
+            print(f"  Start: {event['start']}")
+            print(f"  End: {event['end']}")
+            if event["location"]:
+                print(f"  Location: {event['location']}")
+            if event["description"]:
+                print(f"  Description: {event['description']}")
+    except CalendarStoreError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def create_event_command_v2(args: argparse.Namespace) -> None:
     """Create a new event with flexible time parsing"""
     try:
@@ -409,22 +571,39 @@ def create_event_command_v2(args: argparse.Namespace) -> None:
         
         # Create the event
         store = get_calendar_store()
+        conflicts = []
+        if args.conflicts == "report":
+            conflicts = store.find_conflicts(start_date, end_date)
         event_id = store.create_event(
             calendar_name=calendar,
             summary=args.summary,
             start_date=start_date,
             end_date=end_date,
             location=args.location,
-            description=args.description
+            description=args.description,
+            check_conflicts=args.conflicts == "block"
         )
         
         if args.json:
-            print(json.dumps({"success": True, "event_id": event_id}, ensure_ascii=False))
+            result = {"success": True, "event_id": event_id}
+            if args.conflicts != "off":
+                result["conflicts"] = conflicts
+            print(json.dumps(result, ensure_ascii=False))
         else:
             print(f"Event '{args.summary}' created successfully in calendar '{calendar}'")
             print(f"  Date: {date_only}")
             print(f"  Time: {start_time} - {end_time}")
             print(f"  Event ID: {event_id}")
+            for conflict in conflicts:
+                print(f"  Overlaps: {conflict['start']} - {conflict['end']} | {conflict['summary']}")
+    except EventConflictError as e:
+        if args.json:
+            print(json.dumps({"success": False, "error": str(e), "conflicts": e.conflicts}, ensure_ascii=False))
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+            for conflict in e.conflicts:
+                print(f"  {conflict['start']} - {conflict['end']} | {conflict['summary']}", file=sys.stderr)
+        sys.exit(1)
     except CalendarStoreError as e:
         if args.json:
             print(json.dumps({"success": False, "error": str(e)}, ensure_ascii=False))
@@ -515,6 +694,84 @@ def delete_event_command(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def batch_events_command(args: argparse.Namespace) -> None:
+    """Apply a batch of creates, updates or deletes from a JSON file"""
+    try:
+        if args.file == "-":
+            items = json.load(sys.stdin)
+        else:
+            with open(args.file, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        if not isinstance(items, list):
+            raise ValueError("Batch input must be a JSON list")
+        
+        store = get_calendar_store()
+        if args.action == "check":
+            _print_conflict_check(store.check_conflicts(items), args.json)
+            return
+        
+        if args.action == "create":
+            results = store.create_events(items, conflicts=args.conflicts)
+        else:
+            batch = {
+                "update": store.update_events,
+                "delete": store.delete_events
+            }[args.action]
+            results = batch(items)
+        failed = [result for result in results if not result["success"]]
+        
+        if args.json:
+            print(json.dumps({
+                "success": not failed,
+                "succeeded": len(results) - len(failed),
+                "failed": len(failed),
+                "results": results
+            }, ensure_ascii=False))
+        else:
+            print(f"{len(results) - len(failed)} of {len(results)} events processed successfully")
+            for result in failed:
+                print(f"  Item {result['index']}: {result['error']}", file=sys.stderr)
+        
+        if failed:
+            sys.exit(1)
+    except (OSError, ValueError) as e:
+        if args.json:
+            print(json.dumps({"success": False, "error": f"Invalid batch input: {e}"}, ensure_ascii=False))
+        else:
+            print(f"Invalid batch input: {e}", file=sys.stderr)
+        sys.exit(1)
+    except CalendarStoreError as e:
+        if args.json:
+            print(json.dumps({"success": False, "error": str(e)}, ensure_ascii=False))
+        else:
+            print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        if args.json:
+            print(json.dumps({"success": False, "error": f"Unexpected error: {e}"}, ensure_ascii=False))
+        else:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _print_conflict_check(results: List[Dict[str, Any]], as_json: bool) -> None:
+    """Print the result of a batch conflict check, exiting with 1 if any item conflicts"""
+    conflicting = [result for result in results if result.get("conflicts")]
+    if as_json:
+        print(json.dumps({"conflicting": len(conflicting), "results": results}, ensure_ascii=False))
+    else:
+        print(f"{len(conflicting)} of {len(results)} events have conflicts")
+        for result in results:
+            if "error" in result:
+                print(f"  Item {result['index']}: {result['error']}", file=sys.stderr)
+            for conflict in result.get("conflicts", []):
+                other = f"item {conflict['index']}" if "index" in conflict else conflict["calendar"]
+                print(f"  Item {result['index']} overlaps {conflict['start']} - {conflict['end']} | "
+                      f"{conflict['summary']} ({other})")
+    if conflicting:
+        sys.exit(1)
+
+
 def search_events_command(args: argparse.Namespace) -> None:
     """Search for events"""
     try:
@@ -539,23 +796,38 @@ def search_events_command(args: argparse.Namespace) -> None:
         
         # Create a CalendarStore instance
         store = get_calendar_store()
-        events = store.get_events(
+        events = store.iter_events(
             calendar_name=calendar_name,
             start_date=start_date,
             end_date=end_date
         )
         
-        # Filter events by query
-        query = args.query.lower()
-        matching_events = [
-            event for event in events
-            if (
-                query in event["summary"].lower() or
-                query in (event["description"] or "").lower() or
-                query in (event["location"] or "").lower()
+        # Filter events by query while streaming, so only matches are kept
+        if args.mode == "query":
+            text_query = TextQuery.parse(args.query)
+            matching_events = (
+                event for event in events
+                if text_query.matches(
+                    tokenize(event[field] or "") for field in ("summary", "description", "location")
+                )
+            )
+        else:
+            query = normalize_text(args.query)
+            matching_events = (
+                event for event in events
+                if (
+                    query in normalize_text(event["summary"]) or
+                    query in normalize_text(event["description"] or "") or
+                    query in normalize_text(event["location"] or "")
+                )
             )
-        ]
         
+        if args.ndjson:
+            for event in matching_events:
+                print(json.dumps(event, ensure_ascii=False))
+            return
+        
+        matching_events = list(matching_events)
         if args.json:
             print(json.dumps(matching_events, indent=2, ensure_ascii=False))
         else:
@@ -572,6 +844,77 @@ def search_events_command(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def free_busy_command(args: argparse.Namespace) -> None:
+    """Show busy blocks and free slots across calendars"""
+    try:
+        start_dt, end_dt = create_date_range(args.start_date, args.end_date)
+        
+        store = get_calendar_store()
+        result = store.get_free_busy(
+            calendar_names=args.calendars,
+            start_date=start_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            end_date=end_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            include_all_day=args.include_all_day
+        )
+        
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(f"Free/busy from {result['start']} to {result['end']}:")
+            print("Busy:")
+            for block in result["busy"]:
+                print(f"- {block['start']} - {block['end']}")
+            print("Free:")
+            for block in result["free_slots"]:
+                print(f"- {block['start']} - {block['end']}")
+    except ValueError as e:
+        print(f"Date error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except CalendarStoreError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def find_slots_command(args: argparse.Namespace) -> None:
+    """Find free meeting slots across calendars"""
+    try:
+        start_dt, end_dt = create_date_range(args.start_date or datetime.datetime.now(), args.end_date)
+        
+        store = get_calendar_store()
+        result = store.find_available_slots(
+            args.duration,
+            calendar_names=args.calendars,
+            start_date=start_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            end_date=end_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            working_hours_start=args.work_start,
+            working_hours_end=args.work_end,
+            buffer_minutes=args.buffer,
+            days=args.days.split(",") if args.days else None,
+            preferred_days=args.prefer.split(",") if args.prefer else None,
+            max_results=args.limit,
+            include_all_day=args.include_all_day
+        )
+        
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(f"Found {result['count']} free {args.duration}-minute slots:")
+            for slot in result["slots"]:
+                print(f"- {slot['start']} - {slot['end']}")
+    except ValueError as e:
+        print(f"Date error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except CalendarStoreError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 # ----- Server Command Handlers -----
 
 def run_server_command(args: argparse.Namespace) -> None:
@@ -586,10 +929,20 @@ def run_server_command(args: argparse.Namespace) -> None:
     
     print(f"Starting server on {host}:{port}...")
     
+    # Server logs go to CALENDAR_LOG_FILE (JSON lines, rotated) or stderr
+    log_path = configure_logging()
+    if log_path:
+        print(f"Logging to {log_path}")
+    
     # Set the settings directly on the mcp object
     mcp.settings.port = port
     mcp.settings.host = host
     
+    # The flag overrides SERVER_PROFILE_RATE; other settings come from the environment
+    PROFILER.configure(rate=args.profile)
+    if PROFILER.rate > 0:
+        print(f"Profiling {PROFILER.rate:.0%} of calls, keeping the {PROFILER.keep} slowest in {PROFILER.directory}")
+    
     # Run the server with SSE transport
     mcp.run(transport="sse")
 
@@ -716,34 +1069,108 @@ def server_restart_command(args: argparse.Namespace) -> None:
 def server_logs_command(args: argparse.Namespace) -> None:
     """Display server logs"""
     agent_name = args.name
-    is_loaded, status = check_launch_agent(agent_name=agent_name, show_logs=True)
+    is_loaded, status = check_launch_agent(agent_name=agent_name)
     
     if not status["installed"]:
         print(f"Launch Agent '{agent_name}' is not installed.", file=sys.stderr)
         sys.exit(1)
     
+    times = {}
+    for option in ("since", "until"):
+        value = getattr(args, option)
+        if value:
+            times[option] = dateparser.parse(value)
+            if times[option] is None:
+                print(f"Error: Could not parse time '{value}'", file=sys.stderr)
+                sys.exit(1)
+    level = None if args.level == "all" else args.level
+    server_filter = LogFilter(min_level=level, **times)
+    
     # Display status information
     print(f"Launch Agent '{agent_name}' status: {'running' if status['loaded'] else 'stopped'}")
     
-    # Display logs based on level
-    if args.level in ["all", "info"] and status["stdout_log"]:
-        print(f"\n--- Last {args.lines} lines of stdout log ({status['stdout_log']}) ---")
-        if status["stdout_content"]:
-            for line in status["stdout_content"][-args.lines:]:
-                print(line.rstrip())
-        else:
-            print("(No stdout content)")
+    # stdout/stderr lines have no level or time: select them by stream, and
+    # leave them out when a time window is asked for
+    streams = []
+    if status["server_log"]:
+        streams.append(("server", status["server_log"], server_filter))
+    if not times:
+        if args.level in ["all", "debug", "info"] and status["stdout_log"]:
+            streams.append(("stdout", status["stdout_log"], None))
+        if args.level in ["all", "debug", "warning", "error"] and status["stderr_log"]:
+            streams.append(("stderr", status["stderr_log"], None))
+    
+    if not streams:
+        print("No log files found.")
+        return
+    
+    def show(stream: str, line: str) -> str:
+        return line if args.json or stream != "server" else format_line(line)
     
-    if args.level in ["all", "error"] and status["stderr_log"]:
-        print(f"\n--- Last {args.lines} lines of stderr log ({status['stderr_log']}) ---")
-        if status["stderr_content"]:
-            for line in status["stderr_content"][-args.lines:]:
-                print(line.rstrip())
+    # Read backwards from the end of each file, so large logs cost no more than small ones
+    for stream, path, log_filter in streams:
+        print(f"\n--- Last {args.lines} lines of {stream} log ({path}) ---")
+        try:
+            lines = tail_lines(Path(path), args.lines, log_filter)
+        except OSError as e:
+            print(f"Could not read log file: {e}")
+            continue
+        for line in lines:
+            print(show(stream, line))
+        if not lines:
+            print(f"(No {stream} content)")
+    
+    if args.follow:
+        filters = {Path(path): (stream, log_filter) for stream, path, log_filter in streams}
+        print(f"\n--- Following {', '.join(stream for stream, _, _ in streams)} (Ctrl-C to stop) ---", flush=True)
+        try:
+            for path, line in follow(filters):
+                stream, log_filter = filters[path]
+                if log_filter is None or log_filter.match(line):
+                    prefix = f"[{stream}] " if len(streams) > 1 else ""
+                    print(prefix + show(stream, line), flush=True)
+        except KeyboardInterrupt:
+            pass
+
+
+def server_profiles_command(args: argparse.Namespace) -> None:
+    """List, show or clear the slowest profiled calls"""
+    PROFILER.configure(directory=Path(args.dir).expanduser() if args.dir else None)
+    
+    if args.clear:
+        print(f"Deleted {PROFILER.clear()} profiles from {PROFILER.directory}")
+        return
+    
+    profiles = PROFILER.profiles()
+    if args.profile:
+        # Accept a rank from the listing as well as an ID
+        if args.profile.isdigit() and 1 <= int(args.profile) <= len(profiles):
+            profile_id = profiles[int(args.profile) - 1]["id"]
         else:
-            print("(No stderr content)")
+            profile_id = args.profile
+        try:
+            report = PROFILER.report(profile_id, sort=args.sort, lines=args.lines)
+        except KeyError:
+            print(f"Error: No profile '{args.profile}' in {PROFILER.directory}", file=sys.stderr)
+            sys.exit(1)
+        entry = next(entry for entry in profiles if entry["id"] == profile_id)
+        print(f"{entry['handler']} (arguments {entry['args_hash']}) took {entry['duration']:.3f}s "
+              f"at {datetime.datetime.fromtimestamp(entry['started']).isoformat(timespec='seconds')}")
+        print(report)
+        return
     
-    if not status["stdout_log"] and not status["stderr_log"]:
-        print("No log files found.")
+    if args.json:
+        print(json.dumps(profiles, indent=2, ensure_ascii=False))
+        return
+    
+    if not profiles:
+        print(f"No profiles in {PROFILER.directory}")
+        return
+    print(f"Slowest profiled calls ({PROFILER.directory}):")
+    for rank, entry in enumerate(profiles, 1):
+        started = datetime.datetime.fromtimestamp(entry["started"]).isoformat(timespec="seconds")
+        print(f"{rank:3}. {entry['duration']:8.3f}s  {started}  {entry['handler']} "
+              f"(arguments {entry['args_hash']})  {entry['id']}")
 
 
 def server_uninstall_dev_command(args: argparse.Namespace) -> None:
@@ -792,6 +1219,10 @@ def main():
             subparsers.choices["server"].print_help()
         sys.exit(1)
     
+    # Warnings and errors from the store are printed on stderr ("server run"
+    # replaces this with the structured server log)
+    configure_cli_logging()
+    
     # Run the corresponding function for the command
     args.func(args)
 
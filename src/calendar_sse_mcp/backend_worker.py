@@ -0,0 +1,445 @@
+"""
+Dedicated backend thread for CalendarStore.
+
+EventKit wants its store used from one thread, and its callbacks
+(authorization results, change notifications) are only delivered on a
+thread that runs its run loop. WorkerBackend creates the wrapped backend on
+a BackendWorker thread and turns every backend call into a request on that
+thread's queue. Between requests the worker pumps the run loop.
+
+Callers block on the returned future (the synchronous CalendarBackend
+interface) or await it through ``acall``, so the backend needs no lock of
+its own and an asyncio caller never blocks its event loop on a query.
+
+Change notifications raised while a request runs are handed back to the
+calling thread and delivered there after the request completes.
+Notifications arriving between requests (external edits) are delivered on
+a separate notifier thread. The worker itself never runs store code, so it
+cannot deadlock with a caller that holds a store lock while waiting for it.
+
+Events never leave the worker as backend objects (WorkerEvent): the
+attributes a fetch asks for are read on the worker in the same request,
+the rest through the worker when first used, and attribute writes are
+staged and applied on the worker when the event is saved. Separate
+handles for fetch threads (``worker_handle``) each get a worker of their
+own for the same reason.
+"""
+import asyncio
+import dataclasses
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Iterable, Set, Tuple
+
+from .backends import BackendError, CalendarBackend, CalendarInfo, ChangeNotifier, EventHandle, EventRecord, StoreChange
+
+logger = logging.getLogger(__name__)
+
+_EVENT_FIELDS = frozenset(field.name for field in dataclasses.fields(EventRecord))
+_WRITABLE_FIELDS = frozenset(("title", "start", "end", "location", "notes", "all_day"))
+# Read with every fetched event: the store keys, orders and indexes events by them
+_KEY_FIELDS = frozenset(("identifier", "calendar_id", "start", "end"))
+
+
+class WorkerEvent:
+    """
+    Event whose backend object stays on a worker thread.
+
+    The key fields and the attributes the fetch asked for are read on the
+    worker in the request that fetched the event. Any other attribute is
+    read through the worker on first access (one round trip) and kept.
+    Writes update the values and are staged until ``WorkerBackend.save_event``
+    applies them to the backend event on the worker thread.
+    """
+    __slots__ = ("_handle", "_worker", "_values", "_staged")
+
+    def __init__(self, handle: EventHandle, worker: "BackendWorker", attributes: Optional[Iterable[str]] = None) -> None:
+        # Runs on the worker thread
+        object.__setattr__(self, "_handle", handle)
+        object.__setattr__(self, "_worker", worker)
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_staged", {})
+        self._read(_EVENT_FIELDS if attributes is None else _KEY_FIELDS.union(attributes))
+
+    def _read(self, names: Iterable[str]) -> None:
+        """Read the attributes not loaded yet (on the worker thread)"""
+        handle, values = self._handle, self._values
+        for name in names:
+            if name not in values:
+                values[name] = getattr(handle, name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _EVENT_FIELDS:
+            raise AttributeError(name)
+        if name not in self._values:
+            self._worker.call(self._read, (name,))
+        return self._values[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in _WRITABLE_FIELDS:
+            raise AttributeError(f"Event field '{name}' is read-only")
+        self._values[name] = value
+        self._staged[name] = value
+
+    def _apply(self) -> EventHandle:
+        """Write the staged fields to the backend event (on the worker thread)"""
+        for name, value in self._staged.items():
+            setattr(self._handle, name, value)
+        self._staged.clear()
+        return self._handle
+
+    def _reload(self) -> None:
+        """Re-read the loaded fields, e.g. the identifier assigned by a save (on the worker thread)"""
+        self._values.update({name: getattr(self._handle, name) for name in list(self._values)})
+
+
+def _read_events(events: List[WorkerEvent], names: Tuple[str, ...]) -> None:
+    for event in events:
+        event._read(names)
+
+
+def prefetch(events: Iterable[Any], attributes: Iterable[str]) -> None:
+    """
+    Load attributes of worker events with one worker call per worker.
+
+    Reading an attribute a fetch did not load costs a worker round trip per
+    event; callers about to read the same attributes of many events load
+    them here in one request instead. Other kinds of events are skipped.
+
+    Args:
+        events: Events, typically from ``events_in_range``
+        attributes: EventHandle attributes about to be read
+    """
+    names = tuple(attributes)
+    pending: Dict["BackendWorker", List[WorkerEvent]] = {}
+    for event in events:
+        if isinstance(event, WorkerEvent) and any(name not in event._values for name in names):
+            pending.setdefault(event._worker, []).append(event)
+    for worker, group in pending.items():
+        worker.call(_read_events, group, names)
+
+
+def _fetch_events(
+    backend: CalendarBackend,
+    worker: "BackendWorker",
+    start: float,
+    end: float,
+    calendar_ids: Optional[List[str]],
+    attributes: Optional[Iterable[str]]
+) -> List[EventHandle]:
+    # Runs on the worker thread
+    if attributes is not None:
+        attributes = frozenset(attributes)
+    return [
+        WorkerEvent(event, worker, attributes)
+        for event in backend.events_in_range(start, end, calendar_ids, attributes)
+    ]
+
+
+def _lookup_event(backend: CalendarBackend, worker: "BackendWorker", event_id: str) -> Optional[EventHandle]:
+    # Runs on the worker thread
+    event = backend.event_with_identifier(event_id)
+    return WorkerEvent(event, worker) if event else None
+
+
+class _ThreadHandle:
+    """
+    Read-only backend handle with a worker thread of its own.
+
+    Backends such as EventKit give each fetch thread a separate store
+    handle (``worker_handle``). Running it on its own worker keeps the
+    handle and its events on one thread, so events fetched through it
+    still read attributes lazily whichever thread asks.
+    """
+
+    def __init__(self, backend: CalendarBackend, name: str, on_close: Callable[["_ThreadHandle"], None]) -> None:
+        self._worker = BackendWorker(name=name)
+        self._backend = backend
+        self._on_close = on_close
+        self.name = backend.name
+
+    def calendars(self) -> List[CalendarInfo]:
+        return self._worker.call(self._backend.calendars)
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        return self._worker.call(_fetch_events, self._backend, self._worker, start, end, calendar_ids, attributes)
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        return self._worker.call(_lookup_event, self._backend, self._worker, event_id)
+
+    def close(self) -> None:
+        """Close the handle and stop its thread"""
+        try:
+            self._worker.call(self._backend.close)
+        finally:
+            self._worker.stop()
+            self._on_close(self)
+
+
+class BackendWorker:
+    """A daemon thread executing queued calls in order"""
+
+    def __init__(
+        self,
+        name: str = "calendar-backend",
+        idle: Optional[Callable[[], None]] = None,
+        idle_interval: float = 0.05
+    ) -> None:
+        """
+        Start the worker thread.
+
+        Args:
+            name: Thread name
+            idle: Called on the worker thread whenever the queue has been empty
+                  for ``idle_interval`` seconds (e.g. to pump a run loop)
+            idle_interval: Seconds to wait for a request before calling ``idle``
+        """
+        self._queue: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], tuple, dict]]]" = queue.Queue()
+        self._idle = idle
+        self._idle_interval = idle_interval
+        self._stopped = False
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def on_worker_thread(self) -> bool:
+        """True if called from the worker thread itself"""
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue a call for the worker thread.
+
+        Returns:
+            Future resolved with the call's result or exception (BackendError
+            once the worker has stopped)
+        """
+        future: Future = Future()
+        if self.on_worker_thread:
+            # Re-entrant call: queueing would wait for ourselves
+            self._execute(future, fn, args, kwargs)
+            return future
+        with self._submit_lock:
+            if self._stopped:
+                future.set_exception(BackendError("Calendar backend worker has stopped"))
+            else:
+                self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a call on the worker thread and wait for its result"""
+        return self.submit(fn, *args, **kwargs).result()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the worker after the queued calls have run.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit (None waits indefinitely)
+        """
+        with self._submit_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put(None)
+        if not self.on_worker_thread:
+            self._thread.join(timeout)
+
+    @staticmethod
+    def _execute(future: Future, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._idle_interval)
+            except queue.Empty:
+                if self._idle is not None:
+                    try:
+                        self._idle()
+                    except Exception as e:
+                        logger.warning(f"Backend worker idle callback failed: {e}")
+                continue
+            if item is None:
+                return
+            self._execute(*item)
+
+
+class WorkerBackend(ChangeNotifier):
+    """
+    CalendarBackend facade running every call on a dedicated BackendWorker.
+
+    The facade is thread-safe. ``submit`` and ``acall`` expose the worker
+    queue directly, for callers that want a future or a coroutine.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], CalendarBackend],
+        idle: Optional[Callable[[], None]] = None,
+        name: str = "calendar-backend"
+    ) -> None:
+        """
+        Create the worker and the wrapped backend on it.
+
+        Args:
+            factory: Builds the wrapped backend; called on the worker thread
+            idle: Called on the worker thread between requests
+            name: Worker thread name
+        """
+        super().__init__()
+        self._thread_name = name
+        self._worker = BackendWorker(name=name, idle=idle)
+        self._handles: Set[_ThreadHandle] = set()
+        self._handles_lock = threading.Lock()
+        self._notifier = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-notify")
+        self._captured = threading.local()
+        self._backend: CalendarBackend = self._worker.call(factory)
+        self._backend.add_change_listener(self._capture_change)
+        self.name = self._backend.name
+
+    @property
+    def backend(self) -> CalendarBackend:
+        """The wrapped backend (only use it on the worker thread)"""
+        return self._backend
+
+    def _capture_change(self, change: StoreChange) -> None:
+        # Runs on the worker thread
+        captured = getattr(self._captured, "changes", None)
+        if captured is not None:
+            captured.append(change)
+        else:
+            self._notifier.submit(self._notify, change)
+
+    def _run_capturing(self, changes: List[StoreChange], fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self._captured.changes = changes
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._captured.changes = None
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue ``fn(backend, *args, **kwargs)`` on the worker thread.
+
+        Change notifications raised by the call are delivered (on the
+        notifier thread) before the returned future resolves.
+
+        Returns:
+            Future resolved with the call's result
+        """
+        changes: List[StoreChange] = []
+        result: Future = Future()
+
+        def deliver(done: Future) -> None:
+            for change in changes:
+                self._notify(change)
+            error = done.exception()
+            if error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(done.result())
+
+        inner = self._worker.submit(self._run_capturing, changes, fn, (self._backend,) + args, kwargs)
+        # Done callbacks run on the worker thread; deliver from the notifier instead
+        inner.add_done_callback(lambda done: self._notifier.submit(deliver, done))
+        return result
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(backend, *args, **kwargs)`` on the worker thread and wait for it"""
+        if self._worker.on_worker_thread:
+            return fn(self._backend, *args, **kwargs)
+        changes: List[StoreChange] = []
+        try:
+            return self._worker.call(self._run_capturing, changes, fn, (self._backend,) + args, kwargs)
+        finally:
+            # Delivered on the calling thread, which may hold store locks the worker never takes
+            for change in changes:
+                self._notify(change)
+
+    async def acall(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Await ``fn(backend, *args, **kwargs)`` run on the worker thread"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def request_access(self, timeout: float = 15.0) -> bool:
+        return self.call(lambda backend: backend.request_access(timeout))
+
+    def reset(self) -> None:
+        self.call(lambda backend: backend.reset())
+
+    def close(self) -> None:
+        """Close the wrapped backend and the fetch handles, then stop the worker and notifier threads"""
+        try:
+            self.call(lambda backend: backend.close())
+        finally:
+            with self._handles_lock:
+                handles = list(self._handles)
+            for handle in handles:
+                try:
+                    handle.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close calendar backend handle: {e}")
+            self._worker.stop()
+            self._notifier.shutdown(wait=False)
+
+    def worker_handle(self) -> CalendarBackend:
+        handle = self.call(lambda backend: backend.worker_handle())
+        # A backend sharing one handle across threads stays on this worker
+        if handle is self._backend:
+            return self
+        thread_handle = _ThreadHandle(handle, f"{self._thread_name}-fetch", self._release_handle)
+        with self._handles_lock:
+            self._handles.add(thread_handle)
+        return thread_handle
+
+    def _release_handle(self, handle: _ThreadHandle) -> None:
+        with self._handles_lock:
+            self._handles.discard(handle)
+
+    def calendars(self) -> List[CalendarInfo]:
+        return self.call(lambda backend: backend.calendars())
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        return self.call(_fetch_events, self._worker, start, end, calendar_ids, attributes)
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        return self.call(_lookup_event, self._worker, event_id)
+
+    def new_event(self, calendar_id: str) -> EventHandle:
+        return self.call(lambda backend: WorkerEvent(backend.new_event(calendar_id), self._worker))
+
+    def save_event(self, event: EventHandle, commit: bool = True) -> None:
+        def save(backend: CalendarBackend) -> None:
+            if isinstance(event, WorkerEvent):
+                backend.save_event(event._apply(), commit=commit)
+                event._reload()
+            else:
+                backend.save_event(event, commit=commit)
+        self.call(save)
+
+    def remove_event(self, event: EventHandle, commit: bool = True) -> None:
+        def remove(backend: CalendarBackend) -> None:
+            backend.remove_event(event._apply() if isinstance(event, WorkerEvent) else event, commit=commit)
+        self.call(remove)
+
+    def commit(self) -> None:
+        self.call(lambda backend: backend.commit())
@@ -0,0 +1,767 @@
+"""
+Storage backends for CalendarStore.
+
+EventKit is the production backend. The in-memory and SQLite backends mirror
+its behaviour (calendars, range predicates, lookup by identifier, save/remove
+with optional commit) so the store can be profiled and load-tested off macOS.
+"""
+import bisect
+import dataclasses
+import os
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Iterable, Protocol, Tuple, Callable, FrozenSet
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Phases of reading events: the backends time "predicate" and "fetch" (a
+# single "fetch" for the stand-ins), CalendarStore times "format"
+PHASE_SECONDS = REGISTRY.histogram(
+    "calendar_backend_phase_seconds", "Time spent per phase of backend range queries", ["phase"]
+)
+
+
+class BackendError(Exception):
+    """Exception raised when a backend operation fails."""
+    pass
+
+
+@dataclass
+class CalendarInfo:
+    """Backend-neutral description of a calendar"""
+    identifier: str
+    title: str
+    source: str = ""
+    allows_modifications: bool = True
+
+
+@dataclass
+class EventRecord:
+    """
+    Plain event record used by the stand-in backends.
+
+    Dates are stored as seconds since the Unix epoch, matching the values
+    EventKit exposes through ``timeIntervalSince1970``.
+    """
+    calendar_id: str
+    title: str = ""
+    start: Optional[float] = None
+    end: Optional[float] = None
+    location: str = ""
+    notes: str = ""
+    all_day: bool = False
+    busy: bool = True
+    last_modified: float = 0.0
+    identifier: str = ""
+
+
+@dataclass(frozen=True)
+class StoreChange:
+    """
+    Description of a change to the calendar database.
+
+    ``None`` fields mean the scope is unknown: ``calendar_ids=None`` affects
+    every calendar and ``ranges=None`` affects every date.
+    """
+    calendar_ids: Optional[FrozenSet[str]] = None
+    ranges: Optional[Tuple[Tuple[float, float], ...]] = None
+    calendars_changed: bool = False
+
+
+ChangeListener = Callable[[StoreChange], None]
+
+
+def event_span(start: Optional[float], end: Optional[float]) -> Optional[Tuple[float, float]]:
+    """
+    Return the time span to invalidate for an event.
+
+    Zero-length events are widened to one second so the span still
+    intersects the ranges that contain them.
+    """
+    if start is None:
+        return None
+    end = end if end is not None and end > start else start + 1.0
+    return (start, end)
+
+
+class ChangeNotifier:
+    """
+    Base class keeping the change listeners of a backend.
+
+    Changes made with ``commit=False`` are held back until the commit, so
+    listeners never invalidate caches for writes that may still be rolled
+    back, and a batch is delivered as a single change.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: List[ChangeListener] = []
+        self._pending_lock = threading.Lock()
+        self._pending: List[StoreChange] = []
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Register a callback invoked with a StoreChange after every change"""
+        self._listeners.append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """Unregister a change callback"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, change: StoreChange) -> None:
+        """Deliver a change to all listeners; must be called without backend locks held"""
+        for listener in list(self._listeners):
+            try:
+                listener(change)
+            except Exception as e:
+                logger.exception(f"Calendar change listener failed: {e}")
+
+    def _notify_write(self, change: StoreChange, commit: bool) -> None:
+        """Deliver a write's change now if it was committed, else hold it for ``_notify_committed``"""
+        with self._pending_lock:
+            self._pending.append(change)
+        if commit:
+            # Committing a write also commits everything staged before it
+            self._notify_committed()
+
+    def _notify_committed(self) -> None:
+        """Deliver the changes held back for staged writes as one change"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self._notify(_merge_changes(pending))
+
+    def _drop_staged_changes(self) -> List[StoreChange]:
+        """Forget the changes held back for staged writes that were rolled back"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+
+def _merge_changes(changes: Iterable[StoreChange]) -> StoreChange:
+    """Combine several changes into one covering all of their scopes"""
+    calendar_ids: Optional[set] = set()
+    ranges: Optional[List[Tuple[float, float]]] = []
+    calendars_changed = False
+    for change in changes:
+        if change.calendar_ids is None or calendar_ids is None:
+            calendar_ids = None
+        else:
+            calendar_ids.update(change.calendar_ids)
+        if change.ranges is None or ranges is None:
+            ranges = None
+        else:
+            ranges.extend(change.ranges)
+        calendars_changed = calendars_changed or change.calendars_changed
+    return StoreChange(
+        calendar_ids=frozenset(calendar_ids) if calendar_ids is not None else None,
+        ranges=tuple(ranges) if ranges is not None else None,
+        calendars_changed=calendars_changed
+    )
+
+
+def _write_change(
+    calendar_ids: Iterable[str],
+    spans: Iterable[Optional[Tuple[float, float]]]
+) -> StoreChange:
+    """Build the StoreChange for an event write"""
+    return StoreChange(
+        calendar_ids=frozenset(calendar_ids),
+        ranges=tuple(span for span in spans if span is not None)
+    )
+
+
+class EventHandle(Protocol):
+    """
+    Attribute interface shared by backend event objects.
+
+    ``EventRecord`` satisfies it directly; the EventKit backend wraps EKEvent
+    in an adapter whose properties read through the PyObjC bridge on access.
+    """
+    identifier: str
+    calendar_id: str
+    title: str
+    start: Optional[float]
+    end: Optional[float]
+    location: str
+    notes: str
+    all_day: bool
+    busy: bool
+    last_modified: float
+
+
+class CalendarBackend(Protocol):
+    """Operations CalendarStore needs from a calendar database"""
+    name: str
+
+    def request_access(self, timeout: float = 15.0) -> bool:
+        """Request access to calendar data, returning True if granted"""
+        ...
+
+    def reset(self) -> None:
+        """Drop the underlying store handle and open a fresh one, discarding uncommitted changes"""
+        ...
+
+    def close(self) -> None:
+        """Release threads, observers and connections; the backend is unusable afterwards"""
+        ...
+
+    def worker_handle(self) -> "CalendarBackend":
+        """
+        Return a backend for read queries on another thread.
+
+        Handles are read-only views of the same data without change
+        listeners; backends that are safe to share may return themselves.
+        """
+        ...
+
+    def calendars(self) -> List[CalendarInfo]:
+        """Return all event calendars"""
+        ...
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        """
+        Return events overlapping [start, end) in the given calendars (all if None).
+
+        ``attributes`` names the EventHandle attributes the caller is going to
+        read (None: any). Backends whose attribute reads are costly may read
+        just those up front; every attribute stays readable either way.
+        """
+        ...
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        """Return the event with the given identifier, or None"""
+        ...
+
+    def new_event(self, calendar_id: str) -> EventHandle:
+        """Create an unsaved event in the given calendar"""
+        ...
+
+    def save_event(self, event: EventHandle, commit: bool = True) -> None:
+        """Save an event, optionally deferring the commit (and the change notification)"""
+        ...
+
+    def remove_event(self, event: EventHandle, commit: bool = True) -> None:
+        """Remove an event, optionally deferring the commit (and the change notification)"""
+        ...
+
+    def commit(self) -> None:
+        """Commit all staged changes, then notify listeners of them"""
+        ...
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Register a callback for changes, including ones made outside this process"""
+        ...
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """Unregister a change callback"""
+        ...
+
+
+def _overlaps(record: EventRecord, start: float, end: float) -> bool:
+    """Check whether a record overlaps the half-open range [start, end)"""
+    rec_start = record.start if record.start is not None else 0.0
+    rec_end = record.end if record.end is not None else rec_start
+    return rec_start < end and rec_end > start
+
+
+class InMemoryBackend(ChangeNotifier):
+    """
+    Dictionary-backed stand-in for EventKit.
+
+    Events are kept in a start-sorted list so range predicates only visit
+    events that can overlap the window, which keeps queries fast with millions
+    of synthetic events loaded. Writes with ``commit=False`` are visible
+    right away, like EventKit's staged saves, and ``reset()`` undoes the ones
+    not yet committed.
+    """
+    name = "memory"
+
+    def __init__(self, calendars: Optional[Iterable[str]] = None, source: str = "Local") -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            calendars: Titles of calendars to create (default: a single "Calendar")
+            source: Account/source name reported for the created calendars
+        """
+        super().__init__()
+        self._lock = threading.RLock()
+        self._calendars: Dict[str, CalendarInfo] = {}
+        self._events: Dict[str, EventRecord] = {}
+        self._starts: List[Tuple[float, str]] = []
+        self._max_duration = 0.0
+        # (identifier, record before the write) for every uncommitted write
+        self._undo: List[Tuple[str, Optional[EventRecord]]] = []
+        for title in (calendars if calendars is not None else ("Calendar",)):
+            self.add_calendar(title, source=source)
+
+    def add_calendar(self, title: str, source: str = "Local") -> CalendarInfo:
+        """Create a calendar and return its description"""
+        with self._lock:
+            info = CalendarInfo(identifier=uuid.uuid4().hex.upper(), title=title, source=source)
+            self._calendars[info.identifier] = info
+        self._notify(StoreChange(calendar_ids=frozenset([info.identifier]), calendars_changed=True))
+        return dataclasses.replace(info)
+
+    def load_events(self, records: Iterable[EventRecord]) -> int:
+        """
+        Bulk-load events without per-event sorted inserts.
+
+        Every record is checked before any is stored, so a rejected load
+        leaves the backend unchanged.
+
+        Args:
+            records: Event records; missing identifiers are generated
+
+        Returns:
+            Number of events loaded
+
+        Raises:
+            BackendError: If a record names an unknown calendar
+        """
+        with self._lock:
+            loaded = []
+            for record in records:
+                if record.calendar_id not in self._calendars:
+                    raise BackendError(f"Unknown calendar '{record.calendar_id}'")
+                stored = dataclasses.replace(record)
+                if not stored.identifier:
+                    stored.identifier = uuid.uuid4().hex.upper()
+                loaded.append(stored)
+            for stored in loaded:
+                self._events[stored.identifier] = stored
+                self._max_duration = max(self._max_duration, self._duration(stored))
+            self._starts = sorted((self._start_key(r), r.identifier) for r in self._events.values())
+        touched = {stored.calendar_id for stored in loaded}
+        if touched:
+            self._notify(StoreChange(calendar_ids=frozenset(touched)))
+        return len(loaded)
+
+    def request_access(self, timeout: float = 15.0) -> bool:
+        return True
+
+    def reset(self) -> None:
+        # A fresh EKEventStore discards uncommitted changes; mirror that
+        with self._lock:
+            undo, self._undo = self._undo, []
+            for identifier, previous in reversed(undo):
+                current = self._events.pop(identifier, None)
+                if current is not None:
+                    self._unindex(current)
+                if previous is not None:
+                    self._events[identifier] = previous
+                    bisect.insort(self._starts, (self._start_key(previous), identifier))
+        staged = self._drop_staged_changes()
+        if staged:
+            # Reads made while the writes were staged may have cached them
+            self._notify(_merge_changes(staged))
+
+    def close(self) -> None:
+        pass
+
+    def worker_handle(self) -> "InMemoryBackend":
+        # Reads copy records under the lock, so sharing is safe
+        return self
+
+    def calendars(self) -> List[CalendarInfo]:
+        with self._lock:
+            return [dataclasses.replace(info) for info in self._calendars.values()]
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        wanted = set(calendar_ids) if calendar_ids is not None else None
+        with self._lock, PHASE_SECONDS.time(phase="fetch"):
+            lo = bisect.bisect_left(self._starts, (start - self._max_duration, ""))
+            hi = bisect.bisect_left(self._starts, (end, ""))
+            result = []
+            for _, event_id in self._starts[lo:hi]:
+                record = self._events[event_id]
+                if wanted is not None and record.calendar_id not in wanted:
+                    continue
+                if _overlaps(record, start, end):
+                    result.append(dataclasses.replace(record))
+            return result
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        with self._lock:
+            record = self._events.get(event_id)
+            return dataclasses.replace(record) if record else None
+
+    def new_event(self, calendar_id: str) -> EventHandle:
+        with self._lock:
+            if calendar_id not in self._calendars:
+                raise BackendError(f"Unknown calendar '{calendar_id}'")
+        return EventRecord(calendar_id=calendar_id)
+
+    def save_event(self, event: EventHandle, commit: bool = True) -> None:
+        if event.start is None or event.end is None:
+            raise BackendError("Event must have a start and end date")
+        if event.end < event.start:
+            raise BackendError("The start date must be before the end date")
+        with self._lock:
+            if event.calendar_id not in self._calendars:
+                raise BackendError(f"Unknown calendar '{event.calendar_id}'")
+            if not event.identifier:
+                event.identifier = uuid.uuid4().hex.upper()
+            event.last_modified = time.time()
+            previous = self._events.get(event.identifier)
+            if previous is not None:
+                self._unindex(previous)
+            stored = dataclasses.replace(event)
+            self._events[stored.identifier] = stored
+            bisect.insort(self._starts, (self._start_key(stored), stored.identifier))
+            self._max_duration = max(self._max_duration, self._duration(stored))
+            self._log_write(stored.identifier, previous, commit)
+        calendar_ids = [stored.calendar_id]
+        spans = [event_span(stored.start, stored.end)]
+        if previous is not None:
+            calendar_ids.append(previous.calendar_id)
+            spans.append(event_span(previous.start, previous.end))
+        self._notify_write(_write_change(calendar_ids, spans), commit)
+
+    def remove_event(self, event: EventHandle, commit: bool = True) -> None:
+        with self._lock:
+            stored = self._events.pop(event.identifier, None)
+            if stored is None:
+                raise BackendError(f"Event with ID '{event.identifier}' not found")
+            self._unindex(stored)
+            self._log_write(stored.identifier, stored, commit)
+        self._notify_write(_write_change([stored.calendar_id], [event_span(stored.start, stored.end)]), commit)
+
+    def commit(self) -> None:
+        with self._lock:
+            self._undo.clear()
+        self._notify_committed()
+
+    def _log_write(self, identifier: str, previous: Optional[EventRecord], commit: bool) -> None:
+        """Record a write for ``reset()``; a committed write commits the ones staged before it"""
+        if commit:
+            self._undo.clear()
+        else:
+            self._undo.append((identifier, previous))
+
+    def _unindex(self, record: EventRecord) -> None:
+        """Remove a record from the start-sorted list"""
+        key = (self._start_key(record), record.identifier)
+        pos = bisect.bisect_left(self._starts, key)
+        if pos < len(self._starts) and self._starts[pos] == key:
+            del self._starts[pos]
+
+    @staticmethod
+    def _start_key(record: EventRecord) -> float:
+        return record.start if record.start is not None else 0.0
+
+    @staticmethod
+    def _duration(record: EventRecord) -> float:
+        if record.start is None or record.end is None:
+            return 0.0
+        return max(0.0, record.end - record.start)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calendars (
+    identifier TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    allows_modifications INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS events (
+    identifier TEXT PRIMARY KEY,
+    calendar_id TEXT NOT NULL REFERENCES calendars(identifier),
+    title TEXT NOT NULL DEFAULT '',
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    all_day INTEGER NOT NULL DEFAULT 0,
+    busy INTEGER NOT NULL DEFAULT 1,
+    last_modified REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS events_start ON events (start_ts);
+CREATE INDEX IF NOT EXISTS events_calendar_start ON events (calendar_id, start_ts);
+"""
+
+_EVENT_COLUMNS = (
+    "identifier, calendar_id, title, start_ts, end_ts, location, notes, all_day, busy, last_modified"
+)
+
+
+class SQLiteBackend(ChangeNotifier):
+    """
+    SQLite-backed stand-in for EventKit.
+
+    ``commit=False`` leaves changes in the open transaction until ``commit()``
+    is called, which matches EventKit's staged-save behaviour.
+    """
+    name = "sqlite"
+
+    def __init__(self, path: str = ":memory:", calendars: Optional[Iterable[str]] = None) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            path: Database file path (default: in-memory database)
+            calendars: Titles of calendars to create when the database has none
+        """
+        super().__init__()
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SQLITE_SCHEMA)
+        row = self._conn.execute("SELECT MAX(end_ts - start_ts) FROM events").fetchone()
+        self._max_duration = max(0.0, row[0] or 0.0)
+        has_calendars = self._conn.execute("SELECT 1 FROM calendars LIMIT 1").fetchone()
+        if not has_calendars:
+            for title in (calendars if calendars is not None else ("Calendar",)):
+                self.add_calendar(title)
+
+    def add_calendar(self, title: str, source: str = "Local") -> CalendarInfo:
+        """Create a calendar and return its description"""
+        info = CalendarInfo(identifier=uuid.uuid4().hex.upper(), title=title, source=source)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO calendars (identifier, title, source, allows_modifications) VALUES (?, ?, ?, ?)",
+                (info.identifier, info.title, info.source, int(info.allows_modifications))
+            )
+            self._conn.commit()
+        self._notify(StoreChange(calendar_ids=frozenset([info.identifier]), calendars_changed=True))
+        return info
+
+    def load_events(self, records: Iterable[EventRecord]) -> int:
+        """
+        Bulk-load events in a single transaction.
+
+        Every record is checked before any is stored, so a rejected load
+        leaves the database unchanged.
+
+        Args:
+            records: Event records; missing identifiers are generated
+
+        Returns:
+            Number of events loaded
+
+        Raises:
+            BackendError: If a record names an unknown calendar or cannot be stored
+        """
+        calendar_ids = {info.identifier for info in self.calendars()}
+        rows = []
+        touched = set()
+        max_duration = self._max_duration
+        for record in records:
+            if record.calendar_id not in calendar_ids:
+                raise BackendError(f"Unknown calendar '{record.calendar_id}'")
+            identifier = record.identifier or uuid.uuid4().hex.upper()
+            rows.append(self._to_row(dataclasses.replace(record, identifier=identifier)))
+            touched.add(record.calendar_id)
+            if record.start is not None and record.end is not None:
+                max_duration = max(max_duration, record.end - record.start)
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO events ({_EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                raise BackendError(str(e))
+            self._max_duration = max_duration
+        if touched:
+            self._notify(StoreChange(calendar_ids=frozenset(touched)))
+        return len(rows)
+
+    def request_access(self, timeout: float = 15.0) -> bool:
+        return True
+
+    def reset(self) -> None:
+        # A fresh EKEventStore discards uncommitted changes; mirror that
+        with self._lock:
+            self._conn.rollback()
+        self._drop_staged_changes()
+        self._notify(StoreChange(calendars_changed=True))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def worker_handle(self) -> "SQLiteBackend":
+        # A second connection would not see uncommitted batch changes (and an
+        # in-memory database cannot be shared), so workers share this one
+        return self
+
+    def calendars(self) -> List[CalendarInfo]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT identifier, title, source, allows_modifications FROM calendars ORDER BY rowid"
+            ).fetchall()
+        return [CalendarInfo(identifier=r[0], title=r[1], source=r[2], allows_modifications=bool(r[3])) for r in rows]
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        query = (
+            f"SELECT {_EVENT_COLUMNS} FROM events "
+            "WHERE start_ts >= ? AND start_ts < ? AND end_ts > ?"
+        )
+        params: List[Any] = [start - self._max_duration, end, start]
+        if calendar_ids is not None:
+            if not calendar_ids:
+                return []
+            query += f" AND calendar_id IN ({', '.join('?' for _ in calendar_ids)})"
+            params.extend(calendar_ids)
+        query += " ORDER BY start_ts"
+        with self._lock, PHASE_SECONDS.time(phase="fetch"):
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_EVENT_COLUMNS} FROM events WHERE identifier = ?", (event_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def new_event(self, calendar_id: str) -> EventHandle:
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM calendars WHERE identifier = ?", (calendar_id,)
+            ).fetchone()
+        if not exists:
+            raise BackendError(f"Unknown calendar '{calendar_id}'")
+        return EventRecord(calendar_id=calendar_id)
+
+    def save_event(self, event: EventHandle, commit: bool = True) -> None:
+        if event.start is None or event.end is None:
+            raise BackendError("Event must have a start and end date")
+        if event.end < event.start:
+            raise BackendError("The start date must be before the end date")
+        if not event.identifier:
+            event.identifier = uuid.uuid4().hex.upper()
+        event.last_modified = time.time()
+        try:
+            with self._lock:
+                previous = self._conn.execute(
+                    "SELECT calendar_id, start_ts, end_ts FROM events WHERE identifier = ?", (event.identifier,)
+                ).fetchone()
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO events ({_EVENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._to_row(event)
+                )
+                self._max_duration = max(self._max_duration, event.end - event.start)
+                if commit:
+                    self._conn.commit()
+        except sqlite3.Error as e:
+            raise BackendError(str(e))
+        calendar_ids = [event.calendar_id]
+        spans = [event_span(event.start, event.end)]
+        if previous is not None:
+            calendar_ids.append(previous[0])
+            spans.append(event_span(previous[1], previous[2]))
+        self._notify_write(_write_change(calendar_ids, spans), commit)
+
+    def remove_event(self, event: EventHandle, commit: bool = True) -> None:
+        try:
+            with self._lock:
+                previous = self._conn.execute(
+                    "SELECT calendar_id, start_ts, end_ts FROM events WHERE identifier = ?", (event.identifier,)
+                ).fetchone()
+                if previous is None:
+                    raise BackendError(f"Event with ID '{event.identifier}' not found")
+                self._conn.execute("DELETE FROM events WHERE identifier = ?", (event.identifier,))
+                if commit:
+                    self._conn.commit()
+        except sqlite3.Error as e:
+            raise BackendError(str(e))
+        self._notify_write(_write_change([previous[0]], [event_span(previous[1], previous[2])]), commit)
+
+    def commit(self) -> None:
+        try:
+            with self._lock:
+                self._conn.commit()
+        except sqlite3.Error as e:
+            raise BackendError(str(e))
+        self._notify_committed()
+
+    @staticmethod
+    def _to_row(event: EventHandle) -> Tuple[Any, ...]:
+        return (
+            event.identifier, event.calendar_id, event.title or "", event.start, event.end,
+            event.location or "", event.notes or "", int(event.all_day), int(event.busy),
+            event.last_modified
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple[Any, ...]) -> EventRecord:
+        return EventRecord(
+            identifier=row[0], calendar_id=row[1], title=row[2], start=row[3], end=row[4],
+            location=row[5], notes=row[6], all_day=bool(row[7]), busy=bool(row[8]),
+            last_modified=row[9]
+        )
+
+
+def _calendar_titles_from_env() -> Optional[List[str]]:
+    """Read stand-in calendar titles from CALENDAR_BACKEND_CALENDARS"""
+    value = os.environ.get("CALENDAR_BACKEND_CALENDARS")
+    if not value:
+        return None
+    return [title.strip() for title in value.split(",") if title.strip()]
+
+
+def create_backend(name: Optional[str] = None, quiet: bool = False) -> CalendarBackend:
+    """
+    Create a calendar backend by name.
+
+    Args:
+        name: "eventkit", "memory" or "sqlite" (default from CALENDAR_BACKEND, else "eventkit")
+        quiet: If True, suppresses most console output
+
+    Returns:
+        A backend instance
+
+    Raises:
+        BackendError: If the backend name is unknown
+    """
+    backend_name = (name or os.environ.get("CALENDAR_BACKEND", "eventkit")).strip().lower()
+
+    idle = None
+    if backend_name == "eventkit":
+        # Imported lazily so the stand-in backends work without PyObjC
+        from .eventkit_backend import EventKitBackend, pump_run_loop
+        factory: Callable[[], CalendarBackend] = lambda: EventKitBackend(quiet=quiet)
+        idle = pump_run_loop
+    elif backend_name == "memory":
+        factory = lambda: InMemoryBackend(calendars=_calendar_titles_from_env())
+    elif backend_name == "sqlite":
+        path = os.environ.get("CALENDAR_SQLITE_PATH", ":memory:")
+        factory = lambda: SQLiteBackend(path, calendars=_calendar_titles_from_env())
+    else:
+        raise BackendError(f"Unknown calendar backend '{backend_name}'")
+
+    # EventKit runs on its own thread by default; the stand-ins are thread-safe already
+    default_thread = "1" if backend_name == "eventkit" else "0"
+    if os.environ.get("CALENDAR_BACKEND_THREAD", default_thread).lower() in ("0", "false", "no"):
+        return factory()
+
+    from .backend_worker import WorkerBackend
+    return WorkerBackend(factory, idle=idle)
@@ -0,0 +1,135 @@
+"""
+Calendar lookup tables for CalendarStore.
+"""
+import threading
+from typing import List, Dict, Optional, Callable
+
+from .backends import CalendarInfo
+
+# Loads tried while calendars keep changing before a listing is used uncached
+_LOAD_ATTEMPTS = 3
+
+
+class _Snapshot:
+    """Immutable lookup tables built from one calendar listing"""
+    __slots__ = ("calendars", "titles", "by_id", "by_name", "title_map")
+
+    def __init__(self, calendars: List[CalendarInfo]) -> None:
+        self.calendars = calendars
+        self.titles = [calendar.title for calendar in calendars]
+        self.by_id: Dict[str, CalendarInfo] = {calendar.identifier: calendar for calendar in calendars}
+        self.title_map: Dict[str, str] = {calendar.identifier: calendar.title for calendar in calendars}
+
+        # Calendars sharing a title (e.g. "Work" in two accounts) are ordered by
+        # account and identifier so the bare title always resolves the same way
+        groups: Dict[str, List[CalendarInfo]] = {}
+        for calendar in calendars:
+            groups.setdefault(calendar.title, []).append(calendar)
+
+        self.by_name: Dict[str, CalendarInfo] = {}
+        for title, group in groups.items():
+            group.sort(key=lambda calendar: (calendar.source, calendar.identifier))
+            self.by_name[title] = group[0]
+            if len(group) > 1:
+                # "Title (Account)" picks a specific one
+                for calendar in group:
+                    self.by_name.setdefault(f"{title} ({calendar.source})", calendar)
+
+
+class CalendarRegistry:
+    """
+    Name and identifier lookup for calendars.
+
+    The listing is loaded once and reused until ``invalidate()`` is called,
+    which CalendarStore does when the backend reports that calendars changed.
+    Lookups read an immutable snapshot, so they never take the lock.
+    Invalidation bumps a generation, and a listing is only kept if no
+    invalidation happened while it was loading.
+    """
+
+    def __init__(self, loader: Callable[[], List[CalendarInfo]]) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            loader: Callable returning the current calendar listing
+        """
+        self._loader = loader
+        # Guards the snapshot and generation; never held while loading
+        self._lock = threading.Lock()
+        # Lets one thread load at a time
+        self._load_lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Discard the tables, and any listing still loading; they are rebuilt on the next lookup"""
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def _tables(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._load_lock:
+            for _ in range(_LOAD_ATTEMPTS):
+                with self._lock:
+                    if self._snapshot is not None:
+                        return self._snapshot
+                    generation = self._generation
+                snapshot = _Snapshot(self._loader())
+                with self._lock:
+                    if self._generation == generation:
+                        self._snapshot = snapshot
+                        return snapshot
+            # Calendars kept changing: answer from the newest listing without keeping it
+            return snapshot
+
+    def get(self, name: str) -> Optional[CalendarInfo]:
+        """
+        Resolve a calendar by title, "Title (Account)" or identifier.
+
+        Args:
+            name: Calendar title, qualified title or identifier
+
+        Returns:
+            Calendar description or None if not found
+        """
+        tables = self._tables()
+        return tables.by_name.get(name) or tables.by_id.get(name)
+
+    def by_identifier(self, calendar_id: str) -> Optional[CalendarInfo]:
+        """Return the calendar with the given identifier, or None"""
+        return self._tables().by_id.get(calendar_id)
+
+    def matches(self, name: str, calendar_id: str) -> bool:
+        """
+        Check whether a calendar name refers to the given calendar.
+
+        A bare title matches every calendar with that title, so events in a
+        second same-titled calendar still validate against their title.
+        """
+        calendar = self._tables().by_id.get(calendar_id)
+        if calendar is None:
+            return False
+        if name in (calendar.title, calendar.identifier):
+            return True
+        resolved = self.get(name)
+        return resolved is not None and resolved.identifier == calendar_id
+
+    def titles(self) -> List[str]:
+        """Return calendar titles in backend order"""
+        return self._tables().titles
+
+    def identifiers(self) -> List[str]:
+        """Return calendar identifiers in backend order"""
+        return list(self._tables().title_map)
+
+    def title_map(self) -> Dict[str, str]:
+        """Return a mapping of calendar identifier to title (do not mutate)"""
+        return self._tables().title_map
+
+    def calendars(self) -> List[CalendarInfo]:
+        """Return all calendar descriptions in backend order"""
+        return list(self._tables().calendars)
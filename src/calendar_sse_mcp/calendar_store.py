@@ -1,24 +1,80 @@
 """
-EventKit-based calendar store for accessing macOS Calendar.app events.
+Calendar store for accessing macOS Calendar.app events.
+
+The store talks to a pluggable backend (see ``backends.py``): EventKit in
+production, or an in-memory/SQLite stand-in for profiling off macOS.
 """
 import os
 import subprocess
-import sys
 import time
 import datetime
+import logging
 import threading
-from typing import List, Dict, Any, Optional, Tuple
-
-from EventKit import (
-    EKCalendarEventAvailabilityBusy,
-    EKEntityTypeEvent,
-    EKEventStore,
-    EKEvent,
-    EKCalendar,
-    EKAlarm,
-    EKSpanThisEvent
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Callable, Hashable, Iterable, Iterator, TypeVar, Union
+
+import numpy as np
+
+from .backends import (
+    PHASE_SECONDS, BackendError, CalendarBackend, CalendarInfo, EventHandle, StoreChange, create_backend
+)
+from .calendar_registry import CalendarRegistry
+from .event_batch import EventBatch
+from .event_cache import EventCache
+from .event_index import EventIndex, day_span
+from .backend_worker import prefetch
+from .event_view import EVENT_FIELDS, EventView, event_attributes, normalize_fields
+from .free_busy import find_slots, free_gaps, merge_busy, overlap_pairs, parse_weekdays
+from .text_index import TextQuery, normalize_text, tokenize
+from .health import HealthMonitor
+from .logs import note_request
+from .metrics import COUNT_BUCKETS, REGISTRY
+from .response_cache import ReadScope, ResponseCache
+from .single_flight import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+# Matching strategies accepted by CalendarStore.search_events
+SEARCH_MODES = ("substring", "query")
+
+# Conflict handling accepted by CalendarStore.create_events
+CONFLICT_MODES = ("off", "report", "block")
+
+# Event fields included in conflict reports
+_CONFLICT_FIELDS = ("id", "summary", "start", "end", "calendar")
+
+# Event fields read to decide whether an event blocks time
+_BUSY_FIELDS = ("start", "end", "all_day", "availability")
+
+# Event fields matched by searches (see _search_text)
+_SEARCH_FIELDS = ("summary", "description", "location")
+
+_EVENTS_RETURNED = REGISTRY.histogram(
+    "calendar_events_returned", "Events returned per store query", ["operation"], COUNT_BUCKETS
 )
-from Foundation import NSDate, NSDefaultRunLoopMode, NSRunLoop, NSURL
+_RECOVERIES = REGISTRY.counter(
+    "calendar_store_recoveries_total", "Failed operations handed to the health monitor, by outcome", ["outcome"]
+)
+
+# Fetch rounds an indexed query tries before answering from the backend directly
+_FILL_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+
+def _search_text(view: EventView) -> Tuple[str, str, str]:
+    """Return the searchable fields of an event"""
+    return (view.get("summary") or "", view.get("description") or "", view.get("location") or "")
+
+
+def _prefetch(views: List[EventView], fields: Iterable[str]) -> None:
+    """Load the attributes behind some fields of many events in one backend round trip"""
+    prefetch((view.event for view in views), event_attributes(fields))
+
+
+def _prefetch_search_text(views: List[EventView]) -> None:
+    _prefetch(views, _SEARCH_FIELDS)
 
 
 class CalendarStoreError(Exception):
@@ -26,37 +82,196 @@ class CalendarStoreError(Exception):
     pass
 
 
+class EventConflictError(CalendarStoreError):
+    """Exception raised when a new event would overlap busy events."""
+    
+    def __init__(self, message: str, conflicts: List[Dict[str, Any]]) -> None:
+        super().__init__(message)
+        self.conflicts = conflicts
+
+
 class CalendarStore:
-    """Class to access macOS Calendar.app using EventKit."""
+    """Class to access macOS Calendar.app through a calendar backend."""
 
-    def __init__(self, quiet: bool = False, port: int = 27212) -> None:
+    def __init__(
+        self,
+        quiet: bool = False,
+        port: int = 27212,
+        backend: Optional[CalendarBackend] = None,
+        cache: Optional[bool] = None
+    ) -> None:
         """
         Initialize the calendar store.
         
         Args:
             quiet: If True, suppresses most console output
             port: Port to use for API requests (default: 27212)
+            backend: Calendar backend to use (default: chosen by CALENDAR_BACKEND, else EventKit)
+            cache: Answer range queries from an in-process event index
+                   (default: enabled unless CALENDAR_CACHE=0)
         """
-        self.event_store = EKEventStore.alloc().init()
+        self.backend = backend if backend is not None else create_backend(quiet=quiet)
+        # A backend passed in belongs to the caller, who closes it
+        self._owns_backend = backend is None
+        self.calendar_registry = CalendarRegistry(self.backend.calendars)
+        
+        if cache is None:
+            cache = os.environ.get("CALENDAR_CACHE", "1").lower() not in ("0", "false", "no")
+        self.event_index: Optional[EventIndex] = None
+        if cache:
+            self.event_index = EventIndex(
+                max_age=float(os.environ.get("CALENDAR_CACHE_TTL", "60")),
+                max_days=int(os.environ.get("CALENDAR_CACHE_MAX_DAYS") or 366) or None
+            )
+        # Formatted events by identifier, validated against their last-modified date
+        self.event_cache = EventCache(int(os.environ.get("CALENDAR_EVENT_CACHE_SIZE") or 1000) if cache else 0)
+        # Identical get_events calls running at the same time share one fetch
+        self.event_flights = SingleFlight()
+        # Serialized handler responses, dropped when the data they read changes
+        self.response_cache = ResponseCache(
+            max_size=int(os.environ.get("CALENDAR_RESPONSE_CACHE_SIZE") or 256) if cache else 0,
+            ttl=float(os.environ.get("CALENDAR_RESPONSE_CACHE_TTL") or 30)
+        )
+        self._reads = threading.local()
+            
+        # Wide range queries are split into per-calendar, per-window shards
+        # fetched in parallel, each worker thread with its own backend handle
+        self.fetch_workers = int(os.environ.get("CALENDAR_FETCH_WORKERS") or min(8, os.cpu_count() or 1))
+        self.shard_days = float(os.environ.get("CALENDAR_SHARD_DAYS", "90"))
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        self._fetch_pool_lock = threading.Lock()
+        self._worker_local = threading.local()
+        self._worker_generation = 0
+            
+        # Every backend change, local or external, bumps the counter and invalidates caches
+        self._change_count = 0
+        self._change_lock = threading.Lock()
+        self.backend.add_change_listener(self._on_store_change)
         self.authorized = False
         self.quiet = quiet
         self.port = port
         self._last_health_check = 0
         self._auth_lock = threading.RLock()
-        self.request_authorization()
+        
+        self.health = HealthMonitor(
+            probe=self.is_healthy,
+            refresh=self._refresh_store,
+            probe_interval=float(os.environ.get("CALENDAR_HEALTH_INTERVAL", "60"))
+        )
+        if self.request_authorization():
+            self.health.mark_healthy()
+        self.health.start()
         
         if not self.quiet:
-            print(f"Using server on port {self.port}", file=sys.stderr)
+            logger.info(f"Using server on port {self.port}")
+
+    @property
+    def change_count(self) -> int:
+        """Monotonically increasing number of store changes seen so far"""
+        return self._change_count
+
+    def close(self) -> None:
+        """
+        Release the store's threads and observers.
+        
+        Stops the health monitor and the shard fetch pool, detaches from the
+        backend and closes it if the store created it (which stops an
+        EventKit worker thread and removes its change observer). The store
+        is unusable afterwards.
+        """
+        self.health.stop()
+        self.backend.remove_change_listener(self._on_store_change)
+        with self._fetch_pool_lock:
+            pool, self._fetch_pool = self._fetch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if self._owns_backend:
+            try:
+                self.backend.close()
+            except Exception as e:
+                logger.warning(f"Failed to close calendar backend: {e}")
+        self.authorized = False
+
+    def _on_store_change(self, change: StoreChange) -> None:
+        """
+        Handle a change reported by the backend.
+        
+        Only the calendars and date ranges named by the change are invalidated;
+        changes of unknown scope invalidate everything.
+        
+        Args:
+            change: Description of what changed
+        """
+        with self._change_lock:
+            self._change_count += 1
+            
+        if change.calendars_changed:
+            self.calendar_registry.invalidate()
+            # Cached events and responses carry calendar titles
+            self.event_cache.clear()
+            self.response_cache.clear()
+        else:
+            self.response_cache.invalidate(change.calendar_ids, change.ranges)
+        if self.event_index is not None:
+            self.event_index.invalidate(change.calendar_ids, change.ranges)
+
+    def cached_response(
+        self,
+        key: Hashable,
+        build: Callable[[], str],
+        cacheable: Callable[[str], bool] = lambda response: True
+    ) -> str:
+        """
+        Answer a request from the response cache, building and caching it on a miss.
+        
+        While ``build`` runs, the calendars and ranges it reads through
+        ``get_events`` and ``get_event`` are recorded; a later change touching
+        any of them drops the response. A response that only reads the
+        calendar list is dropped when calendars change.
+        
+        Args:
+            key: Request key (e.g. handler name and arguments)
+            build: Produces the serialized response
+            cacheable: Decides whether a built response may be cached
+                       (e.g. to skip error responses)
+            
+        Returns:
+            Serialized response
+        """
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        generation = self._change_count
+        reads: List[ReadScope] = []
+        self._reads.scope = reads
+        try:
+            response = build()
+        finally:
+            self._reads.scope = None
+        # A change during the build may already have passed its invalidation
+        if self._change_count == generation and cacheable(response):
+            self.response_cache.put(key, response, reads)
+        return response
+
+    def _note_read(self, calendar_ids: Optional[Iterable[str]], span: Optional[Tuple[float, float]]) -> None:
+        """Record a read for the response being built on this thread, if any"""
+        reads = getattr(self._reads, "scope", None)
+        if reads is not None:
+            reads.append((frozenset(calendar_ids) if calendar_ids is not None else None, span))
 
     def is_healthy(self) -> bool:
         """
         Check if the calendar store is healthy and functional.
         
-        This performs a lightweight health check that can detect:
+        This enumerates calendars through the backend, which detects:
         - Authorization expiration
         - EventKit store staleness (e.g., after system sleep)
         - General connectivity issues
         
+        It is used as the health monitor's probe; the request path only reads
+        ``self.health.state``.
+        
         Returns:
             True if the store is healthy, False otherwise
         """
@@ -67,63 +282,74 @@ class CalendarStore:
                     return False
                 
                 # Try to access calendars - this will fail if EventKit is stale
-                calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
+                calendars = self.backend.calendars()
                 if calendars is None:
                     return False
                 
-                # Try to get calendar count to ensure we can enumerate them
-                calendar_count = len(calendars)
-                
                 # Update last health check timestamp
                 self._last_health_check = time.time()
                 
                 return True
                 
         except Exception as e:
-            if not self.quiet:
-                print(f"Health check failed: {e}", file=sys.stderr)
+            logger.warning(f"Health check failed: {e}")
             return False
 
-    def refresh_if_needed(self) -> bool:
+    def _refresh_store(self) -> bool:
         """
-        Refresh the EventKit store if it appears stale or unhealthy.
-        
-        This should be called before critical operations to ensure
-        the store is in good condition, especially after potential
-        system sleep or long idle periods.
+        Open a fresh backend store handle and request authorization again.
         
         Returns:
-            True if refresh was successful or not needed, False if failed
+            True if the store was re-authorized
         """
+        logger.warning("Calendar store appears stale, attempting refresh...")
+        
         try:
-            # Check if health check is recent (within last 30 seconds)
-            current_time = time.time()
-            if current_time - self._last_health_check < 30:
-                return True
-            
-            # Perform health check
-            if self.is_healthy():
-                return True
-            
-            if not self.quiet:
-                print("Calendar store appears stale, attempting refresh...", file=sys.stderr)
-            
-            # Try to refresh authorization
             with self._auth_lock:
                 # Reset authorization state
                 self.authorized = False
                 
-                # Create a new EventKit store
-                self.event_store = EKEventStore.alloc().init()
+                # Open a fresh backend store handle
+                self.backend.reset()
+                self._worker_generation += 1
+                self._drop_cached_data()
                 
                 # Request authorization again
                 return self.request_authorization()
                 
         except Exception as e:
-            if not self.quiet:
-                print(f"Failed to refresh calendar store: {e}", file=sys.stderr)
+            logger.error(f"Failed to refresh calendar store: {e}")
             return False
 
+    def _drop_cached_data(self) -> None:
+        """Forget everything read through the previous backend store handle"""
+        with self._change_lock:
+            # Responses being built from the old handle must not be cached
+            self._change_count += 1
+        self.calendar_registry.invalidate()
+        self.event_cache.clear()
+        self.response_cache.clear()
+        if self.event_index is not None:
+            self.event_index.clear()
+
+    def refresh_if_needed(self, reason: str = "operation failed") -> bool:
+        """
+        Recover the store after an operation failed.
+        
+        The store is marked suspect; the health monitor then probes the
+        backend and refreshes it only if the probe fails too.
+        
+        Args:
+            reason: Description of the failure, for logging
+            
+        Returns:
+            True if the store is usable afterwards, False if recovery failed
+        """
+        self.health.mark_suspect(reason)
+        recovered = self.health.ensure_healthy()
+        _RECOVERIES.inc(outcome="recovered" if recovered else "failed")
+        return recovered
+
     def request_authorization(self) -> bool:
         """
         Request access to calendars with improved error handling.
@@ -133,71 +359,39 @@ class CalendarStore:
         """
         with self._auth_lock:
             if not self.quiet:
-                print("Requesting access to your calendars...", file=sys.stderr)
-            
-            # Authorization result holder
-            result = {"authorized": False, "complete": False}
-            
-            # Define callback
-            def auth_callback(granted: bool, error: Any) -> None:
-                result["authorized"] = granted
-                result["complete"] = True
-                if error and not self.quiet:
-                    print(f"Calendar authorization error: {error}", file=sys.stderr)
+                logger.info("Requesting access to your calendars...")
             
             try:
-                # Request access to calendars
-                self.event_store.requestAccessToEntityType_completion_(EKEntityTypeEvent, auth_callback)
-                
-                # Wait for authorization callback to complete
-                timeout = 15  # Increased timeout for better reliability
-                start_time = time.time()
-                
-                while not result["complete"]:
-                    # Run the run loop for a short time to process callbacks
-                    NSRunLoop.currentRunLoop().runMode_beforeDate_(
-                        NSDefaultRunLoopMode, NSDate.dateWithTimeIntervalSinceNow_(0.1)
-                    )
-                    
-                    # Check for timeout
-                    if time.time() - start_time > timeout:
-                        if not self.quiet:
-                            print("Timed out waiting for authorization", file=sys.stderr)
-                        break
-                
-                self.authorized = result["authorized"]
+                # Request access and wait for the backend to answer
+                self.authorized = self.backend.request_access(timeout=15)
                 
                 if self.authorized:
                     self._last_health_check = time.time()
                     if not self.quiet:
-                        print("Calendar access authorized", file=sys.stderr)
-                elif not self.quiet:
-                    print("Calendar access denied", file=sys.stderr)
+                        logger.info("Calendar access authorized")
+                else:
+                    logger.warning("Calendar access denied")
                 
                 return self.authorized
                 
             except Exception as e:
-                if not self.quiet:
-                    print(f"Authorization request failed: {e}", file=sys.stderr)
+                logger.error(f"Authorization request failed: {e}")
                 self.authorized = False
                 return False
 
     def _check_authorization(self) -> None:
         """
-        Check if the store is authorized and refresh if needed.
+        Check that the store is usable.
         
-        This method now includes automatic refresh attempts before
-        raising errors, making it more resilient to temporary issues.
+        While healthy this is a single state read; probing and refreshing only
+        happen after failures, suspected sleep, or a failed background probe.
         
         Raises:
             CalendarStoreError: If not authorized to access calendars
         """
-        # Try to refresh if not authorized or unhealthy
-        if not self.authorized or not self.is_healthy():
-            if not self.refresh_if_needed():
-                if not self.quiet:
-                    print("Not authorized to access calendars", file=sys.stderr)
-                raise CalendarStoreError("Not authorized to access calendars")
+        if not self.health.ensure_healthy():
+            logger.warning("Not authorized to access calendars")
+            raise CalendarStoreError("Not authorized to access calendars")
 
     def get_all_calendars(self) -> List[str]:
         """
@@ -212,54 +406,58 @@ class CalendarStore:
         self._check_authorization()
         
         try:
-            calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
-            return [calendar.title() for calendar in calendars]
+            return list(self.calendar_registry.titles())
         except Exception as e:
             # If operation fails, try refreshing once and retry
-            if self.refresh_if_needed():
+            if self.refresh_if_needed(str(e)):
                 try:
-                    calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
-                    return [calendar.title() for calendar in calendars]
+                    return list(self.calendar_registry.titles())
                 except Exception as retry_e:
                     raise CalendarStoreError(f"Failed to get calendars after refresh: {retry_e}")
             else:
                 raise CalendarStoreError(f"Failed to get calendars: {e}")
 
-    def _get_calendar_by_name(self, calendar_name: str) -> Optional[EKCalendar]:
+    def _get_calendar_by_name(self, calendar_name: str) -> Optional[CalendarInfo]:
         """
         Get a calendar by name.
         
+        Duplicate titles resolve deterministically (by account, then
+        identifier); "Title (Account)" or the identifier selects a specific one.
+        
         Args:
             calendar_name: Name of calendar to find
             
         Returns:
-            Calendar object or None if not found
+            Calendar description or None if not found
             
         Raises:
             CalendarStoreError: If not authorized to access calendars
         """
         self._check_authorization()
-            
-        calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
-        for calendar in calendars:
-            if calendar.title() == calendar_name:
-                return calendar
-                
-        return None
+        return self.calendar_registry.get(calendar_name)
+
+    def _calendar_titles(self) -> Dict[str, str]:
+        """
+        Map calendar identifiers to titles.
+        
+        Returns:
+            Dictionary of calendar identifier to calendar title (shared, do not mutate)
+        """
+        return self.calendar_registry.title_map()
 
-    def _date_to_nsdate(self, date_str: Optional[str] = None, is_end_date: bool = False) -> NSDate:
+    def _date_to_timestamp(self, date_str: Optional[str] = None, is_end_date: bool = False) -> float:
         """
-        Convert a date string to NSDate.
+        Convert a date string to seconds since the Unix epoch.
         
         Args:
             date_str: Date string in YYYY-MM-DD format
             is_end_date: Whether this is an end date (should be set to end of day)
             
         Returns:
-            NSDate object
+            Timestamp in seconds
         """
         if not date_str:
-            return NSDate.date()
+            return time.time()
             
         try:
             # Parse 'YYYY-MM-DD' format
@@ -289,22 +487,20 @@ class CalendarStore:
                 date_format = "%Y-%m-%dT%H:%M:%S"
                 
             date_obj = datetime.datetime.strptime(date_str, date_format)
-            
-            # Convert to NSDate (seconds since reference date)
-            time_interval = date_obj.timestamp()
-            return NSDate.dateWithTimeIntervalSince1970_(time_interval)
+            return date_obj.timestamp()
         except ValueError:
             # If parsing fails, return current date
-            if not self.quiet:
-                print(f"Invalid date format: {date_str}. Using current date.", file=sys.stderr)
-            return NSDate.date()
+            logger.warning(f"Invalid date format: {date_str}. Using current date.")
+            return time.time()
 
     def get_events(
         self,
         calendar_name: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        as_batch: bool = False
+    ) -> Union[List[Dict[str, Any]], EventBatch]:
         """
         Get events from a calendar.
         
@@ -312,25 +508,56 @@ class CalendarStore:
             calendar_name: Optional name of calendar to get events from
             start_date: Optional start date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
             end_date: Optional end date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            fields: Optional subset of event fields to return (default: all);
+                    fields that are not requested are never read from the backend
+            as_batch: Return a columnar EventBatch instead of a list of
+                      dictionaries (much smaller for large result sets)
             
         Returns:
-            List of event dictionaries
+            List of event dictionaries, or an EventBatch if requested
             
         Raises:
-            CalendarStoreError: If not authorized or calendar not found
+            CalendarStoreError: If not authorized, calendar not found or a field is unknown
         """
+        try:
+            fields = normalize_fields(fields)
+        except ValueError as e:
+            raise CalendarStoreError(str(e))
+        
         self._check_authorization()
         
+        # Requests are identical if they resolve to the same second-aligned range;
+        # the change count keeps a request made after a write from joining an older fetch
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        self._note_read(self._resolve_calendar_ids(calendar_name), (start_ts, end_ts))
+        key = (calendar_name, int(start_ts), int(end_ts), fields, as_batch, self._change_count)
+        events, shared = self.event_flights.do(
+            key, lambda: self._get_events_checked(calendar_name, start_date, end_date, fields, as_batch)
+        )
+        if shared and not as_batch:
+            # Callers may modify their dictionaries
+            return [dict(event) for event in events]
+        return events
+
+    def _get_events_checked(
+        self,
+        calendar_name: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        fields: Tuple[str, ...],
+        as_batch: bool
+    ) -> Union[List[Dict[str, Any]], EventBatch]:
+        """Run _get_events_impl, refreshing the backend once on unexpected errors"""
         try:
-            return self._get_events_impl(calendar_name, start_date, end_date)
+            return self._get_events_impl(calendar_name, start_date, end_date, fields, as_batch)
         except CalendarStoreError:
             # Re-raise CalendarStoreError as-is
             raise
         except Exception as e:
             # For other exceptions, try refreshing once and retry
-            if self.refresh_if_needed():
+            if self.refresh_if_needed(str(e)):
                 try:
-                    return self._get_events_impl(calendar_name, start_date, end_date)
+                    return self._get_events_impl(calendar_name, start_date, end_date, fields, as_batch)
                 except Exception as retry_e:
                     raise CalendarStoreError(f"Failed to get events after refresh: {retry_e}")
             else:
@@ -340,8 +567,10 @@ class CalendarStore:
         self,
         calendar_name: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        end_date: Optional[str] = None,
+        fields: Tuple[str, ...] = EVENT_FIELDS,
+        as_batch: bool = False
+    ) -> Union[List[Dict[str, Any]], EventBatch]:
         """
         Internal implementation of get_events with the actual logic.
         
@@ -349,15 +578,40 @@ class CalendarStore:
             calendar_name: Optional name of calendar to get events from
             start_date: Optional start date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
             end_date: Optional end date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            fields: Normalized event fields to return
+            as_batch: Return a columnar EventBatch instead of dictionaries
             
         Returns:
-            List of event dictionaries
+            List of event dictionaries, or an EventBatch if requested
             
         Raises:
             CalendarStoreError: If calendar not found
         """
-        # Convert start date to NSDate
-        ns_start_date = self._date_to_nsdate(start_date, is_end_date=False)
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        calendar_ids = self._resolve_calendar_ids(calendar_name)
+        views = self._event_views(calendar_ids, start_ts, end_ts, fields)
+            
+        # Build only the requested fields
+        with PHASE_SECONDS.time(phase="format"):
+            if as_batch:
+                events = EventBatch.from_views(views, fields)
+            else:
+                events = [view.to_dict(fields) for view in views]
+        _EVENTS_RETURNED.observe(len(views), operation="get_events")
+        note_request(events=len(views))
+        return events
+
+    def _resolve_range(self, start_date: Optional[str], end_date: Optional[str]) -> Tuple[float, float]:
+        """
+        Convert get_events date arguments to a timestamp range.
+        
+        Without an end date the range ends 7 days after the start.
+        
+        Returns:
+            Tuple of (start timestamp, end timestamp)
+        """
+        # Convert start date to a timestamp
+        start_ts = self._date_to_timestamp(start_date, is_end_date=False)
         
         # If no end date is provided, default to 7 days from start
         if not end_date:
@@ -370,233 +624,1167 @@ class CalendarStore:
                     # Add 7 days and set to end of day
                     end_obj = date_obj + datetime.timedelta(days=7)
                     end_obj = end_obj.replace(hour=23, minute=59, second=59)
-                    # Convert to NSDate
-                    ns_end_date = NSDate.dateWithTimeIntervalSince1970_(end_obj.timestamp())
+                    end_ts = end_obj.timestamp()
                 except ValueError:
                     # Fallback to 7 days from now
                     time_interval = 7 * 24 * 60 * 60  # 7 days in seconds
-                    ns_end_date = NSDate.dateWithTimeIntervalSinceNow_(time_interval)
+                    end_ts = time.time() + time_interval
             else:
                 # 7 days from now
                 time_interval = 7 * 24 * 60 * 60  # 7 days in seconds
-                ns_end_date = NSDate.dateWithTimeIntervalSinceNow_(time_interval)
+                end_ts = time.time() + time_interval
         else:
             # Use provided end date, making sure it's set to end of day
-            ns_end_date = self._date_to_nsdate(end_date, is_end_date=True)
-            
-        # Get the specified calendar or all calendars
-        calendar_obj = None
-        if calendar_name:
-            calendar_obj = self._get_calendar_by_name(calendar_name)
-            if not calendar_obj:
-                if not self.quiet:
-                    print(f"Calendar '{calendar_name}' not found", file=sys.stderr)
-                raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
-            calendars = [calendar_obj]
-        else:
-            calendars = None  # All calendars
+            end_ts = self._date_to_timestamp(end_date, is_end_date=True)
             
-        # Create predicate for events
-        predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
-            ns_start_date, ns_end_date, calendars
-        )
-        
-        # Get events matching the predicate
-        events = self.event_store.eventsMatchingPredicate_(predicate)
+        return start_ts, end_ts
+
+    def resolve_range(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Resolve get_events date arguments to the whole-second range it reads.
+
+        Equivalent spellings of a date resolve to the same range, so callers
+        can key cached responses on it.
+
+        Args:
+            start_date: Optional start date as accepted by get_events
+            end_date: Optional end date as accepted by get_events
+
+        Returns:
+            Tuple of (start timestamp, end timestamp) in whole seconds
+        """
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        return int(start_ts), int(end_ts)
+
+    def _resolve_calendar_ids(self, calendar_name: Optional[str]) -> Optional[List[str]]:
+        """
+        Resolve an optional calendar name to backend calendar identifiers.
         
-        # Format the events as dictionaries
-        result = []
-        for event in events:
-            result.append(self._format_event(event))
+        Returns:
+            List with the calendar's identifier, or None for all calendars
             
-        return result
+        Raises:
+            CalendarStoreError: If calendar not found
+        """
+        if not calendar_name:
+            return None
+        calendar_obj = self._get_calendar_by_name(calendar_name)
+        if not calendar_obj:
+            logger.debug(f"Calendar '{calendar_name}' not found")
+            raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
+        return [calendar_obj.identifier]
 
-    def _format_event(self, event: EKEvent) -> Dict[str, Any]:
+    def iter_events(
+        self,
+        calendar_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        window_days: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Format an EKEvent as a dictionary.
+        Stream events from a calendar, one bounded time window at a time.
+        
+        Accepts the same arguments as ``get_events`` and yields the same
+        dictionaries, ordered by start (events that began before the range
+        come first). Only one window of events is held in memory, and the
+        event index is bypassed so long ranges don't fill it.
         
         Args:
-            event: The Event object to format
+            calendar_name: Optional name of calendar to get events from
+            start_date: Optional start date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            end_date: Optional end date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            fields: Optional subset of event fields to return (default: all)
+            window_days: Days fetched per backend query
+                         (default: CALENDAR_STREAM_WINDOW_DAYS or 30)
             
-        Returns:
-            Dictionary representation of the event
+        Yields:
+            Event dictionaries
+            
+        Raises:
+            CalendarStoreError: If not authorized, calendar not found or a field is unknown
         """
-        start_time = None
-        end_time = None
-        
-        if event.startDate():
-            # Convert NSDate to ISO format string
-            start_time = self._nsdate_to_iso(event.startDate())
+        try:
+            fields = normalize_fields(fields)
+        except ValueError as e:
+            raise CalendarStoreError(str(e))
+        if window_days is None:
+            window_days = float(os.environ.get("CALENDAR_STREAM_WINDOW_DAYS", "30"))
+        if window_days <= 0:
+            raise CalendarStoreError("window_days must be positive")
+        window = window_days * 24 * 60 * 60
         
-        if event.endDate():
-            end_time = self._nsdate_to_iso(event.endDate())
-            
-        # Get location, handling missing values
-        location = event.location() if event.location() else ""
+        self._check_authorization()
         
-        # Get description, handling missing values
-        description = event.notes() if event.notes() else ""
+        try:
+            start_ts, end_ts = self._resolve_range(start_date, end_date)
+            calendar_ids = self._resolve_calendar_ids(calendar_name)
+        except CalendarStoreError:
+            raise
+        except Exception as e:
+            raise CalendarStoreError(f"Failed to get events: {e}")
         
-        return {
-            "id": event.eventIdentifier(),
-            "summary": event.title(),
-            "start": start_time,
-            "end": end_time,
-            "location": location,
-            "description": description,
-            "calendar": event.calendar().title(),
-            "all_day": event.isAllDay(),
-            "availability": "busy" if event.availability() == EKCalendarEventAvailabilityBusy else "free"
-        }
-    
-    def _nsdate_to_iso(self, date: NSDate) -> str:
+        window_start = start_ts
+        while window_start < end_ts:
+            window_end = min(window_start + window, end_ts)
+            for view in self._window_events(calendar_ids, start_ts, window_start, window_end, fields):
+                yield view.to_dict(fields)
+            window_start = window_end
+
+    def _window_events(
+        self,
+        calendar_ids: Optional[List[str]],
+        range_start: float,
+        window_start: float,
+        window_end: float,
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> List[EventView]:
         """
-        Convert NSDate to ISO 8601 formatted string.
+        Fetch the events that ``iter_events`` yields for one window.
+        
+        An event belongs to the window containing its effective start (its
+        start, clamped to the range start), so events spanning several
+        windows are yielded once. Only ``fields`` are read up front.
         
-        Args:
-            date: NSDate object to convert
-            
         Returns:
-            ISO 8601 formatted date string
+            Event views ordered by effective start and identifier
         """
-        time_interval = date.timeIntervalSince1970()
-        dt = datetime.datetime.fromtimestamp(time_interval)
-        return dt.strftime("%Y-%m-%dT%H:%M:%S")
+        def fetch() -> List[EventView]:
+            calendar_titles = self._calendar_titles()
+            keyed = []
+            attributes = event_attributes(fields)
+            for event in self.backend.events_in_range(window_start, window_end, calendar_ids, attributes):
+                view = EventView(event, calendar_titles)
+                effective_start = range_start if view.start is None else max(view.start, range_start)
+                if effective_start >= window_start:
+                    keyed.append((effective_start, view.identifier, view))
+            keyed.sort(key=lambda item: (item[0], item[1]))
+            return [view for _, _, view in keyed]
         
-    def _parse_iso_date(self, date_str: str) -> Tuple[NSDate, bool]:
+        try:
+            return fetch()
+        except Exception as e:
+            # Try refreshing once and retry the window
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return fetch()
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to get events after refresh: {retry_e}")
+            raise CalendarStoreError(f"Failed to get events: {e}")
+
+    def search_events(
+        self,
+        query: str,
+        calendar_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        mode: str = "substring"
+    ) -> List[Dict[str, Any]]:
         """
-        Parse ISO 8601 date string to NSDate.
+        Search events by summary, description and location.
         
         Args:
-            date_str: Date string in format "yyyy-MM-dd" or "yyyy-MM-ddTHH:mm:ss"
+            query: Text to search for (an empty query matches every event)
+            calendar_name: Optional name of calendar to search in
+            start_date: Optional start date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            end_date: Optional end date in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            fields: Optional subset of event fields to return (default: all)
+            mode: "substring" for a substring match (NFKC-normalized and
+                  case-folded, answered from the trigram index), or "query"
+                  for words, "quoted phrases" and OR (see ``text_index.py``),
+                  answered from the token index
             
         Returns:
-            Tuple of (NSDate object, success)
+            List of matching event dictionaries ordered by start date
             
         Raises:
-            ValueError: If date string is not in the correct format
+            CalendarStoreError: If not authorized, calendar not found, or a field or mode is unknown
         """
         try:
-            # Check which format we're dealing with
-            if "T" in date_str:
-                # Has time component
-                if ":" in date_str:
-                    # Has hours and minutes
-                    if date_str.count(":") == 1:
-                        # Only hours and minutes, add seconds
-                        date_str = f"{date_str}:00"
-                    date_format = "%Y-%m-%dT%H:%M:%S"
-                else:
-                    # Just the T separator, add time
-                    date_str = f"{date_str}00:00:00"
-                    date_format = "%Y-%m-%dT%H:%M:%S"
+            fields = normalize_fields(fields)
+        except ValueError as e:
+            raise CalendarStoreError(str(e))
+        if mode not in SEARCH_MODES:
+            raise CalendarStoreError(f"Unknown search mode '{mode}' (available: {', '.join(SEARCH_MODES)})")
+        
+        self._check_authorization()
+        
+        try:
+            return self._search_events_impl(query, calendar_name, start_date, end_date, fields, mode)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return self._search_events_impl(query, calendar_name, start_date, end_date, fields, mode)
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to search events after refresh: {retry_e}")
             else:
-                # Only date, no time - use beginning of day
-                date_str = f"{date_str}T00:00:00"
-                date_format = "%Y-%m-%dT%H:%M:%S"
+                raise CalendarStoreError(f"Failed to search events: {e}")
+
+    def _search_events_impl(
+        self,
+        query: str,
+        calendar_name: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        fields: Tuple[str, ...],
+        mode: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Internal implementation of search_events.
+        """
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        calendar_ids = self._resolve_calendar_ids(calendar_name)
+        
+        views = None
+        if self.event_index is not None:
+            views = self._search_indexed(query, mode, calendar_ids, start_ts, end_ts)
+        if views is None and mode == "query":
+            text_query = TextQuery.parse(query)
+            views = [
+                view for view in self._fetched_views(calendar_ids, start_ts, end_ts, _SEARCH_FIELDS)
+                if text_query.matches(tokenize(text) for text in _search_text(view))
+            ]
+        elif views is None:
+            views = self._fetched_views(calendar_ids, start_ts, end_ts, _SEARCH_FIELDS)
+            needle = normalize_text(query)
+            if needle:
+                views = [
+                    view for view in views
+                    if any(needle in normalize_text(text) for text in _search_text(view))
+                ]
                 
-            # Parse the appropriately formatted date
-            dt = datetime.datetime.strptime(date_str, date_format)
+        with PHASE_SECONDS.time(phase="format"):
+            _prefetch(views, fields)
+            events = [view.to_dict(fields) for view in views]
+        _EVENTS_RETURNED.observe(len(events), operation="search_events")
+        note_request(events=len(events))
+        return events
+
+    def _search_indexed(
+        self,
+        query: str,
+        mode: str,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float
+    ) -> Optional[List[EventView]]:
+        """
+        Answer a search from the event index's posting lists.
+        
+        Token queries use the token index; substring searches use the
+        trigram index as candidate generator.
+        
+        Args:
+            query: Search text
+            mode: "substring" or "query"
+            calendar_ids: Calendars to search (None for all calendars)
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
             
-            # Convert to NSDate
-            ns_date = NSDate.dateWithTimeIntervalSince1970_(dt.timestamp())
-            return ns_date, True
-        except ValueError as e:
-            if not self.quiet:
-                print(f"Invalid date format: {date_str} - {e}", file=sys.stderr)
-            raise ValueError(f"Invalid date format: {date_str} - {e}")
+        Returns:
+            Matching event views ordered by start date, or None if the index
+            could not be filled (see ``_read_index``)
+        """
+        calendar_titles = self._calendar_titles()
+        if calendar_ids is None:
+            calendar_ids = list(calendar_titles)
+        text_query = TextQuery.parse(query) if mode == "query" else None
+            
+        def search(index: EventIndex) -> List[Tuple[float, float, EventView]]:
+            matches: List[Tuple[float, float, EventView]] = []
+            for calendar_id in calendar_ids:
+                calendar_index = index.calendar(calendar_id)
+                if text_query is not None:
+                    found = calendar_index.search(text_query, start_ts, end_ts, _search_text, _prefetch_search_text)
+                else:
+                    found = calendar_index.search_substring(
+                        query, start_ts, end_ts, _search_text, _prefetch_search_text
+                    )
+                matches.extend(found)
+            return matches
+            
+        matches = self._read_index(calendar_ids, start_ts, end_ts, calendar_titles, search, _SEARCH_FIELDS)
+        if matches is None:
+            return None
+        if len(calendar_ids) > 1:
+            matches.sort(key=lambda item: (item[0], item[2].identifier))
+            
+        return [view for _, _, view in matches]
 
-    def create_event(
+    def get_free_busy(
         self,
-        calendar_name: str,
-        summary: str,
-        start_date: str,
-        end_date: str,
-        location: Optional[str] = None,
-        description: Optional[str] = None
-    ) -> str:
+        calendar_names: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        include_all_day: bool = False
+    ) -> Dict[str, Any]:
         """
-        Create a new event in Calendar.app.
+        Compute merged busy blocks and free gaps across calendars.
+        
+        Events marked free do not block time. All-day events (holidays,
+        birthdays, out-of-office markers) are ignored unless requested.
         
         Args:
-            calendar_name: Name of the calendar to create the event in
-            summary: Event title
-            start_date: Start date in format "yyyy-MM-ddTHH:mm:ss"
-            end_date: End date in format "yyyy-MM-ddTHH:mm:ss" 
-            location: (Optional) Event location
-            description: (Optional) Event description
+            calendar_names: Calendars to combine (default: all calendars)
+            start_date: Window start in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            end_date: Window end in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            include_all_day: Count busy all-day events as busy time
             
         Returns:
-            ID of the created event
+            Dictionary with the window, whether it is entirely free, and
+            lists of busy and free {"start", "end"} blocks
             
         Raises:
-            CalendarStoreError: If creation fails for any reason
+            CalendarStoreError: If not authorized or a calendar is not found
         """
         self._check_authorization()
         
         try:
-            return self._create_event_impl(calendar_name, summary, start_date, end_date, location, description)
+            return self._get_free_busy_impl(calendar_names, start_date, end_date, include_all_day)
         except CalendarStoreError:
             # Re-raise CalendarStoreError as-is
             raise
         except Exception as e:
             # For other exceptions, try refreshing once and retry
-            if self.refresh_if_needed():
+            if self.refresh_if_needed(str(e)):
                 try:
-                    return self._create_event_impl(calendar_name, summary, start_date, end_date, location, description)
+                    return self._get_free_busy_impl(calendar_names, start_date, end_date, include_all_day)
                 except Exception as retry_e:
-                    raise CalendarStoreError(f"Failed to create event after refresh: {retry_e}")
+                    raise CalendarStoreError(f"Failed to get free/busy after refresh: {retry_e}")
             else:
-                raise CalendarStoreError(f"Failed to create event: {e}")
+                raise CalendarStoreError(f"Failed to get free/busy: {e}")
 
-    def _create_event_impl(
+    def _get_free_busy_impl(
+        self,
+        calendar_names: Optional[List[str]],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        include_all_day: bool
+    ) -> Dict[str, Any]:
+        """
+        Internal implementation of get_free_busy.
+        """
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        calendar_ids, calendar_names = self._resolve_calendar_list(calendar_names)
+        
+        block_starts, block_ends = self._busy_blocks(calendar_ids, start_ts, end_ts, include_all_day)
+        gap_starts, gap_ends = free_gaps(block_starts, block_ends, start_ts, end_ts)
+        
+        return {
+            "start": self._timestamp_to_iso(start_ts),
+            "end": self._timestamp_to_iso(end_ts),
+            "calendars": calendar_names,
+            "free": block_starts.size == 0,
+            "busy": [
+                {"start": self._timestamp_to_iso(s), "end": self._timestamp_to_iso(e)}
+                for s, e in zip(block_starts.tolist(), block_ends.tolist())
+            ],
+            "free_slots": [
+                {"start": self._timestamp_to_iso(s), "end": self._timestamp_to_iso(e)}
+                for s, e in zip(gap_starts.tolist(), gap_ends.tolist())
+            ]
+        }
+
+    def find_available_slots(
+        self,
+        duration_minutes: int,
+        calendar_names: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        working_hours_start: str = "09:00",
+        working_hours_end: str = "17:00",
+        buffer_minutes: int = 0,
+        days: Optional[List[str]] = None,
+        preferred_days: Optional[List[str]] = None,
+        max_results: int = 5,
+        include_all_day: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Find free meeting slots common to several calendars.
+        
+        Each calendar is fetched once for the whole window. Slots start on
+        15-minute boundaries and do not overlap each other.
+        
+        Args:
+            duration_minutes: Length of the meeting
+            calendar_names: Calendars that must all be free (default: all calendars)
+            start_date: Earliest slot start in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            end_date: Latest slot end in format 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM:SS'
+            working_hours_start: Start of the working day as 'HH:MM'
+            working_hours_end: End of the working day as 'HH:MM'
+            buffer_minutes: Free time required before and after existing events
+            days: Weekdays slots may fall on (default: Monday to Friday)
+            preferred_days: Weekdays whose slots are listed first
+            max_results: Maximum number of slots to return
+            include_all_day: Count busy all-day events as busy time
+            
+        Returns:
+            Dictionary with the window, the calendars and the list of
+            {"start", "end"} slots
+            
+        Raises:
+            CalendarStoreError: If not authorized, a calendar is not found or a constraint is invalid
+        """
+        self._check_authorization()
+        
+        args = (
+            duration_minutes, calendar_names, start_date, end_date, working_hours_start, working_hours_end,
+            buffer_minutes, days, preferred_days, max_results, include_all_day
+        )
+        try:
+            return self._find_available_slots_impl(*args)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except ValueError as e:
+            raise CalendarStoreError(f"Invalid slot constraints: {e}")
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return self._find_available_slots_impl(*args)
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to find available slots after refresh: {retry_e}")
+            else:
+                raise CalendarStoreError(f"Failed to find available slots: {e}")
+
+    def _find_available_slots_impl(
+        self,
+        duration_minutes: int,
+        calendar_names: Optional[List[str]],
+        start_date: Optional[str],
+        end_date: Optional[str],
+        working_hours_start: str,
+        working_hours_end: str,
+        buffer_minutes: int,
+        days: Optional[List[str]],
+        preferred_days: Optional[List[str]],
+        max_results: int,
+        include_all_day: bool
+    ) -> Dict[str, Any]:
+        """
+        Internal implementation of find_available_slots.
+        """
+        if duration_minutes <= 0:
+            raise ValueError("duration_minutes must be positive")
+        if buffer_minutes < 0:
+            raise ValueError("buffer_minutes cannot be negative")
+        work_start = datetime.datetime.strptime(working_hours_start, "%H:%M").time()
+        work_end = datetime.datetime.strptime(working_hours_end, "%H:%M").time()
+        if work_end <= work_start:
+            raise ValueError("working_hours_end must be after working_hours_start")
+        weekdays = parse_weekdays(days) if days else set(range(5))
+        preferred = parse_weekdays(preferred_days) if preferred_days else None
+        
+        start_ts, end_ts = self._resolve_range(start_date, end_date)
+        calendar_ids, calendar_names = self._resolve_calendar_list(calendar_names)
+        
+        # Events just outside the window still need their buffer
+        buffer = buffer_minutes * 60
+        block_starts, block_ends = self._busy_blocks(
+            calendar_ids, start_ts - buffer, end_ts + buffer, include_all_day
+        )
+        slots = find_slots(
+            block_starts, block_ends, start_ts, end_ts, duration_minutes, work_start, work_end, weekdays,
+            buffer_minutes=buffer_minutes, preferred_days=preferred, limit=max_results
+        )
+        
+        return {
+            "start": self._timestamp_to_iso(start_ts),
+            "end": self._timestamp_to_iso(end_ts),
+            "calendars": calendar_names,
+            "duration_minutes": duration_minutes,
+            "slots": [
+                {"start": self._timestamp_to_iso(s), "end": self._timestamp_to_iso(e)}
+                for s, e in slots
+            ],
+            "count": len(slots)
+        }
+
+    def _resolve_calendar_list(self, calendar_names: Optional[List[str]]) -> Tuple[Optional[List[str]], List[str]]:
+        """
+        Resolve a list of calendar names for multi-calendar queries.
+        
+        Returns:
+            Tuple of (calendar identifiers or None for all calendars, calendar names)
+            
+        Raises:
+            CalendarStoreError: If a calendar is not found
+        """
+        if not calendar_names:
+            return None, self.get_all_calendars()
+        calendar_ids = []
+        for name in calendar_names:
+            calendar_ids.extend(self._resolve_calendar_ids(name))
+        return calendar_ids, list(calendar_names)
+
+    def _busy_blocks(
+        self,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float,
+        include_all_day: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merge the busy events of some calendars into blocks within a range.
+        
+        Only the dates and the availability and all-day flags are read from
+        each event.
+        
+        Returns:
+            (block_starts, block_ends) as epoch-second arrays
+        """
+        busy = [
+            (view.start, view.end)
+            for view in self._event_views(calendar_ids, start_ts, end_ts, _BUSY_FIELDS)
+            if view.start is not None and view.end is not None
+            and view.get("availability") == "busy"
+            and (include_all_day or not view.get("all_day"))
+        ]
+        starts = np.fromiter((start for start, _ in busy), dtype=np.float64, count=len(busy))
+        ends = np.fromiter((end for _, end in busy), dtype=np.float64, count=len(busy))
+        return merge_busy(starts, ends, start_ts, end_ts)
+
+    def _event_views(
+        self,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float,
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> List[EventView]:
+        """
+        Get views of the events overlapping a range, from the index if enabled.
+        
+        Args:
+            calendar_ids: Calendars to query (None for all calendars)
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
+            fields: Event fields the caller will read; events fetched for
+                    this call read these up front and others on first use
+            
+        Returns:
+            Event views
+        """
+        views = None
+        if self.event_index is not None:
+            views = self._get_indexed_events(calendar_ids, start_ts, end_ts, fields)
+        if views is None:
+            views = self._fetched_views(calendar_ids, start_ts, end_ts, fields)
+        # Indexed events may have been fetched for other fields
+        _prefetch(views, fields)
+        return views
+
+    def _fetched_views(
+        self,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float,
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> List[EventView]:
+        """Get views of the events overlapping a range straight from the backend"""
+        calendar_titles = self._calendar_titles()
+        return [
+            EventView(event, calendar_titles)
+            for event in self._fetch_range(start_ts, end_ts, calendar_ids, fields)
+        ]
+
+    def _get_indexed_events(
+        self,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float,
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> Optional[List[EventView]]:
+        """
+        Answer a range query from the event index, fetching only uncovered gaps.
+        
+        The index stores lazy views, so fields materialized for one query are
+        reused by later ones and fields nobody asked for are never read.
+        
+        Args:
+            calendar_ids: Calendars to query (None for all calendars)
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
+            
+        Returns:
+            Event views ordered by start date, or None if the index could not
+            be filled (see ``_read_index``)
+        """
+        calendar_titles = self._calendar_titles()
+        if calendar_ids is None:
+            calendar_ids = list(calendar_titles)
+            
+        def overlapping(index: EventIndex) -> List[Tuple[float, float, EventView]]:
+            matches: List[Tuple[float, float, EventView]] = []
+            for calendar_id in calendar_ids:
+                matches.extend(index.calendar(calendar_id).events.overlap_items(start_ts, end_ts))
+            return matches
+            
+        matches = self._read_index(calendar_ids, start_ts, end_ts, calendar_titles, overlapping, fields)
+        if matches is None:
+            return None
+        if len(calendar_ids) > 1:
+            matches.sort(key=lambda item: (item[0], item[2].identifier))
+            
+        return [view for _, _, view in matches]
+
+    def _read_index(
+        self,
+        calendar_ids: List[str],
+        start_ts: float,
+        end_ts: float,
+        calendar_titles: Dict[str, str],
+        read: Callable[[EventIndex], T],
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> Optional[T]:
+        """
+        Run ``read`` under the index lock once a range is covered.
+        
+        Uncovered gaps are fetched without the lock, so a slow backend query
+        only delays requests waiting for that data; everything else, including
+        reads the index already covers, proceeds. Fetched events are stored,
+        and read, in one lock hold, unless a store change invalidated their
+        calendar while they were fetched.
+        
+        Args:
+            calendar_ids: Calendars to cover
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
+            calendar_titles: Mapping of calendar identifier to title
+            read: Called with the index while the range is covered
+            fields: Event fields read up front from fetched events
+            
+        Returns:
+            What ``read`` returned, or None if the calendars kept changing
+            during every fetch attempt
+        """
+        index = self.event_index
+        for _ in range(_FILL_ATTEMPTS):
+            with index.lock:
+                pending = self._plan_fill(calendar_ids, start_ts, end_ts)
+                if not pending:
+                    return read(index)
+                generations = {
+                    calendar_id: index.generation(calendar_id)
+                    for group in pending.values() for calendar_id in group
+                }
+            fetched = self._fetch_gaps(pending, calendar_titles, fields)
+            with index.lock:
+                stored = [
+                    index.add_range(calendar_id, generations[calendar_id], gap_start, gap_end, entries)
+                    for calendar_id, gap_start, gap_end, entries in fetched
+                ]
+                if all(stored):
+                    return read(index)
+        return None
+
+    def _plan_fill(
+        self,
+        calendar_ids: List[str],
+        start_ts: float,
+        end_ts: float
+    ) -> Dict[Tuple[Tuple[float, float], ...], List[str]]:
+        """
+        Find the parts of a range the event index doesn't cover yet.
+        
+        The range is widened to whole local days first, so later queries
+        shifted within the same days (e.g. windows starting "now") need no
+        fetch. Days used by this query are refreshed in each calendar's LRU
+        order before older days are trimmed.
+        
+        Must be called with the index lock held.
+        
+        Args:
+            calendar_ids: Calendars to cover
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
+            
+        Returns:
+            Calendars grouped by their uncovered gaps, so one backend call serves a group
+        """
+        index = self.event_index
+        pending: Dict[Tuple[Tuple[float, float], ...], List[str]] = {}
+        fill_start, fill_end = day_span(start_ts, end_ts)
+        for calendar_id in calendar_ids:
+            calendar_index = index.calendar(calendar_id)
+            calendar_index.touch(fill_start, fill_end)
+            calendar_index.trim()
+            gaps = calendar_index.missing(fill_start, fill_end, index.max_age)
+            if gaps:
+                pending.setdefault(tuple(gaps), []).append(calendar_id)
+        return pending
+
+    def _fetch_gaps(
+        self,
+        pending: Dict[Tuple[Tuple[float, float], ...], List[str]],
+        calendar_titles: Dict[str, str],
+        fields: Tuple[str, ...]
+    ) -> List[Tuple[str, float, float, List[Tuple[Any, float, float, EventView]]]]:
+        """
+        Fetch the gaps found by ``_plan_fill`` (without the index lock).
+        
+        Returns:
+            (calendar id, gap start, gap end, index entries) for every calendar and gap
+        """
+        fetched = []
+        for gaps, group in pending.items():
+            for gap_start, gap_end in gaps:
+                entries: Dict[str, List[Tuple[Any, float, float, EventView]]] = {
+                    calendar_id: [] for calendar_id in group
+                }
+                for event in self._fetch_range(gap_start, gap_end, group, fields):
+                    view = EventView(event, calendar_titles)
+                    ev_start = view.start if view.start is not None else gap_start
+                    ev_end = view.end if view.end is not None else ev_start
+                    # Recurring occurrences share an identifier, so key on the start too
+                    key = (view.identifier, ev_start)
+                    entries.setdefault(view.calendar_id, []).append((key, ev_start, ev_end, view))
+                fetched.extend((calendar_id, gap_start, gap_end, entries[calendar_id]) for calendar_id in group)
+        return fetched
+
+    def _fetch_range(
+        self,
+        start_ts: float,
+        end_ts: float,
+        calendar_ids: Optional[List[str]],
+        fields: Tuple[str, ...] = EVENT_FIELDS
+    ) -> List[EventHandle]:
+        """
+        Fetch events overlapping [start_ts, end_ts) from the backend.
+        
+        Ranges longer than ``shard_days`` are split into one shard per
+        calendar and window, fetched on the worker pool. Events spanning
+        window boundaries are returned once.
+        
+        Args:
+            start_ts: Range start timestamp
+            end_ts: Range end timestamp
+            calendar_ids: Calendars to query (None for all calendars)
+            fields: Event fields the backend may read up front
+            
+        Returns:
+            Events ordered by start date (unordered if the range was not sharded)
+        """
+        attributes = event_attributes(fields)
+        shard = self.shard_days * 24 * 60 * 60
+        if self.fetch_workers <= 1 or shard <= 0 or end_ts - start_ts <= shard:
+            return self.backend.events_in_range(start_ts, end_ts, calendar_ids, attributes)
+            
+        if calendar_ids is None:
+            calendar_ids = self.calendar_registry.identifiers()
+        shards = []
+        window_start = start_ts
+        while window_start < end_ts:
+            window_end = min(window_start + shard, end_ts)
+            shards.extend((calendar_id, window_start, window_end, attributes) for calendar_id in calendar_ids)
+            window_start = window_end
+            
+        seen = set()
+        merged = []
+        for fetched in self._get_fetch_pool().map(self._fetch_shard, shards):
+            for key, event in fetched:
+                if key not in seen:
+                    seen.add(key)
+                    merged.append((key, event))
+        merged.sort(key=lambda item: (item[0][2] if item[0][2] is not None else start_ts, item[0][1]))
+        return [event for _, event in merged]
+
+    def _fetch_shard(
+        self,
+        shard: Tuple[str, float, float, Iterable[str]]
+    ) -> List[Tuple[Tuple[str, str, Optional[float]], EventHandle]]:
+        """
+        Fetch one calendar window on a worker thread.
+        
+        Dedupe keys are read here so the bridge calls happen in parallel.
+        
+        Returns:
+            ((calendar id, event id, start), event) pairs
+        """
+        calendar_id, window_start, window_end, attributes = shard
+        events = self._worker_backend().events_in_range(window_start, window_end, [calendar_id], attributes)
+        return [((calendar_id, event.identifier, event.start), event) for event in events]
+
+    def _worker_backend(self) -> CalendarBackend:
+        """Return this thread's backend handle, opening one if needed"""
+        local = self._worker_local
+        if getattr(local, "generation", None) != self._worker_generation:
+            stale = getattr(local, "backend", None)
+            local.backend = self.backend.worker_handle()
+            local.generation = self._worker_generation
+            if stale is not None and stale is not self.backend and stale is not local.backend:
+                # A separate handle from before a reset (it may own a thread)
+                try:
+                    stale.close()
+                except Exception as e:
+                    logger.warning(f"Failed to close calendar backend handle: {e}")
+        return local.backend
+
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        """Create the shard worker pool on first use"""
+        if self._fetch_pool is None:
+            with self._fetch_pool_lock:
+                if self._fetch_pool is None:
+                    self._fetch_pool = ThreadPoolExecutor(
+                        max_workers=self.fetch_workers,
+                        thread_name_prefix="calendar-fetch"
+                    )
+        return self._fetch_pool
+
+    def _timestamp_to_iso(self, timestamp: float) -> str:
+        """
+        Convert a Unix timestamp to ISO 8601 formatted string.
+        
+        Args:
+            timestamp: Seconds since the Unix epoch
+            
+        Returns:
+            ISO 8601 formatted date string
+        """
+        dt = datetime.datetime.fromtimestamp(timestamp)
+        return dt.strftime("%Y-%m-%dT%H:%M:%S")
+        
+    def _parse_iso_date(self, date_str: str) -> Tuple[float, bool]:
+        """
+        Parse ISO 8601 date string to a Unix timestamp.
+        
+        Args:
+            date_str: Date string in format "yyyy-MM-dd" or "yyyy-MM-ddTHH:mm:ss"
+            
+        Returns:
+            Tuple of (timestamp, success)
+            
+        Raises:
+            ValueError: If date string is not in the correct format
+        """
+        try:
+            # Check which format we're dealing with
+            if "T" in date_str:
+                # Has time component
+                if ":" in date_str:
+                    # Has hours and minutes
+                    if date_str.count(":") == 1:
+                        # Only hours and minutes, add seconds
+                        date_str = f"{date_str}:00"
+                    date_format = "%Y-%m-%dT%H:%M:%S"
+                else:
+                    # Just the T separator, add time
+                    date_str = f"{date_str}00:00:00"
+                    date_format = "%Y-%m-%dT%H:%M:%S"
+            else:
+                # Only date, no time - use beginning of day
+                date_str = f"{date_str}T00:00:00"
+                date_format = "%Y-%m-%dT%H:%M:%S"
+                
+            # Parse the appropriately formatted date
+            dt = datetime.datetime.strptime(date_str, date_format)
+            
+            return dt.timestamp(), True
+        except ValueError as e:
+            logger.warning(f"Invalid date format: {date_str} - {e}")
+            raise ValueError(f"Invalid date format: {date_str} - {e}")
+
+    def create_event(
         self,
         calendar_name: str,
         summary: str,
         start_date: str,
         end_date: str,
         location: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        check_conflicts: bool = False
+    ) -> str:
+        """
+        Create a new event in Calendar.app.
+        
+        Args:
+            calendar_name: Name of the calendar to create the event in
+            summary: Event title
+            start_date: Start date in format "yyyy-MM-ddTHH:mm:ss"
+            end_date: End date in format "yyyy-MM-ddTHH:mm:ss" 
+            location: (Optional) Event location
+            description: (Optional) Event description
+            check_conflicts: (Optional) Refuse to create the event if it overlaps busy events
+            
+        Returns:
+            ID of the created event
+            
+        Raises:
+            EventConflictError: If check_conflicts is set and the event overlaps busy events
+            CalendarStoreError: If creation fails for any reason
+        """
+        self._check_authorization()
+        
+        args = (calendar_name, summary, start_date, end_date, location, description, check_conflicts)
+        try:
+            return self._create_event_impl(*args)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return self._create_event_impl(*args)
+                except CalendarStoreError:
+                    raise
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to create event after refresh: {retry_e}")
+            else:
+                raise CalendarStoreError(f"Failed to create event: {e}")
+
+    def _create_event_impl(
+        self,
+        calendar_name: str,
+        summary: str,
+        start_date: str,
+        end_date: str,
+        location: Optional[str] = None,
+        description: Optional[str] = None,
+        check_conflicts: bool = False
     ) -> str:
         """
         Internal implementation of create_event.
         """
+        if check_conflicts:
+            conflicts = self._find_conflicts_impl(start_date, end_date)
+            if conflicts:
+                names = ", ".join(f"'{conflict['summary']}'" for conflict in conflicts[:3])
+                more = f" and {len(conflicts) - 3} more" if len(conflicts) > 3 else ""
+                raise EventConflictError(f"Event overlaps {len(conflicts)} busy event(s): {names}{more}", conflicts)
+        event = self._stage_create(calendar_name, summary, start_date, end_date, location, description)
+        return event.identifier
+
+    def find_conflicts(
+        self,
+        start_date: str,
+        end_date: str,
+        calendar_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find busy events overlapping a proposed time range.
+        
+        Events marked free and all-day events never conflict, and events that
+        only touch the range (ending when it starts) do not overlap it.
+        
+        Args:
+            start_date: Start date in format "yyyy-MM-ddTHH:mm:ss"
+            end_date: End date in format "yyyy-MM-ddTHH:mm:ss"
+            calendar_names: (Optional) Calendars to check (default: all calendars)
+            
+        Returns:
+            Conflicting events (id, summary, start, end, calendar) in start order
+            
+        Raises:
+            CalendarStoreError: If not authorized, a calendar is not found or a date is invalid
+        """
+        self._check_authorization()
+        
+        try:
+            return self._find_conflicts_impl(start_date, end_date, calendar_names)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return self._find_conflicts_impl(start_date, end_date, calendar_names)
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to check conflicts after refresh: {retry_e}")
+            else:
+                raise CalendarStoreError(f"Failed to check conflicts: {e}")
+
+    def _find_conflicts_impl(
+        self,
+        start_date: str,
+        end_date: str,
+        calendar_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Internal implementation of find_conflicts.
+        """
+        try:
+            start_ts, _ = self._parse_iso_date(start_date)
+            end_ts, _ = self._parse_iso_date(end_date)
+        except ValueError as e:
+            raise CalendarStoreError(str(e))
+        calendar_ids, _ = self._resolve_calendar_list(calendar_names)
+        
+        return [
+            view.to_dict(_CONFLICT_FIELDS)
+            for view in self._blocking_views(calendar_ids, start_ts, end_ts)
+            if view.start < end_ts and view.end > start_ts
+        ]
+
+    def check_conflicts(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Check proposed events against existing events and against each other.
+        
+        All events are compared in one sweep over their start times, after a
+        single range query covering the whole batch.
+        
+        Args:
+            events: Event specifications with start_date and end_date
+                    (other keys of ``create_event`` are allowed and ignored)
+            
+        Returns:
+            One result per input, in order: {"index", "conflicts"}, where a
+            conflict with another proposed event is {"index", "summary",
+            "start", "end", "calendar"}; {"index", "error"} for items whose
+            dates are missing or invalid
+            
+        Raises:
+            CalendarStoreError: If not authorized to access calendars
+        """
+        self._check_authorization()
+        
+        try:
+            conflicts, errors = self._batch_conflicts(events)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    conflicts, errors = self._batch_conflicts(events)
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to check conflicts after refresh: {retry_e}")
+            else:
+                raise CalendarStoreError(f"Failed to check conflicts: {e}")
+        
+        return [
+            {"index": index, "error": errors[index]} if index in errors
+            else {"index": index, "conflicts": conflicts.get(index, [])}
+            for index in range(len(events))
+        ]
+
+    def _batch_conflicts(
+        self,
+        events: List[Dict[str, Any]]
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, str]]:
+        """
+        Sweep proposed events and the existing busy events they could overlap.
+        
+        Returns:
+            Tuple of (conflicts by item index, date errors by item index)
+        """
+        errors: Dict[int, str] = {}
+        proposed: List[Tuple[int, float, float]] = []
+        for index, item in enumerate(events):
+            if not isinstance(item, dict) or not item.get("start_date") or not item.get("end_date"):
+                errors[index] = "Missing required field(s): start_date, end_date"
+                continue
+            try:
+                start_ts, _ = self._parse_iso_date(item["start_date"])
+                end_ts, _ = self._parse_iso_date(item["end_date"])
+            except ValueError as e:
+                errors[index] = str(e)
+                continue
+            proposed.append((index, start_ts, end_ts))
+        
+        if not proposed:
+            return {}, errors
+        
+        existing = self._blocking_views(
+            None, min(start for _, start, _ in proposed), max(end for _, _, end in proposed)
+        )
+        starts = [start for _, start, _ in proposed] + [view.start for view in existing]
+        ends = [end for _, _, end in proposed] + [view.end for view in existing]
+        probes = [True] * len(proposed) + [False] * len(existing)
+        
+        conflicts: Dict[int, List[Dict[str, Any]]] = {}
+        for probe, other in sorted(overlap_pairs(starts, ends, probes), key=lambda pair: (pair[0], starts[pair[1]])):
+            index = proposed[probe][0]
+            if other < len(proposed):
+                item = events[proposed[other][0]]
+                conflict = {
+                    "index": proposed[other][0],
+                    "summary": item.get("summary", ""),
+                    "start": self._timestamp_to_iso(starts[other]),
+                    "end": self._timestamp_to_iso(ends[other]),
+                    "calendar": item.get("calendar_name", "")
+                }
+            else:
+                conflict = existing[other - len(proposed)].to_dict(_CONFLICT_FIELDS)
+            conflicts.setdefault(index, []).append(conflict)
+        return conflicts, errors
+
+    def _blocking_views(
+        self,
+        calendar_ids: Optional[List[str]],
+        start_ts: float,
+        end_ts: float
+    ) -> List[EventView]:
+        """
+        Get the events in a range that block time: busy, timed, with both dates.
+        
+        Returns:
+            Event views in start order
+        """
+        views = [
+            view for view in self._event_views(calendar_ids, start_ts, end_ts, _BUSY_FIELDS)
+            if view.start is not None and view.end is not None
+            and view.get("availability") == "busy" and not view.get("all_day")
+        ]
+        views.sort(key=lambda view: view.start)
+        return views
+
+    def _stage_create(
+        self,
+        calendar_name: str,
+        summary: str,
+        start_date: str,
+        end_date: str,
+        location: Optional[str] = None,
+        description: Optional[str] = None,
+        commit: bool = True
+    ) -> EventHandle:
+        """
+        Build and save a new event, optionally leaving the commit to the caller.
+        
+        Returns:
+            Handle of the saved event
+        """
         # Get the calendar
-        calendar = self._get_calendar_by_name(calendar_name)
+        calendar = self.calendar_registry.get(calendar_name)
         if not calendar:
             raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
             
         # Create a new event
-        event = EKEvent.eventWithEventStore_(self.event_store)
-        event.setTitle_(summary)
-        event.setCalendar_(calendar)
+        event = self.backend.new_event(calendar.identifier)
+        event.title = summary
         
         # Set dates
         try:
-            start_nsdate, _ = self._parse_iso_date(start_date)
-            end_nsdate, _ = self._parse_iso_date(end_date)
+            start_ts, _ = self._parse_iso_date(start_date)
+            end_ts, _ = self._parse_iso_date(end_date)
             
-            event.setStartDate_(start_nsdate)
-            event.setEndDate_(end_nsdate)
+            event.start = start_ts
+            event.end = end_ts
         except ValueError as e:
             raise CalendarStoreError(str(e))
         
         # Set optional properties
         if location:
-            event.setLocation_(location)
+            event.location = location
             
         if description:
-            event.setNotes_(description)
+            event.notes = description
             
         # Save the event
-        error = None
-        success = self.event_store.saveEvent_span_error_(event, EKSpanThisEvent, error)
-        
-        if not success:
-            error_str = error.localizedDescription() if error else "Unknown error"
-            raise CalendarStoreError(f"Failed to create event: {error_str}")
+        try:
+            self.backend.save_event(event, commit=commit)
+        except BackendError as e:
+            raise CalendarStoreError(f"Failed to create event: {e}")
             
-        return event.eventIdentifier()
+        return event
 
     def update_event(
         self,
@@ -635,7 +1823,7 @@ class CalendarStore:
             raise
         except Exception as e:
             # For other exceptions, try refreshing once and retry
-            if self.refresh_if_needed():
+            if self.refresh_if_needed(str(e)):
                 try:
                     return self._update_event_impl(event_id, calendar_name, summary, start_date, end_date, location, description)
                 except Exception as retry_e:
@@ -651,56 +1839,46 @@ class CalendarStore:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None, 
         location: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        commit: bool = True
     ) -> bool:
         """
         Internal implementation of update_event.
         """
-        # Get the calendar
-        calendar = self._get_calendar_by_name(calendar_name)
-        if not calendar:
-            raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
-            
-        # Find the event
-        event = self.event_store.eventWithIdentifier_(event_id)
-        if not event:
-            raise CalendarStoreError(f"Event with ID '{event_id}' not found")
-            
-        # Check that the event is in the specified calendar
-        if event.calendar().title() != calendar_name:
-            raise CalendarStoreError(f"Event is not in calendar '{calendar_name}'")
+        event = self._lookup_event(event_id, calendar_name)
             
         # Update the event properties
         if summary:
-            event.setTitle_(summary)
+            event.title = summary
             
         if start_date:
             try:
-                start_nsdate, _ = self._parse_iso_date(start_date)
-                event.setStartDate_(start_nsdate)
+                start_ts, _ = self._parse_iso_date(start_date)
+                event.start = start_ts
             except ValueError as e:
                 raise CalendarStoreError(str(e))
                 
         if end_date:
             try:
-                end_nsdate, _ = self._parse_iso_date(end_date)
-                event.setEndDate_(end_nsdate)
+                end_ts, _ = self._parse_iso_date(end_date)
+                event.end = end_ts
             except ValueError as e:
                 raise CalendarStoreError(str(e))
                 
         if location is not None:  # Allow empty string to clear location
-            event.setLocation_(location)
+            event.location = location
             
         if description is not None:  # Allow empty string to clear description
-            event.setNotes_(description)
+            event.notes = description
             
         # Save the updated event
-        error = None
-        success = self.event_store.saveEvent_span_error_(event, EKSpanThisEvent, error)
-        
-        if not success:
-            error_str = error.localizedDescription() if error else "Unknown error"
-            raise CalendarStoreError(f"Failed to update event: {error_str}")
+        try:
+            self.backend.save_event(event, commit=commit)
+        except BackendError as e:
+            raise CalendarStoreError(f"Failed to update event: {e}")
+        if commit:
+            # Batches discard after their commit (see _run_batch)
+            self.event_cache.discard(event_id)
             
         return True
 
@@ -727,7 +1905,7 @@ class CalendarStore:
             raise
         except Exception as e:
             # For other exceptions, try refreshing once and retry
-            if self.refresh_if_needed():
+            if self.refresh_if_needed(str(e)):
                 try:
                     return self._delete_event_impl(event_id, calendar_name)
                 except Exception as retry_e:
@@ -735,30 +1913,305 @@ class CalendarStore:
             else:
                 raise CalendarStoreError(f"Failed to delete event: {e}")
 
-    def _delete_event_impl(self, event_id: str, calendar_name: str) -> bool:
+    def _delete_event_impl(self, event_id: str, calendar_name: str, commit: bool = True) -> bool:
         """
         Internal implementation of delete_event.
         """
-        # Get the calendar
-        calendar = self._get_calendar_by_name(calendar_name)
-        if not calendar:
-            raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
+        event = self._lookup_event(event_id, calendar_name)
+            
+        # Delete the event
+        try:
+            self.backend.remove_event(event, commit=commit)
+        except BackendError as e:
+            raise CalendarStoreError(f"Failed to delete event: {e}")
+        if commit:
+            # Batches discard after their commit (see _run_batch)
+            self.event_cache.discard(event_id)
+            
+        return True
+
+    def get_event(
+        self,
+        event_id: str,
+        calendar_name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a single event by its identifier, whatever its date.
+        
+        Args:
+            event_id: ID of the event
+            calendar_name: (Optional) Calendar the event must belong to
+            fields: (Optional) Event fields to include (default: all fields)
+            
+        Returns:
+            Event dictionary
+            
+        Raises:
+            CalendarStoreError: If not authorized, the event is not found, it is
+                                in another calendar, or a field is unknown
+        """
+        self._check_authorization()
+        
+        try:
+            fields = normalize_fields(fields)
+        except ValueError as e:
+            raise CalendarStoreError(str(e))
+        
+        try:
+            return self._get_event_impl(event_id, calendar_name, fields)
+        except CalendarStoreError:
+            # Re-raise CalendarStoreError as-is
+            raise
+        except Exception as e:
+            # For other exceptions, try refreshing once and retry
+            if self.refresh_if_needed(str(e)):
+                try:
+                    return self._get_event_impl(event_id, calendar_name, fields)
+                except Exception as retry_e:
+                    raise CalendarStoreError(f"Failed to get event after refresh: {retry_e}")
+            else:
+                raise CalendarStoreError(f"Failed to get event: {e}")
+
+    def _get_event_impl(
+        self,
+        event_id: str,
+        calendar_name: Optional[str],
+        fields: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """
+        Internal implementation of get_event.
+        """
+        event = self._lookup_event(event_id, calendar_name)
+        self._note_read([event.calendar_id], None)
+        last_modified = event.last_modified
+        
+        cached = self.event_cache.get(event_id, last_modified)
+        if cached is None:
+            with PHASE_SECONDS.time(phase="format"):
+                cached = EventView(event, self._calendar_titles()).to_dict()
+            self.event_cache.put(event_id, last_modified, cached)
+        if fields == EVENT_FIELDS:
+            return cached
+        return {field: cached[field] for field in fields}
+
+    def _lookup_event(self, event_id: str, calendar_name: Optional[str] = None) -> EventHandle:
+        """
+        Find an event by identifier, checking the calendar it belongs to.
+        
+        Returns:
+            Backend handle of the event
+            
+        Raises:
+            CalendarStoreError: If the calendar or event is not found, or the
+                                event is in another calendar
+        """
+        if calendar_name:
+            # Get the calendar
+            calendar = self.calendar_registry.get(calendar_name)
+            if not calendar:
+                raise CalendarStoreError(f"Calendar '{calendar_name}' not found")
             
         # Find the event
-        event = self.event_store.eventWithIdentifier_(event_id)
+        event = self.backend.event_with_identifier(event_id)
         if not event:
+            self.event_cache.discard(event_id)
             raise CalendarStoreError(f"Event with ID '{event_id}' not found")
             
         # Check that the event is in the specified calendar
-        if event.calendar().title() != calendar_name:
+        if calendar_name and not self.calendar_registry.matches(calendar_name, event.calendar_id):
             raise CalendarStoreError(f"Event is not in calendar '{calendar_name}'")
+        return event
+
+    # Batch operations ------------------------------------------------------
+
+    def create_events(self, events: List[Dict[str, Any]], conflicts: str = "off") -> List[Dict[str, Any]]:
+        """
+        Create several events with a single commit.
+        
+        Args:
+            events: Event specifications with the keys of ``create_event``
+                    (calendar_name, summary, start_date, end_date and optionally
+                    location and description)
+            conflicts: "off" (default) creates events blindly; "report" adds a
+                       "conflicts" list to every result (see ``check_conflicts``);
+                       "block" also refuses to create the events that have conflicts
             
-        # Delete the event
-        error = None
-        success = self.event_store.removeEvent_span_error_(event, EKSpanThisEvent, error)
+        Returns:
+            One result per input, in order: {"index", "success", "event_id"}
+            on success, {"index", "success", "error"} on failure
+            
+        Raises:
+            CalendarStoreError: If not authorized or the conflict mode is unknown
+        """
+        if conflicts not in CONFLICT_MODES:
+            raise CalendarStoreError(
+                f"Unknown conflict mode '{conflicts}' (available: {', '.join(CONFLICT_MODES)})"
+            )
         
-        if not success:
-            error_str = error.localizedDescription() if error else "Unknown error"
-            raise CalendarStoreError(f"Failed to delete event: {error_str}")
+        found: Dict[int, List[Dict[str, Any]]] = {}
+        rejected: Dict[int, str] = {}
+        if conflicts != "off":
+            found = {
+                result["index"]: result["conflicts"]
+                for result in self.check_conflicts(events) if result.get("conflicts")
+            }
+            if conflicts == "block":
+                rejected = {
+                    index: f"Event overlaps {len(overlaps)} busy event(s)"
+                    for index, overlaps in found.items()
+                }
+        
+        results = self._run_batch(
+            events,
+            self._stage_create,
+            ("calendar_name", "summary", "start_date", "end_date"),
+            ("location", "description"),
+            lambda event: {"event_id": event.identifier},
+            rejected
+        )
+        if conflicts != "off":
+            for result in results:
+                result["conflicts"] = found.get(result["index"], [])
+        return results
+
+    def update_events(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update several events with a single commit.
+        
+        Args:
+            updates: Update specifications with the keys of ``update_event``
+                     (event_id, calendar_name and any of summary, start_date,
+                     end_date, location, description)
+            
+        Returns:
+            One result per input, in order: {"index", "success", "event_id"}
+            on success, {"index", "success", "error"} on failure
             
-        return True 
\ No newline at end of file
+        Raises:
+            CalendarStoreError: If not authorized to access calendars
+        """
+        return self._run_batch(
+            updates,
+            self._update_event_impl,
+            ("event_id", "calendar_name"),
+            ("summary", "start_date", "end_date", "location", "description"),
+            None
+        )
+
+    def delete_events(self, deletions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Delete several events with a single commit.
+        
+        Args:
+            deletions: Specifications with event_id and calendar_name
+            
+        Returns:
+            One result per input, in order: {"index", "success", "event_id"}
+            on success, {"index", "success", "error"} on failure
+            
+        Raises:
+            CalendarStoreError: If not authorized to access calendars
+        """
+        return self._run_batch(
+            deletions,
+            self._delete_event_impl,
+            ("event_id", "calendar_name"),
+            (),
+            None
+        )
+
+    def _run_batch(
+        self,
+        items: List[Dict[str, Any]],
+        stage: Callable[..., Any],
+        required: Tuple[str, ...],
+        optional: Tuple[str, ...],
+        describe: Optional[Callable[[Any], Dict[str, Any]]],
+        rejected: Optional[Dict[int, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Stage every item without committing, then commit once.
+        
+        Items that fail to stage are reported individually and do not stop
+        the batch. If the final commit fails, the staged changes are discarded
+        and every staged item is reported as failed. Cached copies of the
+        written events are dropped only once the commit has succeeded.
+        
+        Args:
+            items: Keyword arguments for ``stage``, one dictionary per item
+            stage: Staging function accepting the item fields and ``commit``
+            required: Fields every item must provide
+            optional: Fields an item may provide
+            describe: Builds the success payload from the staging result
+                      (default: the item's event_id)
+            rejected: Errors for items to fail without staging, by index
+            
+        Returns:
+            Per-item results in input order
+        """
+        self._check_authorization()
+        
+        results: List[Dict[str, Any]] = []
+        staged: List[Tuple[Dict[str, Any], Any]] = []
+        for index, item in enumerate(items):
+            result: Dict[str, Any] = {"index": index, "success": False}
+            results.append(result)
+            
+            if not isinstance(item, dict):
+                result["error"] = "Item must be an object"
+                continue
+            missing = [field for field in required if not item.get(field)]
+            if missing:
+                result["error"] = f"Missing required field(s): {', '.join(missing)}"
+                continue
+            unknown = sorted(set(item) - set(required) - set(optional))
+            if unknown:
+                result["error"] = f"Unknown field(s): {', '.join(unknown)}"
+                continue
+            if rejected and index in rejected:
+                result["error"] = rejected[index]
+                continue
+            
+            try:
+                staged.append((result, stage(**item, commit=False)))
+            except CalendarStoreError as e:
+                result["error"] = str(e)
+            except Exception as e:
+                result["error"] = f"Unexpected error: {e}"
+        
+        if not staged:
+            return results
+        
+        try:
+            self.backend.commit()
+        except Exception as e:
+            self._discard_staged(f"batch commit failed: {e}")
+            for result, _ in staged:
+                result["error"] = f"Failed to commit batch: {e}"
+            return results
+        
+        for result, outcome in staged:
+            result["success"] = True
+            if describe is not None:
+                result.update(describe(outcome))
+            else:
+                result["event_id"] = items[result["index"]]["event_id"]
+                self.event_cache.discard(result["event_id"])
+        return results
+
+    def _discard_staged(self, reason: str) -> None:
+        """
+        Drop uncommitted changes by opening a fresh backend store handle.
+        
+        Args:
+            reason: Description of the failure, for logging
+        """
+        with self._auth_lock:
+            try:
+                self.backend.reset()
+                self._worker_generation += 1
+            except Exception as e:
+                logger.error(f"Failed to discard staged changes: {e}")
+            self._drop_cached_data()
+        self.health.mark_suspect(reason)
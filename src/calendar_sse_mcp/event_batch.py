@@ -0,0 +1,210 @@
+"""
+Columnar event storage for bulk queries.
+
+A list of event dictionaries costs roughly a kilobyte per event. EventBatch
+keeps the same data in parallel columns instead: dates as int64 epoch
+seconds, calendar titles interned, and text fields as indexes into a shared
+string table, so repeated titles such as "Standup" are stored once. Rows are
+exposed through slotted views, and dictionaries are only built at the edge.
+"""
+import datetime
+from array import array
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+
+from .event_view import EVENT_FIELDS, EventView
+
+
+# Stored in the date columns for events without a start or end
+NO_DATE = -(2 ** 63)
+
+_ALL_DAY = 1
+_BUSY = 2
+
+
+def _iso(timestamp: int) -> Optional[str]:
+    if timestamp == NO_DATE:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class EventRow:
+    """Read-only view of one row of an EventBatch"""
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch: "EventBatch", row: int) -> None:
+        self._batch = batch
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._batch._ids[self._row]
+
+    @property
+    def summary(self) -> str:
+        return self._batch.strings[self._batch._summaries[self._row]]
+
+    @property
+    def start_ts(self) -> Optional[int]:
+        value = self._batch._starts[self._row]
+        return None if value == NO_DATE else value
+
+    @property
+    def end_ts(self) -> Optional[int]:
+        value = self._batch._ends[self._row]
+        return None if value == NO_DATE else value
+
+    @property
+    def start(self) -> Optional[str]:
+        return _iso(self._batch._starts[self._row])
+
+    @property
+    def end(self) -> Optional[str]:
+        return _iso(self._batch._ends[self._row])
+
+    @property
+    def location(self) -> str:
+        return self._batch.strings[self._batch._locations[self._row]]
+
+    @property
+    def description(self) -> str:
+        return self._batch.strings[self._batch._descriptions[self._row]]
+
+    @property
+    def calendar(self) -> str:
+        return self._batch.calendars[self._batch._calendars[self._row]]
+
+    @property
+    def all_day(self) -> bool:
+        return bool(self._batch._flags[self._row] & _ALL_DAY)
+
+    @property
+    def availability(self) -> str:
+        return "busy" if self._batch._flags[self._row] & _BUSY else "free"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the event dictionary with the batch's fields"""
+        return {field: getattr(self, field) for field in self._batch.fields}
+
+    def __repr__(self) -> str:
+        return f"EventRow({self.to_dict()!r})"
+
+
+class EventBatch:
+    """
+    Compact column store for a list of events.
+
+    Only the fields the batch was built with are filled; the other columns
+    hold defaults and are left out of ``to_dict()``.
+    """
+    __slots__ = (
+        "fields", "calendars", "strings", "_calendar_ids", "_string_ids", "_ids", "_starts", "_ends",
+        "_calendars", "_summaries", "_locations", "_descriptions", "_flags"
+    )
+
+    def __init__(self, fields: Tuple[str, ...] = EVENT_FIELDS) -> None:
+        """
+        Initialize an empty batch.
+
+        Args:
+            fields: Normalized event fields the batch holds
+        """
+        self.fields = fields
+        # Interned calendar titles and text values; index 0 is the empty string
+        self.calendars: List[str] = []
+        self.strings: List[str] = [""]
+        self._calendar_ids: Dict[str, int] = {}
+        self._string_ids: Dict[str, int] = {"": 0}
+        self._ids: List[str] = []
+        self._starts = array("q")
+        self._ends = array("q")
+        self._calendars = array("I")
+        self._summaries = array("I")
+        self._locations = array("I")
+        self._descriptions = array("I")
+        self._flags = array("B")
+
+    @classmethod
+    def from_views(cls, views: Iterable[EventView], fields: Tuple[str, ...] = EVENT_FIELDS) -> "EventBatch":
+        """
+        Build a batch from event views, reading only the selected fields.
+
+        Args:
+            views: Event views in output order
+            fields: Normalized event fields to store
+
+        Returns:
+            The filled batch
+        """
+        batch = cls(fields)
+        for view in views:
+            batch.append(view)
+        return batch
+
+    def _intern(self, value: Optional[str]) -> int:
+        if not value:
+            return 0
+        index = self._string_ids.get(value)
+        if index is None:
+            index = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def append(self, view: EventView) -> None:
+        """Add one event, reading only the batch's fields from the view"""
+        fields = self.fields
+        self._ids.append(view.identifier if "id" in fields else "")
+
+        start = view.start if "start" in fields else None
+        end = view.end if "end" in fields else None
+        self._starts.append(NO_DATE if start is None else int(start))
+        self._ends.append(NO_DATE if end is None else int(end))
+
+        calendar = 0
+        if "calendar" in fields:
+            title = view.get("calendar")
+            calendar = self._calendar_ids.get(title, -1)
+            if calendar < 0:
+                calendar = self._calendar_ids[title] = len(self.calendars)
+                self.calendars.append(title)
+        elif not self.calendars:
+            self.calendars.append("")
+        self._calendars.append(calendar)
+
+        self._summaries.append(self._intern(view.get("summary")) if "summary" in fields else 0)
+        self._locations.append(self._intern(view.get("location")) if "location" in fields else 0)
+        self._descriptions.append(self._intern(view.get("description")) if "description" in fields else 0)
+
+        flags = 0
+        if "all_day" in fields and view.get("all_day"):
+            flags |= _ALL_DAY
+        if "availability" in fields and view.get("availability") == "busy":
+            flags |= _BUSY
+        self._flags.append(flags)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, row: int) -> EventRow:
+        if row < 0:
+            row += len(self._ids)
+        if not 0 <= row < len(self._ids):
+            raise IndexError("EventBatch index out of range")
+        return EventRow(self, row)
+
+    def __iter__(self) -> Iterator[EventRow]:
+        for row in range(len(self._ids)):
+            yield EventRow(self, row)
+
+    @property
+    def start_timestamps(self) -> array:
+        """Start column as int64 epoch seconds (NO_DATE where missing)"""
+        return self._starts
+
+    @property
+    def end_timestamps(self) -> array:
+        """End column as int64 epoch seconds (NO_DATE where missing)"""
+        return self._ends
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert every row to an event dictionary"""
+        return [row.to_dict() for row in self]
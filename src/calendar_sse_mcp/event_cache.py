@@ -0,0 +1,82 @@
+"""
+Bounded cache of formatted events for lookups by identifier.
+
+Looking an event up by identifier is a cheap native call, but formatting it
+reads every attribute across the PyObjC bridge. Entries are keyed by event
+identifier and remember the event's last-modified date, so an edit made
+anywhere (even in Calendar.app itself) turns the next lookup into a miss.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+class EventCache:
+    """Least-recently-used map from event identifier to its event dictionary"""
+
+    def __init__(self, max_size: int = 1000) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of events kept (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, event_id: str, last_modified: float) -> Optional[Dict[str, Any]]:
+        """
+        Look up an event.
+
+        Args:
+            event_id: Event identifier
+            last_modified: Current last-modified date of the event
+
+        Returns:
+            A copy of the cached dictionary, or None if missing or stale
+        """
+        with self._lock:
+            entry = self._entries.get(event_id)
+            if entry is None or entry[0] != last_modified:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(event_id)
+            self._hits += 1
+            return dict(entry[1])
+
+    def put(self, event_id: str, last_modified: float, event: Dict[str, Any]) -> None:
+        """
+        Store an event, evicting the least recently used entries if full.
+
+        Args:
+            event_id: Event identifier
+            last_modified: Last-modified date the dictionary was built from
+            event: Event dictionary (copied)
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[event_id] = (last_modified, dict(event))
+            self._entries.move_to_end(event_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, event_id: str) -> None:
+        """Forget an event"""
+        with self._lock:
+            self._entries.pop(event_id, None)
+
+    def clear(self) -> None:
+        """Forget all events"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the size, capacity and hit counters"""
+        return {"size": len(self._entries), "max_size": self.max_size, "hits": self._hits, "misses": self._misses}
@@ -0,0 +1,617 @@
+"""
+In-process event index used by CalendarStore to answer range queries
+without going back to the calendar backend.
+
+Coverage is filled in whole local days, so sliding windows such as "the
+next 3 days" are answered from memory until they cross midnight, and each
+calendar keeps at most a bounded number of days, least recently used first
+out.
+"""
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Hashable, Iterable, Callable, Set, Iterator
+
+from .text_index import TextIndex, TextQuery, TrigramIndex
+
+
+class IntervalIndex:
+    """
+    Interval index answering overlap queries in O(log n + k).
+
+    Intervals are kept in start-sorted arrays laid out as an implicit
+    augmented binary tree (the layout used by cgranges): node ``i`` at level
+    ``k`` stores the maximum end of its subtree, so a query only descends into
+    subtrees that can overlap. Updates mark the index dirty and the arrays are
+    rebuilt on the next query, which suits the bulk inserts done per fetch.
+    """
+
+    _LINEAR_SCAN_LIMIT = 16
+
+    def __init__(self) -> None:
+        self._items: Dict[Hashable, Tuple[float, float, Any]] = {}
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        self._max_ends: List[float] = []
+        self._values: List[Any] = []
+        self._keys: List[Hashable] = []
+        self._max_level = -1
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def add(self, key: Hashable, start: float, end: float, value: Any) -> None:
+        """
+        Add or replace an interval.
+
+        Args:
+            key: Unique key of the interval
+            start: Interval start (inclusive)
+            end: Interval end (exclusive)
+            value: Payload returned by queries
+        """
+        self._items[key] = (start, max(start, end), value)
+        self._dirty = True
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove an interval.
+
+        Returns:
+            True if the key was present
+        """
+        if self._items.pop(key, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def clear(self) -> None:
+        """Remove all intervals"""
+        self._items.clear()
+        self._dirty = True
+
+    def overlap(self, start: float, end: float) -> List[Any]:
+        """
+        Find intervals overlapping the half-open range [start, end).
+
+        Returns:
+            Payloads of overlapping intervals, ordered by start
+        """
+        return [self._values[i] for i in self._overlap_positions(start, end)]
+
+    def overlap_items(self, start: float, end: float) -> List[Tuple[float, float, Any]]:
+        """
+        Find intervals overlapping [start, end) with their bounds.
+
+        Returns:
+            (start, end, payload) tuples ordered by start
+        """
+        return [
+            (self._starts[i], self._ends[i], self._values[i])
+            for i in self._overlap_positions(start, end)
+        ]
+
+    def keys_overlapping(self, start: float, end: float) -> List[Hashable]:
+        """Return the keys of intervals overlapping [start, end)"""
+        return [self._keys[i] for i in self._overlap_positions(start, end)]
+
+    def get(self, key: Hashable) -> Any:
+        """Return the payload of an interval, or None if absent"""
+        item = self._items.get(key)
+        return item[2] if item else None
+
+    def bounds(self, key: Hashable) -> Optional[Tuple[float, float]]:
+        """Return the (start, end) of an interval, or None if absent"""
+        item = self._items.get(key)
+        return (item[0], item[1]) if item else None
+
+    def _overlap_positions(self, start: float, end: float) -> List[int]:
+        if self._dirty:
+            self._build()
+
+        starts, ends, max_ends = self._starts, self._ends, self._max_ends
+        n = len(starts)
+        out: List[int] = []
+
+        if n < self._LINEAR_SCAN_LIMIT:
+            for i in range(n):
+                if starts[i] >= end:
+                    break
+                if start < ends[i]:
+                    out.append(i)
+            return out
+
+        # Top-down traversal; output positions come out in start order
+        k = self._max_level
+        stack = [((1 << k) - 1, k, False)]
+        while stack:
+            x, k, left_done = stack.pop()
+            if k <= 3:
+                # Small subtree: scan it linearly
+                i = x >> k << k
+                i1 = min(i + (1 << (k + 1)) - 1, n)
+                while i < i1 and starts[i] < end:
+                    if start < ends[i]:
+                        out.append(i)
+                    i += 1
+            elif not left_done:
+                y = x - (1 << (k - 1))
+                stack.append((x, k, True))
+                # The left child may lie past the array end; descend only if it can overlap
+                if y >= n or max_ends[y] > start:
+                    stack.append((y, k - 1, False))
+            elif x < n and starts[x] < end:
+                if start < ends[x]:
+                    out.append(x)
+                stack.append((x + (1 << (k - 1)), k - 1, False))
+        return out
+
+    def _build(self) -> None:
+        items = sorted(self._items.items(), key=lambda item: (item[1][0], item[1][1]))
+        self._keys = [key for key, _ in items]
+        self._starts = [bounds[0] for _, bounds in items]
+        self._ends = [bounds[1] for _, bounds in items]
+        self._values = [bounds[2] for _, bounds in items]
+        self._max_ends = list(self._ends)
+        self._max_level = self._index_levels(self._ends, self._max_ends)
+        self._dirty = False
+
+    @staticmethod
+    def _index_levels(ends: List[float], max_ends: List[float]) -> int:
+        """Fill subtree maximum ends in place and return the root level"""
+        n = len(ends)
+        if n == 0:
+            return -1
+
+        last_i = 0
+        last = 0.0
+        for i in range(0, n, 2):
+            last_i = i
+            last = max_ends[i] = ends[i]
+
+        k = 1
+        while (1 << k) <= n:
+            x = 1 << (k - 1)
+            i0 = (x << 1) - 1
+            step = x << 2
+            for i in range(i0, n, step):
+                el = max_ends[i - x]
+                er = max_ends[i + x] if i + x < n else last
+                e = ends[i]
+                if el > e:
+                    e = el
+                if er > e:
+                    e = er
+                max_ends[i] = e
+            last_i = last_i - x if (last_i >> k) & 1 else last_i + x
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            k += 1
+        return k - 1
+
+
+def _midnight(day: datetime.date) -> float:
+    """Timestamp of local midnight starting a day"""
+    return datetime.datetime.combine(day, datetime.time()).timestamp()
+
+
+def day_span(start: float, end: float) -> Tuple[float, float]:
+    """
+    Widen [start, end) to local day boundaries.
+
+    Returns:
+        (midnight at or before start, midnight at or after end)
+    """
+    span_start = _midnight(datetime.datetime.fromtimestamp(start).date())
+    last_day = datetime.datetime.fromtimestamp(end).date()
+    span_end = _midnight(last_day)
+    if span_end < end:
+        span_end = _midnight(last_day + datetime.timedelta(days=1))
+    return span_start, span_end
+
+
+def local_days(start: float, end: float) -> Iterator[Tuple[float, float]]:
+    """Yield the (start, end) of every local day overlapping [start, end)"""
+    day = datetime.datetime.fromtimestamp(start).date()
+    day_start = _midnight(day)
+    while day_start < end:
+        day += datetime.timedelta(days=1)
+        day_end = _midnight(day)
+        yield day_start, day_end
+        day_start = day_end
+
+
+def _subtract_range(
+    ranges: List[Tuple[float, float, float]],
+    start: float,
+    end: float
+) -> List[Tuple[float, float, float]]:
+    """Remove [start, end) from a sorted list of (start, end, fetched_at) ranges"""
+    result = []
+    for s, e, fetched_at in ranges:
+        if e <= start or s >= end:
+            result.append((s, e, fetched_at))
+            continue
+        if s < start:
+            result.append((s, start, fetched_at))
+        if e > end:
+            result.append((end, e, fetched_at))
+    return result
+
+
+class CalendarIndex:
+    """
+    Interval index for one calendar plus the time ranges it fully covers.
+
+    A covered range guarantees that every event of the calendar overlapping
+    it is present in the index, so queries inside covered ranges never need
+    the backend.
+
+    Indexed events are also kept in a token index and a trigram index for
+    search. Both need the event text, so new events are only queued and get
+    indexed on the first search of each kind, keeping plain range queries
+    from reading it.
+
+    Covered local days are tracked in least-recently-used order; ``trim``
+    drops the oldest ones beyond ``max_days``.
+    """
+
+    def __init__(self, max_days: Optional[int] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            max_days: Maximum number of covered days kept by ``trim`` (None: unbounded)
+        """
+        self.events = IntervalIndex()
+        self.text = TextIndex()
+        self.grams = TrigramIndex()
+        self.max_days = max_days
+        self._text_pending: Set[Hashable] = set()
+        self._gram_pending: Set[Hashable] = set()
+        self._covered: List[Tuple[float, float, float]] = []
+        # Start of each covered local day -> its end, least recently used first
+        self._days: "OrderedDict[float, float]" = OrderedDict()
+
+    @property
+    def covered(self) -> List[Tuple[float, float]]:
+        """Covered ranges as (start, end) tuples"""
+        return [(s, e) for s, e, _ in self._covered]
+
+    def missing(self, start: float, end: float, max_age: Optional[float] = None) -> List[Tuple[float, float]]:
+        """
+        Find the parts of [start, end) not covered by the index.
+
+        Args:
+            start: Range start
+            end: Range end
+            max_age: Coverage older than this many seconds is expired first
+
+        Returns:
+            Uncovered gaps in ascending order
+        """
+        if max_age is not None:
+            self.expire(time.time() - max_age)
+
+        gaps = []
+        cursor = start
+        for s, e, _ in self._covered:
+            if e <= cursor:
+                continue
+            if s >= end:
+                break
+            if s > cursor:
+                gaps.append((cursor, s))
+            cursor = max(cursor, e)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def add_range(self, start: float, end: float, entries: Iterable[Tuple[Hashable, float, float, Any]]) -> None:
+        """
+        Store events fetched for [start, end) and mark the range covered.
+
+        Args:
+            start: Fetched range start
+            end: Fetched range end
+            entries: (key, start, end, payload) tuples for every event overlapping the range
+        """
+        for key, ev_start, ev_end, value in entries:
+            self.events.add(key, ev_start, ev_end, value)
+            self.text.remove(key)
+            self.grams.remove(key)
+            self._text_pending.add(key)
+            self._gram_pending.add(key)
+
+        fetched_at = time.time()
+        merged: List[Tuple[float, float, float]] = []
+        for s, e, f in sorted(self._covered + [(start, end, fetched_at)]):
+            if merged and s <= merged[-1][1]:
+                prev_s, prev_e, prev_f = merged[-1]
+                merged[-1] = (prev_s, max(prev_e, e), min(prev_f, f))
+            else:
+                merged.append((s, e, f))
+        self._covered = merged
+        for day_start, day_end in local_days(start, end):
+            self._days[day_start] = day_end
+            self._days.move_to_end(day_start)
+
+    def touch(self, start: float, end: float) -> None:
+        """Mark the covered days overlapping [start, end) as recently used"""
+        for day_start, _ in local_days(start, end):
+            if day_start in self._days:
+                self._days.move_to_end(day_start)
+
+    def trim(self) -> int:
+        """
+        Drop the least recently used days beyond ``max_days``.
+
+        Returns:
+            Number of events dropped
+        """
+        dropped = 0
+        while self.max_days is not None and len(self._days) > self.max_days:
+            day_start, day_end = self._days.popitem(last=False)
+            dropped += self.invalidate_range(day_start, day_end)
+        return dropped
+
+    @property
+    def day_count(self) -> int:
+        """Number of (possibly partly) covered local days"""
+        return len(self._days)
+
+    def query(self, start: float, end: float) -> List[Any]:
+        """Return payloads of events overlapping [start, end), ordered by start"""
+        return self.events.overlap(start, end)
+
+    def search(
+        self,
+        query: TextQuery,
+        start: float,
+        end: float,
+        text_of: Callable[[Any], Iterable[str]],
+        prepare: Optional[Callable[[List[Any]], None]] = None
+    ) -> List[Tuple[float, float, Any]]:
+        """
+        Find indexed events matching a token query that overlap [start, end).
+
+        The cost is proportional to the number of text matches, not to the
+        number of events in the range.
+
+        Args:
+            query: Parsed text query
+            start: Range start
+            end: Range end
+            text_of: Returns the searchable field values of a payload
+            prepare: Called with the payloads about to be passed to ``text_of``
+
+        Returns:
+            (start, end, payload) tuples ordered by start
+        """
+        self._sync(self.text, self._text_pending, text_of, prepare)
+        return self._in_range(self.text.search(query), start, end)
+
+    def search_substring(
+        self,
+        needle: str,
+        start: float,
+        end: float,
+        text_of: Callable[[Any], Iterable[str]],
+        prepare: Optional[Callable[[List[Any]], None]] = None
+    ) -> List[Tuple[float, float, Any]]:
+        """
+        Find indexed events containing a substring that overlap [start, end).
+
+        Args:
+            needle: Text to look for (compared after NFKC normalization and case folding)
+            start: Range start
+            end: Range end
+            text_of: Returns the searchable field values of a payload
+            prepare: Called with the payloads about to be passed to ``text_of``
+
+        Returns:
+            (start, end, payload) tuples ordered by start
+        """
+        self._sync(self.grams, self._gram_pending, text_of, prepare)
+        return self._in_range(self.grams.search(needle), start, end)
+
+    def _sync(
+        self,
+        index: Any,
+        pending: Set[Hashable],
+        text_of: Callable[[Any], Iterable[str]],
+        prepare: Optional[Callable[[List[Any]], None]]
+    ) -> None:
+        """Index the queued events into a text index"""
+        if pending:
+            if prepare is not None:
+                prepare([self.events.get(key) for key in pending])
+            for key in pending:
+                index.add(key, text_of(self.events.get(key)))
+            pending.clear()
+
+    def _in_range(self, keys: Iterable[Hashable], start: float, end: float) -> List[Tuple[float, float, Any]]:
+        """Keep the keys whose events overlap [start, end), ordered by start"""
+        matches = []
+        for key in keys:
+            ev_start, ev_end = self.events.bounds(key)
+            if ev_start < end and start < ev_end:
+                matches.append((ev_start, ev_end, self.events.get(key)))
+        matches.sort(key=lambda item: (item[0], item[1]))
+        return matches
+
+    def invalidate_range(self, start: float, end: float) -> int:
+        """
+        Drop events overlapping [start, end) and the coverage they touched.
+
+        Coverage is removed over the hull of the range and every dropped event,
+        so ranges that remain covered still hold all of their events.
+
+        Returns:
+            Number of events dropped
+        """
+        hull_start, hull_end = start, end
+        dropped = 0
+        for key in self.events.keys_overlapping(start, end):
+            ev_start, ev_end = self.events.bounds(key)
+            hull_start = min(hull_start, ev_start)
+            hull_end = max(hull_end, ev_end)
+            self.events.remove(key)
+            self.text.remove(key)
+            self.grams.remove(key)
+            self._text_pending.discard(key)
+            self._gram_pending.discard(key)
+            dropped += 1
+        self._covered = _subtract_range(self._covered, hull_start, hull_end)
+        for day_start, day_end in local_days(hull_start, hull_end):
+            if day_start in self._days and not any(
+                s < day_end and e > day_start for s, e, _ in self._covered
+            ):
+                del self._days[day_start]
+        return dropped
+
+    def expire(self, cutoff: float) -> None:
+        """Invalidate coverage fetched before the cutoff timestamp"""
+        for s, e, fetched_at in list(self._covered):
+            if fetched_at < cutoff:
+                self.invalidate_range(s, e)
+
+    def clear(self) -> None:
+        """Drop all events and coverage"""
+        self.events.clear()
+        self.text.clear()
+        self.grams.clear()
+        self._text_pending.clear()
+        self._gram_pending.clear()
+        self._covered = []
+        self._days.clear()
+
+
+class EventIndex:
+    """
+    Per-calendar interval indexes shared by a CalendarStore.
+
+    ``lock`` guards the indexes but is not held during backend fetches:
+    a filler reads each calendar's ``generation`` under the lock, fetches
+    without it, and stores the result with ``add_range``, which drops it if
+    the calendar was invalidated in the meantime.
+    """
+
+    def __init__(self, max_age: Optional[float] = None, max_days: Optional[int] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            max_age: Seconds after which fetched ranges are considered stale (None: never)
+            max_days: Covered days kept per calendar (None: unbounded)
+        """
+        self.max_age = max_age
+        self.max_days = max_days
+        self.lock = threading.RLock()
+        self._calendars: Dict[str, CalendarIndex] = {}
+        # Bumped by invalidations: per calendar, and for all calendars at once
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+
+    def calendar(self, calendar_id: str) -> CalendarIndex:
+        """Get (creating if needed) the index of a calendar"""
+        index = self._calendars.get(calendar_id)
+        if index is None:
+            index = self._calendars[calendar_id] = CalendarIndex(self.max_days)
+        return index
+
+    def generation(self, calendar_id: str) -> Tuple[int, int]:
+        """Token that changes whenever the calendar's index is invalidated"""
+        return (self._epoch, self._generations.get(calendar_id, 0))
+
+    def add_range(
+        self,
+        calendar_id: str,
+        generation: Tuple[int, int],
+        start: float,
+        end: float,
+        entries: Iterable[Tuple[Hashable, float, float, Any]]
+    ) -> bool:
+        """
+        Store events fetched for [start, end) unless the calendar changed since.
+
+        Args:
+            calendar_id: Calendar the events belong to
+            generation: ``generation(calendar_id)`` read before the fetch started
+            start: Fetched range start
+            end: Fetched range end
+            entries: (key, start, end, payload) tuples (see ``CalendarIndex.add_range``)
+
+        Returns:
+            True if the events were stored, False if they may be stale
+        """
+        with self.lock:
+            if self.generation(calendar_id) != generation:
+                return False
+            self.calendar(calendar_id).add_range(start, end, entries)
+            return True
+
+    def _bump(self, calendar_id: str) -> None:
+        self._generations[calendar_id] = self._generations.get(calendar_id, 0) + 1
+
+    def invalidate_calendar(self, calendar_id: str) -> None:
+        """Drop everything cached for a calendar"""
+        with self.lock:
+            self._bump(calendar_id)
+            self._calendars.pop(calendar_id, None)
+
+    def invalidate(
+        self,
+        calendar_ids: Optional[Iterable[str]] = None,
+        ranges: Optional[Iterable[Tuple[float, float]]] = None
+    ) -> None:
+        """
+        Invalidate part of the index after a store change.
+
+        Args:
+            calendar_ids: Affected calendars (None: every calendar)
+            ranges: Affected time ranges (None: every date)
+        """
+        with self.lock:
+            if calendar_ids is None:
+                self._epoch += 1
+                targets = list(self._calendars)
+            else:
+                targets = list(calendar_ids)
+                for calendar_id in targets:
+                    self._bump(calendar_id)
+            for calendar_id in targets:
+                index = self._calendars.get(calendar_id)
+                if index is None:
+                    continue
+                if ranges is None:
+                    del self._calendars[calendar_id]
+                    continue
+                for start, end in ranges:
+                    index.invalidate_range(start, end)
+
+    def clear(self) -> None:
+        """Drop everything cached for all calendars"""
+        with self.lock:
+            self._epoch += 1
+            self._calendars.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cached event and range counts per calendar"""
+        with self.lock:
+            return {
+                calendar_id: {
+                    "events": len(index.events),
+                    "searchable": len(index.text),
+                    "days": index.day_count,
+                    "covered": index.covered
+                }
+                for calendar_id, index in self._calendars.items()
+            }
@@ -0,0 +1,174 @@
+"""
+Lazy event views for CalendarStore.
+
+Reading an EventKit attribute crosses the PyObjC bridge, and notes can be
+multi-kilobyte agendas. An EventView reads each field from the backend
+handle on first access and remembers it, so callers that only need a few
+fields never pay for the rest.
+"""
+import datetime
+from typing import Dict, Any, Optional, Iterable, Tuple, FrozenSet
+
+from .backends import EventHandle
+
+
+# Fields of an event dictionary, in output order
+EVENT_FIELDS: Tuple[str, ...] = (
+    "id", "summary", "start", "end", "location", "description", "calendar", "all_day", "availability"
+)
+
+# Backend event attributes each field is read from
+FIELD_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "id": ("identifier",),
+    "summary": ("title",),
+    "start": ("start",),
+    "end": ("end",),
+    "location": ("location",),
+    "description": ("notes",),
+    "calendar": ("calendar_id",),
+    "all_day": ("all_day",),
+    "availability": ("busy",),
+}
+
+
+def event_attributes(fields: Iterable[str]) -> FrozenSet[str]:
+    """Return the backend event attributes needed to build the given fields"""
+    return frozenset(attribute for field in fields for attribute in FIELD_ATTRIBUTES[field])
+
+
+def normalize_fields(fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Validate a field selection and put it in output order.
+
+    Args:
+        fields: Requested field names (None or empty for all fields)
+
+    Returns:
+        Requested fields ordered as in EVENT_FIELDS
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not fields:
+        return EVENT_FIELDS
+    wanted = set(fields)
+    unknown = wanted.difference(EVENT_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown event field(s): {', '.join(sorted(unknown))} "
+            f"(available: {', '.join(EVENT_FIELDS)})"
+        )
+    return tuple(field for field in EVENT_FIELDS if field in wanted)
+
+
+def _timestamp_to_iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class EventView:
+    """
+    Read-only view of a backend event that materializes fields on demand.
+
+    Each field is read through the backend handle at most once. Views are
+    cached by the event index, so a field read by one query is free for the
+    next one.
+    """
+    __slots__ = ("_event", "_calendar_titles", "_values", "_start", "_end", "_identifier")
+
+    _MISSING = object()
+
+    def __init__(self, event: EventHandle, calendar_titles: Dict[str, str]) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            event: Backend event handle
+            calendar_titles: Mapping of calendar identifier to title
+        """
+        self._event = event
+        self._calendar_titles = calendar_titles
+        self._values: Dict[str, Any] = {}
+        self._start: Any = self._MISSING
+        self._end: Any = self._MISSING
+        self._identifier: Optional[str] = None
+
+    @property
+    def event(self) -> EventHandle:
+        """The backend event handle the view reads from"""
+        return self._event
+
+    @property
+    def identifier(self) -> str:
+        """Event identifier"""
+        if self._identifier is None:
+            self._identifier = self._event.identifier
+        return self._identifier
+
+    @property
+    def calendar_id(self) -> str:
+        """Identifier of the calendar containing the event"""
+        return self._event.calendar_id
+
+    @property
+    def start(self) -> Optional[float]:
+        """Start as a Unix timestamp"""
+        if self._start is self._MISSING:
+            self._start = self._event.start
+        return self._start
+
+    @property
+    def end(self) -> Optional[float]:
+        """End as a Unix timestamp"""
+        if self._end is self._MISSING:
+            self._end = self._event.end
+        return self._end
+
+    def get(self, field: str) -> Any:
+        """
+        Return one field of the event dictionary, reading it on first use.
+
+        Args:
+            field: One of EVENT_FIELDS
+        """
+        values = self._values
+        if field in values:
+            return values[field]
+
+        event = self._event
+        if field == "id":
+            value = self.identifier
+        elif field == "summary":
+            value = event.title
+        elif field == "start":
+            value = _timestamp_to_iso(self.start)
+        elif field == "end":
+            value = _timestamp_to_iso(self.end)
+        elif field == "location":
+            value = event.location
+        elif field == "description":
+            value = event.notes
+        elif field == "calendar":
+            value = self._calendar_titles.get(event.calendar_id, "")
+        elif field == "all_day":
+            value = event.all_day
+        elif field == "availability":
+            value = "busy" if event.busy else "free"
+        else:
+            raise KeyError(field)
+
+        values[field] = value
+        return value
+
+    def to_dict(self, fields: Tuple[str, ...] = EVENT_FIELDS) -> Dict[str, Any]:
+        """
+        Build an event dictionary with the selected fields.
+
+        Args:
+            fields: Fields to include, already normalized
+
+        Returns:
+            A new dictionary the caller may mutate
+        """
+        return {field: self.get(field) for field in fields}
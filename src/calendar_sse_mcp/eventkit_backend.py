@@ -0,0 +1,363 @@
+"""
+EventKit backend for CalendarStore, accessing macOS Calendar.app.
+"""
+import logging
+import re
+import time
+from typing import List, Any, Optional, Iterable
+
+from EventKit import (
+    EKCalendarEventAvailabilityBusy,
+    EKEntityTypeEvent,
+    EKEventStore,
+    EKEventStoreChangedNotification,
+    EKEvent,
+    EKSpanThisEvent
+)
+from Foundation import NSDate, NSDefaultRunLoopMode, NSNotificationCenter, NSRunLoop
+
+from .backends import (
+    PHASE_SECONDS, BackendError, CalendarInfo, ChangeNotifier, EventHandle, StoreChange, event_span
+)
+
+logger = logging.getLogger(__name__)
+
+# userInfo key listing the changed objects (present since macOS 10.9, though undocumented)
+_CHANGED_OBJECT_IDS = "EKEventStoreChangedObjectIDsUserInfoKey"
+
+# Entities whose changes alter the calendar list rather than events
+_CALENDAR_ENTITIES = frozenset(("Calendar", "Source", "Store"))
+
+
+def _entity_name(object_id: Any) -> str:
+    """Entity name of an EventKit object ID, e.g. "Event" or "Calendar" ("" if unknown)"""
+    try:
+        return str(object_id.entityName())
+    except Exception:
+        pass
+    try:
+        text = str(object_id.URIRepresentation())
+    except Exception:
+        text = str(object_id)
+    # x-apple-eventkit:///Event/p123 or x-coredata://<store>/Calendar/p4
+    match = re.search(r"/([A-Za-z]+)/p?\d+", text)
+    return match.group(1) if match else ""
+
+
+def _to_nsdate(timestamp: Optional[float]) -> Optional[NSDate]:
+    """Convert seconds since the Unix epoch to NSDate"""
+    if timestamp is None:
+        return None
+    return NSDate.dateWithTimeIntervalSince1970_(timestamp)
+
+
+def _from_nsdate(date: Optional[NSDate]) -> Optional[float]:
+    """Convert NSDate to seconds since the Unix epoch"""
+    if date is None:
+        return None
+    return date.timeIntervalSince1970()
+
+
+def pump_run_loop(seconds: float = 0.05) -> None:
+    """Run the current thread's run loop briefly so queued callbacks are delivered"""
+    NSRunLoop.currentRunLoop().runMode_beforeDate_(
+        NSDefaultRunLoopMode, NSDate.dateWithTimeIntervalSinceNow_(seconds)
+    )
+
+
+class EventKitEvent:
+    """
+    Adapter exposing an EKEvent through the EventHandle interface.
+
+    Every attribute read goes through the PyObjC bridge, so callers should
+    only touch the fields they need. The first date change remembers the
+    original span so the save can report exactly which dates changed.
+    """
+    __slots__ = ("ek_event", "original_span")
+
+    def __init__(self, ek_event: EKEvent) -> None:
+        self.ek_event = ek_event
+        self.original_span = None
+
+    def _remember_span(self) -> None:
+        if self.original_span is None and self.ek_event.eventIdentifier():
+            self.original_span = event_span(self.start, self.end)
+
+    @property
+    def identifier(self) -> str:
+        return self.ek_event.eventIdentifier() or ""
+
+    @property
+    def calendar_id(self) -> str:
+        return self.ek_event.calendar().calendarIdentifier()
+
+    @property
+    def title(self) -> str:
+        return self.ek_event.title() or ""
+
+    @title.setter
+    def title(self, value: str) -> None:
+        self.ek_event.setTitle_(value)
+
+    @property
+    def start(self) -> Optional[float]:
+        return _from_nsdate(self.ek_event.startDate())
+
+    @start.setter
+    def start(self, value: Optional[float]) -> None:
+        self._remember_span()
+        self.ek_event.setStartDate_(_to_nsdate(value))
+
+    @property
+    def end(self) -> Optional[float]:
+        return _from_nsdate(self.ek_event.endDate())
+
+    @end.setter
+    def end(self, value: Optional[float]) -> None:
+        self._remember_span()
+        self.ek_event.setEndDate_(_to_nsdate(value))
+
+    @property
+    def location(self) -> str:
+        return self.ek_event.location() or ""
+
+    @location.setter
+    def location(self, value: str) -> None:
+        self.ek_event.setLocation_(value)
+
+    @property
+    def notes(self) -> str:
+        return self.ek_event.notes() or ""
+
+    @notes.setter
+    def notes(self, value: str) -> None:
+        self.ek_event.setNotes_(value)
+
+    @property
+    def all_day(self) -> bool:
+        return bool(self.ek_event.isAllDay())
+
+    @all_day.setter
+    def all_day(self, value: bool) -> None:
+        self.ek_event.setAllDay_(value)
+
+    @property
+    def busy(self) -> bool:
+        return self.ek_event.availability() == EKCalendarEventAvailabilityBusy
+
+    @property
+    def last_modified(self) -> float:
+        return _from_nsdate(self.ek_event.lastModifiedDate()) or 0.0
+
+
+class EventKitBackend(ChangeNotifier):
+    """Backend that reads and writes Calendar.app through EKEventStore."""
+    name = "eventkit"
+
+    def __init__(self, quiet: bool = False, observe: bool = True) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            quiet: If True, suppresses most console output
+            observe: Subscribe to store change notifications (off for worker handles)
+        """
+        super().__init__()
+        self.quiet = quiet
+        self.observe = observe
+        self._observer = None
+        self.event_store = EKEventStore.alloc().init()
+        if observe:
+            self._observe_store()
+
+    def _observe_store(self) -> None:
+        """Subscribe to EKEventStoreChangedNotification for the current store"""
+        self._observer = NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            EKEventStoreChangedNotification, self.event_store, None, self._store_changed
+        )
+
+    def _unobserve_store(self) -> None:
+        if self._observer is not None:
+            NSNotificationCenter.defaultCenter().removeObserver_(self._observer)
+            self._observer = None
+
+    def _store_changed(self, notification: Any) -> None:
+        self._notify(self._describe_change(notification))
+
+    def _describe_change(self, notification: Any) -> StoreChange:
+        """
+        Work out what an EKEventStoreChangedNotification covers.
+
+        Changed event IDs in the notification's userInfo are resolved to their
+        calendars, so only those calendars' cached events are dropped. The
+        calendar list is only reloaded when a calendar or account changed, or
+        when the notification does not say what changed. Events that no longer
+        resolve (deleted elsewhere) widen the change to every calendar's events.
+
+        Args:
+            notification: The NSNotification received
+
+        Returns:
+            Description of the change
+        """
+        try:
+            info = notification.userInfo()
+            object_ids = info.get(_CHANGED_OBJECT_IDS) if info is not None else None
+        except Exception:
+            object_ids = None
+        if not object_ids:
+            return StoreChange(calendars_changed=True)
+
+        calendar_ids = set()
+        unresolved = False
+        for object_id in object_ids:
+            entity = _entity_name(object_id)
+            if entity in _CALENDAR_ENTITIES:
+                return StoreChange(calendars_changed=True)
+            try:
+                changed = self.event_store.publicObjectWithObjectID_(object_id)
+            except Exception:
+                changed = None
+            if changed is not None and not changed.respondsToSelector_("startDate"):
+                # Resolved to something other than an event (e.g. a calendar)
+                return StoreChange(calendars_changed=True)
+            calendar = changed.calendar() if changed is not None else None
+            if calendar is not None:
+                calendar_ids.add(calendar.calendarIdentifier())
+            elif entity:
+                unresolved = True
+            else:
+                # Neither the ID nor the object says what this is
+                return StoreChange(calendars_changed=True)
+        if unresolved:
+            return StoreChange()
+        # The events' previous dates are unknown, so their calendars are dropped whole
+        return StoreChange(calendar_ids=frozenset(calendar_ids))
+
+    def request_access(self, timeout: float = 15.0) -> bool:
+        # Authorization result holder
+        result = {"authorized": False, "complete": False}
+
+        # Define callback
+        def auth_callback(granted: bool, error: Any) -> None:
+            result["authorized"] = granted
+            result["complete"] = True
+            if error:
+                logger.error(f"Calendar authorization error: {error}")
+
+        # Request access to calendars
+        self.event_store.requestAccessToEntityType_completion_(EKEntityTypeEvent, auth_callback)
+
+        # Wait for authorization callback to complete
+        start_time = time.time()
+        while not result["complete"]:
+            # Run the run loop for a short time to process callbacks
+            pump_run_loop(0.1)
+
+            # Check for timeout
+            if time.time() - start_time > timeout:
+                logger.warning("Timed out waiting for authorization")
+                break
+
+        return bool(result["authorized"])
+
+    def reset(self) -> None:
+        self._unobserve_store()
+        self._drop_staged_changes()
+        self.event_store = EKEventStore.alloc().init()
+        if self.observe:
+            self._observe_store()
+
+    def close(self) -> None:
+        self._unobserve_store()
+
+    def worker_handle(self) -> "EventKitBackend":
+        # Each worker queries its own EKEventStore; access is granted per app
+        return EventKitBackend(quiet=self.quiet, observe=False)
+
+    def calendars(self) -> List[CalendarInfo]:
+        calendars = self.event_store.calendarsForEntityType_(EKEntityTypeEvent)
+        if calendars is None:
+            raise BackendError("EventKit returned no calendars")
+        result = []
+        for calendar in calendars:
+            source = calendar.source()
+            result.append(CalendarInfo(
+                identifier=calendar.calendarIdentifier(),
+                title=calendar.title(),
+                source=source.title() if source else "",
+                allows_modifications=bool(calendar.allowsContentModifications())
+            ))
+        return result
+
+    def events_in_range(
+        self,
+        start: float,
+        end: float,
+        calendar_ids: Optional[List[str]] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[EventHandle]:
+        calendars = None  # All calendars
+        if calendar_ids is not None:
+            calendars = [
+                calendar for calendar in
+                (self.event_store.calendarWithIdentifier_(cid) for cid in calendar_ids)
+                if calendar is not None
+            ]
+            if not calendars:
+                return []
+
+        # Create predicate for events
+        with PHASE_SECONDS.time(phase="predicate"):
+            predicate = self.event_store.predicateForEventsWithStartDate_endDate_calendars_(
+                _to_nsdate(start), _to_nsdate(end), calendars
+            )
+
+        # Get events matching the predicate
+        with PHASE_SECONDS.time(phase="fetch"):
+            events = self.event_store.eventsMatchingPredicate_(predicate) or []
+        return [EventKitEvent(event) for event in events]
+
+    def event_with_identifier(self, event_id: str) -> Optional[EventHandle]:
+        event = self.event_store.eventWithIdentifier_(event_id)
+        return EventKitEvent(event) if event else None
+
+    def new_event(self, calendar_id: str) -> EventHandle:
+        calendar = self.event_store.calendarWithIdentifier_(calendar_id)
+        if calendar is None:
+            raise BackendError(f"Unknown calendar '{calendar_id}'")
+        event = EKEvent.eventWithEventStore_(self.event_store)
+        event.setCalendar_(calendar)
+        return EventKitEvent(event)
+
+    def save_event(self, event: EventHandle, commit: bool = True) -> None:
+        success, error = self.event_store.saveEvent_span_commit_error_(
+            event.ek_event, EKSpanThisEvent, commit, None
+        )
+        if not success:
+            raise BackendError(error.localizedDescription() if error else "Unknown error")
+        spans = (event.original_span, event_span(event.start, event.end))
+        event.original_span = None
+        self._notify_write(StoreChange(
+            calendar_ids=frozenset([event.calendar_id]),
+            ranges=tuple(span for span in spans if span is not None)
+        ), commit)
+
+    def remove_event(self, event: EventHandle, commit: bool = True) -> None:
+        calendar_id = event.calendar_id
+        span = event.original_span or event_span(event.start, event.end)
+        success, error = self.event_store.removeEvent_span_commit_error_(
+            event.ek_event, EKSpanThisEvent, commit, None
+        )
+        if not success:
+            raise BackendError(error.localizedDescription() if error else "Unknown error")
+        self._notify_write(StoreChange(
+            calendar_ids=frozenset([calendar_id]),
+            ranges=(span,) if span else None
+        ), commit)
+
+    def commit(self) -> None:
+        success, error = self.event_store.commit_(None)
+        if not success:
+            raise BackendError(error.localizedDescription() if error else "Unknown error")
+        self._notify_committed()
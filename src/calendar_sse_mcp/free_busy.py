@@ -0,0 +1,229 @@
+"""
+Free/busy computation over epoch-second arrays.
+
+Busy intervals are clipped to the query window, sorted by start and swept
+once with a running maximum of their ends, so merging n events is a
+handful of vectorized NumPy passes rather than a Python loop. Meeting
+slots are then found on a minute-resolution availability bitmap built from
+the merged blocks and the working-hours constraints, and proposed events
+are checked for conflicts with a sweep line.
+"""
+import datetime
+import heapq
+from typing import List, Optional, Sequence, Set, Tuple, Iterable
+
+import numpy as np
+
+
+def merge_busy(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    window_start: float,
+    window_end: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge overlapping or touching intervals inside a window.
+
+    Args:
+        starts: Interval starts (epoch seconds)
+        ends: Interval ends (epoch seconds)
+        window_start: Window start; intervals are clipped to it
+        window_end: Window end; intervals are clipped to it
+
+    Returns:
+        (block_starts, block_ends) of the merged busy blocks, in order
+    """
+    starts = np.clip(np.asarray(starts, dtype=np.float64), window_start, window_end)
+    ends = np.clip(np.asarray(ends, dtype=np.float64), window_start, window_end)
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if starts.size == 0:
+        return starts, ends
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+
+    # running_end[i] is the end of the block that interval i belongs to so far;
+    # a new block begins wherever an interval starts after everything before it ended
+    running_end = np.maximum.accumulate(ends)
+    first = np.concatenate(([0], np.flatnonzero(starts[1:] > running_end[:-1]) + 1))
+    last = np.concatenate((first[1:] - 1, [starts.size - 1]))
+    return starts[first], running_end[last]
+
+
+def free_gaps(
+    block_starts: np.ndarray,
+    block_ends: np.ndarray,
+    window_start: float,
+    window_end: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the free gaps between merged busy blocks.
+
+    Args:
+        block_starts: Starts of merged, ordered busy blocks
+        block_ends: Ends of merged, ordered busy blocks
+        window_start: Window start
+        window_end: Window end
+
+    Returns:
+        (gap_starts, gap_ends) of the free time in the window, in order
+    """
+    gap_starts = np.concatenate(([window_start], block_ends))
+    gap_ends = np.concatenate((block_starts, [window_end]))
+    keep = gap_ends > gap_starts
+    return gap_starts[keep], gap_ends[keep]
+
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def parse_weekdays(days: Iterable[str]) -> Set[int]:
+    """
+    Convert weekday names to numbers (Monday is 0).
+
+    Args:
+        days: Full or abbreviated English day names, case-insensitive
+
+    Returns:
+        Set of weekday numbers
+
+    Raises:
+        ValueError: If a name is not a weekday
+    """
+    result = set()
+    for day in days:
+        name = day.strip().lower()
+        matches = [i for i, weekday in enumerate(WEEKDAYS) if len(name) >= 2 and weekday.startswith(name)]
+        if len(matches) != 1:
+            raise ValueError(f"Unknown weekday: {day}")
+        result.add(matches[0])
+    return result
+
+
+def find_slots(
+    block_starts: np.ndarray,
+    block_ends: np.ndarray,
+    window_start: float,
+    window_end: float,
+    duration_minutes: int,
+    work_start: datetime.time,
+    work_end: datetime.time,
+    weekdays: Set[int],
+    buffer_minutes: int = 0,
+    step_minutes: int = 15,
+    preferred_days: Optional[Set[int]] = None,
+    limit: int = 5
+) -> List[Tuple[float, float]]:
+    """
+    Find free slots of a given length on a minute-resolution availability bitmap.
+
+    The bitmap starts at local midnight of the window's first day. Minutes
+    are available if they fall inside working hours on an allowed weekday,
+    inside the window, and outside every busy block widened by the buffer.
+    Each free run then yields back-to-back slots whose starts are aligned
+    to ``step_minutes`` on the local clock.
+
+    Args:
+        block_starts: Starts of merged busy blocks (epoch seconds)
+        block_ends: Ends of merged busy blocks (epoch seconds)
+        window_start: Earliest slot start (epoch seconds)
+        window_end: Latest slot end (epoch seconds)
+        duration_minutes: Slot length
+        work_start: Start of the working day (local time)
+        work_end: End of the working day (local time)
+        weekdays: Allowed weekday numbers (Monday is 0)
+        buffer_minutes: Free time required before and after every busy block
+        step_minutes: Slot start alignment
+        preferred_days: Weekdays whose slots are ranked first
+        limit: Maximum number of slots to return
+
+    Returns:
+        Up to ``limit`` (start, end) pairs in epoch seconds, preferred days
+        first and otherwise earliest first
+    """
+    first_day = datetime.datetime.fromtimestamp(window_start).date()
+    last_day = datetime.datetime.fromtimestamp(window_end).date()
+    origin = datetime.datetime.combine(first_day, datetime.time()).timestamp()
+    size = int(np.ceil((window_end - origin) / 60))
+    if size <= 0 or duration_minutes <= 0:
+        return []
+
+    def minute(timestamp: np.ndarray) -> np.ndarray:
+        return np.clip((timestamp - origin) // 60, 0, size).astype(np.int64)
+
+    # +1 where an available stretch opens, -1 where it closes
+    delta = np.zeros(size + 1, dtype=np.int32)
+    day = first_day
+    while day <= last_day:
+        if day.weekday() in weekdays:
+            opens = datetime.datetime.combine(day, work_start).timestamp()
+            closes = datetime.datetime.combine(day, work_end).timestamp()
+            delta[minute(np.array([opens]))] += 1
+            delta[minute(np.array([closes]))] -= 1
+        day += datetime.timedelta(days=1)
+    available = np.cumsum(delta[:-1]) > 0
+    available[:int(np.ceil((window_start - origin) / 60))] = False
+
+    # Busy minutes are rounded outwards so partial minutes count as busy
+    buffer = buffer_minutes * 60
+    busy_delta = np.zeros(size + 1, dtype=np.int32)
+    np.add.at(busy_delta, minute(np.asarray(block_starts) - buffer), 1)
+    np.add.at(busy_delta, minute(np.asarray(block_ends) + buffer + 59), -1)
+    available &= np.cumsum(busy_delta[:-1]) == 0
+    available[minute(np.array([window_end]))[0]:] = False
+
+    edges = np.diff(np.concatenate(([0], available.view(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    stride = -(-duration_minutes // step_minutes) * step_minutes
+    slots = []
+    for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+        first = -(-run_start // step_minutes) * step_minutes
+        for start in range(first, run_end - duration_minutes + 1, stride):
+            slots.append((origin + start * 60, origin + (start + duration_minutes) * 60))
+
+    if preferred_days:
+        # Stable sort keeps time order within each group
+        slots.sort(key=lambda slot: datetime.datetime.fromtimestamp(slot[0]).weekday() not in preferred_days)
+    return slots[:limit]
+
+
+def overlap_pairs(
+    starts: Sequence[float],
+    ends: Sequence[float],
+    probes: Sequence[bool]
+) -> List[Tuple[int, int]]:
+    """
+    Find the intervals overlapping each probe interval in one sweep.
+
+    Intervals are visited by start time while a heap holds the ones still
+    open, so each interval is only compared with the intervals it overlaps.
+    Touching intervals (one ends when the other starts) do not overlap.
+
+    Args:
+        starts: Interval starts
+        ends: Interval ends
+        probes: True for the intervals whose overlaps are wanted
+
+    Returns:
+        (probe, other) index pairs; two overlapping probes give both orders
+    """
+    pairs: List[Tuple[int, int]] = []
+    active: List[Tuple[float, int]] = []
+    for i in sorted(range(len(starts)), key=starts.__getitem__):
+        start = starts[i]
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, j in active:
+            if ends[i] <= starts[j]:
+                # An empty interval at the other's start does not overlap it
+                continue
+            if probes[i]:
+                pairs.append((i, j))
+            if probes[j]:
+                pairs.append((j, i))
+        if ends[i] > start:
+            heapq.heappush(active, (ends[i], i))
+    return pairs
@@ -0,0 +1,213 @@
+"""
+Health tracking for CalendarStore.
+
+The request path only reads the current state; probing and refreshing the
+backend happen on real failures, after wall-clock gaps that suggest the Mac
+slept, and from a background probe thread.
+"""
+import enum
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HealthState(str, enum.Enum):
+    """States of the calendar store"""
+    HEALTHY = "healthy"
+    SUSPECT = "suspect"
+    REFRESHING = "refreshing"
+    FAILED = "failed"
+
+
+class HealthMonitor:
+    """
+    State machine deciding when the calendar backend must be probed or refreshed.
+
+    Transitions:
+        HEALTHY -> SUSPECT     operation failure, clock gap, or failed probe
+        SUSPECT -> HEALTHY     probe succeeds
+        SUSPECT -> REFRESHING  probe fails
+        REFRESHING -> HEALTHY  refresh succeeds
+        REFRESHING -> FAILED   refresh fails
+        FAILED -> REFRESHING   next recovery attempt after ``retry_interval``
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], bool],
+        refresh: Callable[[], bool],
+        probe_interval: float = 60.0,
+        sleep_gap: float = 30.0,
+        retry_interval: float = 5.0
+    ) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            probe: Cheap check returning True if the backend works
+            refresh: Re-create the backend handle and re-authorize, returning True on success
+            probe_interval: Seconds between background probes (0 disables the probe thread)
+            sleep_gap: Wall-clock time exceeding monotonic time by this many seconds marks the store suspect
+            retry_interval: Minimum seconds between refresh attempts while failed
+        """
+        self._probe = probe
+        self._refresh = refresh
+        self.probe_interval = probe_interval
+        self.sleep_gap = sleep_gap
+        self.retry_interval = retry_interval
+
+        self._state = HealthState.FAILED
+        self._lock = threading.RLock()
+        # Separate from _lock so the request path never waits for a running probe
+        self._clock_lock = threading.Lock()
+        self._clock = (time.time(), time.monotonic())
+        self._last_attempt = 0.0
+        self._last_error: Optional[str] = None
+        self._counters = {"probes": 0, "probe_failures": 0, "refreshes": 0, "refresh_failures": 0, "clock_gaps": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> HealthState:
+        """Current state (a single attribute read)"""
+        return self._state
+
+    def _set_state(self, state: HealthState, reason: Optional[str] = None) -> None:
+        if state is not self._state:
+            suffix = f": {reason}" if reason else ""
+            level = logging.INFO if state is HealthState.HEALTHY else logging.WARNING
+            logger.log(level, f"Calendar store {self._state.value} -> {state.value}{suffix}")
+        self._state = state
+        if reason:
+            self._last_error = reason
+
+    def mark_healthy(self) -> None:
+        """Record that the backend was (re)authorized successfully"""
+        with self._lock:
+            self._set_state(HealthState.HEALTHY)
+
+    def mark_suspect(self, reason: str) -> None:
+        """Record a real failure; the next request probes before proceeding"""
+        with self._lock:
+            if self._state is HealthState.HEALTHY:
+                self._set_state(HealthState.SUSPECT, reason)
+
+    def mark_failed(self, reason: str) -> None:
+        """Record that the backend cannot be used"""
+        with self._lock:
+            self._set_state(HealthState.FAILED, reason)
+
+    def _clock_jumped(self) -> bool:
+        """Detect wall-clock time passing without monotonic time (system sleep)"""
+        with self._clock_lock:
+            wall, mono = time.time(), time.monotonic()
+            last_wall, last_mono = self._clock
+            self._clock = (wall, mono)
+            jumped = (wall - last_wall) - (mono - last_mono) > self.sleep_gap
+            if jumped:
+                self._counters["clock_gaps"] += 1
+            return jumped
+
+    def ensure_healthy(self) -> bool:
+        """
+        Request-path check.
+
+        Returns immediately while healthy; otherwise probes or refreshes.
+
+        Returns:
+            True if the backend can be used
+        """
+        if self._state is HealthState.HEALTHY:
+            if not self._clock_jumped():
+                return True
+            self.mark_suspect("wall-clock gap suggests the system slept")
+        return self.recover()
+
+    def recover(self) -> bool:
+        """
+        Bring the backend back to a healthy state if possible.
+
+        Returns:
+            True if the backend is healthy afterwards
+        """
+        with self._lock:
+            if self._state is HealthState.HEALTHY:
+                return True
+
+            if self._state is HealthState.SUSPECT and self._run_probe():
+                self._set_state(HealthState.HEALTHY)
+                return True
+
+            if self._state is HealthState.FAILED and time.monotonic() - self._last_attempt < self.retry_interval:
+                return False
+
+            self._set_state(HealthState.REFRESHING)
+            self._last_attempt = time.monotonic()
+            self._counters["refreshes"] += 1
+            try:
+                ok = self._refresh()
+            except Exception as e:
+                ok = False
+                self._last_error = str(e)
+            if ok:
+                self._set_state(HealthState.HEALTHY)
+            else:
+                self._counters["refresh_failures"] += 1
+                self._set_state(HealthState.FAILED, self._last_error or "refresh failed")
+            return ok
+
+    def _run_probe(self) -> bool:
+        self._counters["probes"] += 1
+        try:
+            ok = bool(self._probe())
+        except Exception as e:
+            ok = False
+            self._last_error = str(e)
+        if not ok:
+            self._counters["probe_failures"] += 1
+        return ok
+
+    def probe_now(self) -> bool:
+        """
+        Probe the backend once, recovering if the probe fails.
+
+        Returns:
+            True if the backend is healthy afterwards
+        """
+        with self._lock:
+            if self._clock_jumped():
+                self.mark_suspect("wall-clock gap suggests the system slept")
+            elif self._state is HealthState.HEALTHY:
+                if self._run_probe():
+                    return True
+                self.mark_suspect("background probe failed")
+        return self.recover()
+
+    def start(self) -> None:
+        """Start the background probe thread (no-op if disabled or running)"""
+        if self.probe_interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._probe_loop, name="calendar-health-probe", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background probe thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _probe_loop(self) -> None:
+        while not self._stop.wait(self.probe_interval):
+            try:
+                self.probe_now()
+            except Exception as e:
+                logger.warning(f"Health probe error: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current state, counters and last error"""
+        return {"state": self._state.value, "last_error": self._last_error, **self._counters}
@@ -2,12 +2,15 @@
 Utilities for dynamically managing macOS Launch Agents for the Calendar MCP server
 """
 import os
+import plistlib
 import subprocess
 import sys
 import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List
 
+from .log_tail import tail_lines
+
 
 def find_python_executable() -> Optional[str]:
     """
@@ -152,7 +155,9 @@ def generate_launch_agent_plist(
     env_vars_dict = {
         "PATH": "/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin",
         "SERVER_PORT": str(port),
-        "SERVER_HOST": host
+        "SERVER_HOST": host,
+        # Structured, size-rotated server log (see logs.py); stdout/stderr keep only stray output
+        "CALENDAR_LOG_FILE": f"{log_dir}/{agent_name}.log"
     }
     
     # Add additional environment variables
@@ -279,13 +284,40 @@ def create_launch_agent(
         return False, f"Error creating Launch Agent: {str(e)}", None
 
 
-def check_launch_agent(agent_name: Optional[str] = None, show_logs: bool = False) -> Tuple[bool, Dict[str, Any]]:
+def server_log_path(plist_path: Path, log_dir: str, agent_name: str) -> Path:
+    """
+    Find the structured server log of an installed launch agent
+    
+    Args:
+        plist_path: Path of the agent's plist
+        log_dir: Log directory used when the plist does not name the file
+        agent_name: Name of the agent
+        
+    Returns:
+        CALENDAR_LOG_FILE from the plist's environment, or the default location
+    """
+    try:
+        with open(plist_path, "rb") as f:
+            environment = plistlib.load(f).get("EnvironmentVariables", {})
+        if environment.get("CALENDAR_LOG_FILE"):
+            return Path(environment["CALENDAR_LOG_FILE"]).expanduser()
+    except (OSError, plistlib.InvalidFileException, AttributeError):
+        pass
+    return Path(log_dir) / f"{agent_name}.log"
+
+
+def check_launch_agent(
+    agent_name: Optional[str] = None,
+    show_logs: bool = False,
+    log_lines: int = 10
+) -> Tuple[bool, Dict[str, Any]]:
     """
     Check the status of an installed launch agent
     
     Args:
         agent_name: Optional custom name for the agent
         show_logs: Whether to include log file contents in the report
+        log_lines: Number of lines included from the end of each log file
         
     Returns:
         Tuple of (is_loaded, status_info)
@@ -302,8 +334,10 @@ def check_launch_agent(agent_name: Optional[str] = None, show_logs: bool = False
         "log_dir": paths["log_dir"],
         "stdout_log": None,
         "stderr_log": None,
+        "server_log": None,
         "stdout_content": None,
         "stderr_content": None,
+        "server_content": None,
         "process_info": None
     }
     
@@ -342,24 +376,17 @@ def check_launch_agent(agent_name: Optional[str] = None, show_logs: bool = False
     log_dir = paths["log_dir"]
     stdout_log = Path(log_dir) / f"{name}-stdout.log"
     stderr_log = Path(log_dir) / f"{name}-stderr.log"
-    
-    if stdout_log.exists():
-        status["stdout_log"] = str(stdout_log)
-        if show_logs:
-            try:
-                with open(stdout_log, "r") as f:
-                    status["stdout_content"] = f.readlines()[-10:]  # Last 10 lines
-            except Exception:
-                status["stdout_content"] = ["Could not read log file"]
-    
-    if stderr_log.exists():
-        status["stderr_log"] = str(stderr_log)
-        if show_logs and stderr_log.stat().st_size > 0:
-            try:
-                with open(stderr_log, "r") as f:
-                    status["stderr_content"] = f.readlines()[-10:]  # Last 10 lines
-            except Exception:
-                status["stderr_content"] = ["Could not read log file"]
+    server_log = server_log_path(plist_path, log_dir, name)
+    
+    for key, path in (("stdout", stdout_log), ("stderr", stderr_log), ("server", server_log)):
+        if path.exists():
+            status[f"{key}_log"] = str(path)
+            if show_logs and path.stat().st_size > 0:
+                try:
+                    # Read backwards from the end: cost depends on log_lines, not the file size
+                    status[f"{key}_content"] = tail_lines(path, log_lines)
+                except Exception:
+                    status[f"{key}_content"] = ["Could not read log file"]
     
     return status["loaded"], status
 
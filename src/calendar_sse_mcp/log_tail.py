@@ -0,0 +1,280 @@
+"""
+Reading the server's log files without loading them.
+
+``reverse_lines`` reads a file backwards in fixed-size blocks from its end,
+so the last N lines cost O(N) I/O however large the file is. ``follow``
+streams lines appended to one or more files by polling their size and
+inode, and keeps going across the renames done by log rotation.
+``LogFilter`` selects JSON-lines records (see ``logs.py``) by level and
+time; lines that are not JSON records (stdout/stderr output) carry neither
+and only pass when no level or time is asked for.
+"""
+import datetime
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Iterable, Tuple, Callable
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _decode(line: bytes) -> str:
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+def reverse_lines(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """
+    Yield the lines of a file from last to first.
+
+    Args:
+        path: File to read
+        block_size: Bytes read per seek from the end
+
+    Returns:
+        Iterator over lines without their line endings, newest first
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""
+        at_end = True
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + partial).split(b"\n")
+            # The first piece may continue in the previous block
+            partial = lines.pop(0)
+            if at_end and lines and lines[-1] == b"":
+                lines.pop()
+            at_end = False
+            for line in reversed(lines):
+                yield _decode(line)
+        if partial or not at_end:
+            yield _decode(partial)
+
+
+def parse_record(line: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON log record on a line, or None for any other text"""
+    if not line.startswith("{"):
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) and "level" in record else None
+
+
+def _aware(moment: datetime.datetime) -> datetime.datetime:
+    return moment if moment.tzinfo else moment.astimezone()
+
+
+class LogFilter:
+    """Selects log lines by minimum level and time window"""
+
+    def __init__(
+        self,
+        min_level: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None
+    ) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            min_level: Lowest level kept, e.g. "warning" (None keeps every level)
+            since: Keep records logged at or after this time (naive means local)
+            until: Keep records logged at or before this time (naive means local)
+        """
+        self.min_level = logging.getLevelName(min_level.upper()) if min_level else None
+        self.since = _aware(since) if since else None
+        self.until = _aware(until) if until else None
+
+    @property
+    def active(self) -> bool:
+        """True if any criterion is set"""
+        return self.min_level is not None or self.since is not None or self.until is not None
+
+    def _record_time(self, record: Dict[str, Any]) -> Optional[datetime.datetime]:
+        try:
+            return _aware(datetime.datetime.fromisoformat(record["time"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def match(self, line: str) -> bool:
+        """True if the line passes every criterion"""
+        if not self.active:
+            return True
+        record = parse_record(line)
+        if record is None:
+            return False
+        if self.min_level is not None:
+            level = logging.getLevelName(str(record["level"]).upper())
+            if not isinstance(level, int) or level < self.min_level:
+                return False
+        if self.since is not None or self.until is not None:
+            logged = self._record_time(record)
+            if logged is None:
+                return False
+            if self.since is not None and logged < self.since:
+                return False
+            if self.until is not None and logged > self.until:
+                return False
+        return True
+
+    def before_window(self, line: str) -> bool:
+        """True if the line is a record older than ``since`` (older lines can be skipped)"""
+        if self.since is None:
+            return False
+        record = parse_record(line)
+        logged = self._record_time(record) if record else None
+        return logged is not None and logged < self.since
+
+
+def tail_lines(path: Path, count: int, log_filter: Optional[LogFilter] = None) -> List[str]:
+    """
+    Return the last ``count`` lines of a file that pass a filter.
+
+    The file is read backwards and only until enough lines are found, or,
+    with a ``since`` time, until a record older than it is reached.
+
+    Args:
+        path: File to read
+        count: Number of lines wanted
+        log_filter: Optional filter the lines must pass
+
+    Returns:
+        The lines in file order, oldest first
+    """
+    lines: List[str] = []
+    if count <= 0:
+        return lines
+    for line in reverse_lines(path):
+        if log_filter is not None:
+            if log_filter.before_window(line):
+                break
+            if not log_filter.match(line):
+                continue
+        lines.append(line)
+        if len(lines) >= count:
+            break
+    lines.reverse()
+    return lines
+
+
+class _FollowedFile:
+    """Read position in one followed file"""
+
+    def __init__(self, path: Path, from_start: bool) -> None:
+        self.path = path
+        self.file = None
+        self.inode: Optional[int] = None
+        self.partial = b""
+        self._open(from_start)
+
+    def _open(self, from_start: bool) -> None:
+        try:
+            self.file = open(self.path, "rb")
+        except OSError:
+            self.file = None
+            return
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        if not from_start:
+            self.file.seek(0, os.SEEK_END)
+
+    def _drain(self) -> List[str]:
+        data = self.file.read()
+        if not data:
+            return []
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        return [_decode(line) for line in lines]
+
+    def poll(self) -> List[str]:
+        """Return the complete lines appended since the last poll"""
+        if self.file is None:
+            # Not created yet, or between a rotation's rename and the new file
+            self._open(from_start=True)
+            return self._drain() if self.file else []
+
+        lines = self._drain()
+        try:
+            current = os.stat(self.path)
+        except OSError:
+            return lines
+        if current.st_ino != self.inode:
+            # Rotated: the writer may have appended to the old file after the
+            # drain above, so finish it before continuing with the new one
+            lines.extend(self._drain())
+            if self.partial:
+                lines.append(_decode(self.partial))
+                self.partial = b""
+            self.file.close()
+            self._open(from_start=True)
+            if self.file:
+                lines.extend(self._drain())
+        elif current.st_size < self.file.tell():
+            # Truncated in place
+            self.file.seek(0)
+            self.partial = b""
+            lines.extend(self._drain())
+        return lines
+
+    def close(self) -> None:
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+def follow(
+    paths: Iterable[Path],
+    interval: float = 0.5,
+    stop: Optional[Callable[[], bool]] = None
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Stream lines appended to files from now on.
+
+    Polls the files every ``interval`` seconds while they are idle. A file
+    replaced by rotation (new inode) is finished, then read from the start
+    of its replacement; a truncated file is read again from the start.
+    Files that do not exist yet are picked up when they appear.
+
+    Args:
+        paths: Files to follow
+        interval: Seconds between polls when no file grew
+        stop: Called between polls; following ends when it returns True
+
+    Returns:
+        Iterator of (path, line) pairs, until ``stop`` returns True
+    """
+    followed = [_FollowedFile(Path(path), from_start=False) for path in paths]
+    try:
+        while stop is None or not stop():
+            found = False
+            for entry in followed:
+                for line in entry.poll():
+                    found = True
+                    yield entry.path, line
+            if not found:
+                time.sleep(interval)
+    finally:
+        for entry in followed:
+            entry.close()
+
+
+def format_line(line: str) -> str:
+    """Render a JSON log record as one readable line (other text is returned as is)"""
+    record = parse_record(line)
+    if record is None:
+        return line
+    extra = " ".join(
+        f"{key}={value}" for key, value in record.items()
+        if key not in ("time", "level", "logger", "message", "exception")
+    )
+    text = f"{record.get('time', '')} {str(record['level']).upper():<7} {record.get('message', '')}"
+    if extra:
+        text += f"  {extra}"
+    if record.get("exception"):
+        text += "\n" + str(record["exception"])
+    return text
@@ -0,0 +1,207 @@
+"""
+Structured logging for the server.
+
+Modules log through ``logging.getLogger(__name__)``. When the server starts,
+``configure_logging`` routes the package's records through a QueueHandler to
+a QueueListener thread, which writes them as JSON lines to a size-rotated
+file (or stderr), so log I/O never runs on a request thread.
+
+Request-scoped fields (handler name, argument hash, duration, event count)
+are kept in a context variable set by the request handler. A filter copies
+them onto every record at the moment it is logged, on the request thread.
+The package logger never propagates to the root handler FastMCP installs,
+so records are only written where this module sends them. The command-line
+tools call ``configure_cli_logging``, which prints warnings and errors
+(access denied, refresh failures, bad dates) as plain lines on stderr and
+keeps per-request records out of their output.
+"""
+import atexit
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+
+PACKAGE_LOGGER = "calendar_sse_mcp"
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_request_fields: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "calendar_request_fields", default=None
+)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@contextmanager
+def request_context(**fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Attach fields to every record logged inside the block.
+
+    Yields:
+        The field dictionary; entries added to it (e.g. by ``note_request``)
+        appear on later records
+    """
+    current = dict(_request_fields.get() or {})
+    current.update(fields)
+    token = _request_fields.set(current)
+    try:
+        yield current
+    finally:
+        _request_fields.reset(token)
+
+
+def note_request(**counts: int) -> None:
+    """Add to numeric fields of the current request context (no-op outside one)"""
+    fields = _request_fields.get()
+    if fields is not None:
+        for key, value in counts.items():
+            fields[key] = fields.get(key, 0) + value
+
+
+class RequestContextFilter(logging.Filter):
+    """Copies the current request fields onto records (runs on the thread that logs)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        fields = _request_fields.get()
+        if fields:
+            for key, value in fields.items():
+                if not hasattr(record, key):
+                    setattr(record, key, value)
+        return True
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler keeping the traceback as text instead of folding it into the message"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _CliHandler(logging.StreamHandler):
+    """Plain stderr handler installed by ``configure_cli_logging``"""
+
+
+def configure_cli_logging(level: int = logging.WARNING) -> None:
+    """
+    Print the package's records at or above a level as plain lines on stderr.
+
+    Used by the command-line tools; ``configure_logging`` replaces it.
+
+    Args:
+        level: Minimum level printed
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        if isinstance(handler, _CliHandler):
+            logger.removeHandler(handler)
+    handler = _CliHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+def configure_logging(
+    log_file: Optional[str] = None,
+    level: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    backups: Optional[int] = None
+) -> Optional[Path]:
+    """
+    Route the package's log records to a background JSON-lines writer.
+
+    Settings not given are read from CALENDAR_LOG_FILE (default: stderr),
+    CALENDAR_LOG_LEVEL (default: info), CALENDAR_LOG_MAX_BYTES (default:
+    10 MB) and CALENDAR_LOG_BACKUPS (default: 5). Calling it again replaces
+    the previous configuration.
+
+    Args:
+        log_file: File to write; rotated when it reaches ``max_bytes``
+        level: Minimum level name, e.g. "debug" or "warning"
+        max_bytes: Size at which the file is rotated
+        backups: Rotated files kept
+
+    Returns:
+        Path of the log file, or None when logging to stderr
+    """
+    global _listener
+    log_file = log_file or os.environ.get("CALENDAR_LOG_FILE") or None
+    level = (level or os.environ.get("CALENDAR_LOG_LEVEL") or "info").upper()
+    max_bytes = max_bytes if max_bytes is not None else int(os.environ.get("CALENDAR_LOG_MAX_BYTES") or 10 * 1024 * 1024)
+    backups = backups if backups is not None else int(os.environ.get("CALENDAR_LOG_BACKUPS") or 5)
+
+    path: Optional[Path] = None
+    if log_file:
+        path = Path(log_file).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        target: logging.Handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+    else:
+        target = logging.StreamHandler(sys.stderr)
+    target.setFormatter(JsonFormatter())
+
+    stop_logging()
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(records)
+    queue_handler.addFilter(RequestContextFilter())
+
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        if isinstance(handler, (logging.handlers.QueueHandler, _CliHandler)):
+            logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(records, target, respect_handler_level=True)
+    _listener.start()
+    return path
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
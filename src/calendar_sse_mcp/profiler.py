@@ -0,0 +1,222 @@
+"""
+Sampling profiler for individual tool and resource calls.
+
+A configurable fraction of handler calls runs under cProfile. The slowest
+profiles are kept on disk (one ``.prof`` file in pstats format plus a
+``.json`` description per call, tagged with the handler name and a hash of
+its arguments), so a slow production call can be examined later with
+``calendar-sse server profiles`` without attaching a debugger.
+
+cProfile only sees the calling thread: work the call waits for on another
+thread (e.g. EventKit queries on the backend worker thread) shows up as
+time spent waiting on a future.
+"""
+import cProfile
+import hashlib
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PROFILE_DIR = Path.home() / ".calendar-sse-mcp" / "profiles"
+
+# Only one profiler can be active per process on Python 3.12+ (sys.monitoring)
+_ACTIVE = threading.Lock()
+
+
+def arguments_hash(args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Short stable hash identifying a call's arguments"""
+    encoded = json.dumps([args, kwargs], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+class CallProfiler:
+    """Profiles a sample of calls and keeps the slowest profiles on disk"""
+
+    def __init__(self, rate: float = 0.0, directory: Optional[Path] = None, keep: int = 20) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            rate: Fraction of calls to profile, from 0 (disabled) to 1 (every call)
+            directory: Where profiles are kept (default: ~/.calendar-sse-mcp/profiles)
+            keep: Number of slowest profiles kept
+        """
+        self.rate = rate
+        self.directory = directory or DEFAULT_PROFILE_DIR
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._kept: Optional[List[Dict[str, Any]]] = None
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        directory: Optional[Path] = None,
+        keep: Optional[int] = None
+    ) -> None:
+        """
+        Set the sampling configuration.
+
+        Settings not given are read from SERVER_PROFILE_RATE,
+        SERVER_PROFILE_DIR and SERVER_PROFILE_KEEP.
+        """
+        if rate is None:
+            rate = float(os.environ.get("SERVER_PROFILE_RATE") or 0)
+        if directory is None:
+            directory = Path(os.environ["SERVER_PROFILE_DIR"]).expanduser() if os.environ.get("SERVER_PROFILE_DIR") else None
+        if keep is None:
+            keep = int(os.environ.get("SERVER_PROFILE_KEEP") or 20)
+        with self._lock:
+            self.rate = min(max(rate, 0.0), 1.0)
+            self.directory = directory or DEFAULT_PROFILE_DIR
+            self.keep = max(keep, 1)
+            self._kept = None
+
+    def run(self, name: str, args_hash: str, fn: Callable[[], T]) -> T:
+        """
+        Call ``fn``, profiling it if this call is sampled.
+
+        A sampled call runs unprofiled while another call is being profiled,
+        so sampling never makes a call fail.
+
+        Args:
+            name: Handler name the profile is tagged with
+            args_hash: Hash of the call's arguments (see ``arguments_hash``)
+            fn: The call
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        if self.rate <= 0 or random.random() >= self.rate:
+            return fn()
+        if not _ACTIVE.acquire(blocking=False):
+            return fn()
+
+        try:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Another profiling tool (e.g. a debugger) is active
+                logger.debug(f"Not profiling {name}: {e}")
+                return fn()
+            started = time.time()
+            clock = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                profile.disable()
+                try:
+                    self._record(name, args_hash, started, time.perf_counter() - clock, profile)
+                except OSError as e:
+                    logger.warning(f"Could not save profile of {name}: {e}")
+        finally:
+            _ACTIVE.release()
+
+    def profiles(self) -> List[Dict[str, Any]]:
+        """
+        List the kept profiles, slowest first.
+
+        Returns:
+            Dictionaries with id, handler, args_hash, started, duration and path
+        """
+        with self._lock:
+            return [dict(entry) for entry in self._load()]
+
+    def report(self, profile_id: str, sort: str = "cumulative", lines: int = 30) -> str:
+        """
+        Format a kept profile as a pstats table.
+
+        Args:
+            profile_id: Profile identifier (see ``profiles``)
+            sort: pstats sort key, e.g. "cumulative" or "tottime"
+            lines: Number of functions listed
+
+        Returns:
+            The formatted statistics
+
+        Raises:
+            KeyError: If no profile has this identifier
+        """
+        entry = next((entry for entry in self.profiles() if entry["id"] == profile_id), None)
+        if entry is None:
+            raise KeyError(profile_id)
+        stream = io.StringIO()
+        pstats.Stats(entry["path"], stream=stream).sort_stats(sort).print_stats(lines)
+        return stream.getvalue()
+
+    def clear(self) -> int:
+        """
+        Delete every kept profile.
+
+        Returns:
+            Number of profiles deleted
+        """
+        with self._lock:
+            entries = self._load()
+            for entry in entries:
+                self._delete(entry)
+            self._kept = []
+            return len(entries)
+
+    def _load(self) -> List[Dict[str, Any]]:
+        """Read the kept profile descriptions (lock held)"""
+        if self._kept is None:
+            kept = []
+            if self.directory.is_dir():
+                for meta_path in self.directory.glob("*.json"):
+                    try:
+                        entry = json.loads(meta_path.read_text(encoding="utf-8"))
+                    except (OSError, ValueError):
+                        continue
+                    if Path(entry.get("path", "")).exists():
+                        kept.append(entry)
+            kept.sort(key=lambda entry: entry["duration"], reverse=True)
+            self._kept = kept
+        return self._kept
+
+    def _record(self, name: str, args_hash: str, started: float, duration: float, profile: cProfile.Profile) -> None:
+        with self._lock:
+            kept = self._load()
+            if len(kept) >= self.keep and duration <= kept[-1]["duration"]:
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile_id = f"{time.strftime('%Y%m%dT%H%M%S', time.localtime(started))}-{name}-{uuid.uuid4().hex[:6]}"
+            entry = {
+                "id": profile_id,
+                "handler": name,
+                "args_hash": args_hash,
+                "started": started,
+                "duration": duration,
+                "path": str(self.directory / f"{profile_id}.prof")
+            }
+            profile.dump_stats(entry["path"])
+            (self.directory / f"{profile_id}.json").write_text(json.dumps(entry), encoding="utf-8")
+            kept.append(entry)
+            kept.sort(key=lambda item: item["duration"], reverse=True)
+            while len(kept) > self.keep:
+                self._delete(kept.pop())
+
+    def _delete(self, entry: Dict[str, Any]) -> None:
+        path = Path(entry["path"])
+        for stale in (path, path.with_suffix(".json")):
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# Shared by the server's handlers and the CLI
+PROFILER = CallProfiler()
+PROFILER.configure()
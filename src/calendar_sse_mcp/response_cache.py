@@ -0,0 +1,127 @@
+"""
+Cache of serialized MCP responses.
+
+Entries hold the final JSON text of a read handler together with the store
+reads it was built from: which calendars and which time span. A change
+notification only drops the entries whose reads it intersects, so editing
+an event in one calendar leaves every other calendar's responses cached.
+Entries also expire after a fixed time, which bounds the staleness of
+responses whose range is relative to "now".
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, List, FrozenSet, Hashable
+
+# One store read: (calendar identifiers or None for all, (start, end) or None for all time)
+ReadScope = Tuple[Optional[FrozenSet[str]], Optional[Tuple[float, float]]]
+
+
+def _intersects(
+    read: ReadScope,
+    calendar_ids: Optional[FrozenSet[str]],
+    ranges: Optional[Tuple[Tuple[float, float], ...]]
+) -> bool:
+    read_ids, span = read
+    if read_ids is not None and calendar_ids is not None and not (read_ids & calendar_ids):
+        return False
+    if span is None or ranges is None:
+        return True
+    return any(start < span[1] and end > span[0] for start, end in ranges)
+
+
+class ResponseCache:
+    """Least-recently-used map from a request key to its JSON response"""
+
+    def __init__(self, max_size: int = 256, ttl: float = 30.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of responses kept (0 disables caching)
+            ttl: Seconds a response stays valid (0 for no expiry)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, List[ReadScope]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Look up a response.
+
+        Returns:
+            The cached JSON text, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (self.ttl > 0 and entry[0] < time.monotonic()):
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: str, reads: List[ReadScope]) -> None:
+        """
+        Store a response, evicting the least recently used entries if full.
+
+        Args:
+            key: Request key
+            value: JSON text
+            reads: Store reads the response was built from; an empty list
+                   means it only depends on the calendar list
+        """
+        if self.max_size <= 0:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value, reads)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        calendar_ids: Optional[FrozenSet[str]] = None,
+        ranges: Optional[Tuple[Tuple[float, float], ...]] = None
+    ) -> None:
+        """
+        Drop the responses built from reads that a change touches.
+
+        Args:
+            calendar_ids: Changed calendars (None for all)
+            ranges: Changed time spans (None for all time)
+        """
+        with self._lock:
+            stale = [
+                key for key, (_, _, reads) in self._entries.items()
+                if any(_intersects(read, calendar_ids, ranges) for read in reads)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidated += len(stale)
+
+    def clear(self) -> None:
+        """Drop all responses"""
+        with self._lock:
+            self._invalidated += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the size, capacity, hit and invalidation counters"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidated": self._invalidated
+        }
@@ -11,20 +11,35 @@ This server provides an interface to Calendar.app on macOS, allowing you to:
 The server uses FastMCP to expose both resources and tools that can be used
 by AI assistants to interact with the user's calendar.
 """
+import asyncio
+import contextlib
+import contextvars
 import datetime
+import functools
 import json
+import logging
 import os
-from typing import Dict, List, Optional, Union, Any
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union, Any, Callable, Awaitable
 import dateparser
 from datetime import datetime, timedelta
-import sys
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
-from .calendar_store import CalendarStore, CalendarStoreError
+from .calendar_store import CONFLICT_MODES, CalendarStore, CalendarStoreError, EventConflictError
+from .event_batch import EventBatch
 from .models import ApiResponse, CalendarEvent, EventCreate, EventUpdate, EventList, CalendarList
 from .date_utils import create_date_range, format_iso
+from .logs import configure_logging, request_context
+from .metrics import REGISTRY, SIZE_BUCKETS
+from .profiler import PROFILER, arguments_hash
+from .single_flight import AsyncSingleFlight
 
+logger = logging.getLogger(__name__)
 
 # Create the MCP server - settings can be passed to the constructor
 mcp = FastMCP(
@@ -44,8 +59,8 @@ def get_calendar_store() -> CalendarStore:
     Get the global calendar store instance with health checking and auto-recreation.
     
     This function implements robust maintenance of the EventKit instance:
-    - Health checks on each access to detect stale/invalid stores
-    - Auto-recreation when authorization expires or system resumes from sleep
+    - A cheap health-state read on each access (see ``health.py``)
+    - Auto-recreation when the store cannot recover by itself
     - Thread-safe access with proper locking
     
     Returns:
@@ -68,28 +83,17 @@ def get_calendar_store() -> CalendarStore:
         if _global_calendar_store is None:
             needs_recreation = True
         else:
-            # Perform health check on existing store
-            try:
-                # Quick health check: try to get calendars list
-                # This will fail if authorization expired or EventKit is stale
-                calendars = _global_calendar_store.get_all_calendars()
-                
-                # Additional check: verify the store is still authorized
-                if not _global_calendar_store.authorized:
-                    print("Calendar store authorization expired, recreating...", file=sys.stderr)
-                    needs_recreation = True
-                    
-            except CalendarStoreError as e:
-                print(f"Calendar store health check failed: {e}, recreating...", file=sys.stderr)
-                needs_recreation = True
-            except Exception as e:
-                print(f"Calendar store health check error: {e}, recreating...", file=sys.stderr)
+            # The store probes and refreshes itself; only a store that cannot
+            # recover is replaced. While healthy this is a single state read.
+            if not _global_calendar_store.health.ensure_healthy():
+                logger.warning(f"Calendar store is {_global_calendar_store.health.state.value}, recreating...")
+                _global_calendar_store.close()
                 needs_recreation = True
         
         # Create or recreate the store if needed
         if needs_recreation:
             try:
-                print("Creating new calendar store instance...", file=sys.stderr)
+                logger.info("Creating new calendar store instance...")
                 _global_calendar_store = CalendarStore(quiet=True)
                 
                 # Verify the new store is working
@@ -98,14 +102,346 @@ def get_calendar_store() -> CalendarStore:
                 
                 # Test basic functionality
                 calendars = _global_calendar_store.get_all_calendars()
-                print(f"Calendar store created successfully with {len(calendars)} calendars", file=sys.stderr)
+                logger.info(f"Calendar store created successfully with {len(calendars)} calendars")
                 
             except Exception as e:
+                if _global_calendar_store is not None:
+                    _global_calendar_store.close()
                 _global_calendar_store = None
                 raise CalendarStoreError(f"Failed to create calendar store: {e}")
         
         return _global_calendar_store
 
+# Handlers run calendar work on a bounded pool so a slow query in one session
+# never blocks the event loop serving the others
+_MAX_CONCURRENCY = max(1, int(os.environ.get("SERVER_MAX_CONCURRENCY") or 4))
+_CALL_TIMEOUT = float(os.environ.get("SERVER_CALL_TIMEOUT") or 30)
+_handler_pool = ThreadPoolExecutor(max_workers=_MAX_CONCURRENCY, thread_name_prefix="calendar-handler")
+
+_REQUESTS = REGISTRY.counter(
+    "calendar_mcp_requests_total", "Tool and resource requests, including ones answered by coalescing", ["handler"]
+)
+_ERRORS = REGISTRY.counter(
+    "calendar_mcp_request_errors_total", "Requests answered with an error or timing out", ["handler"]
+)
+_LATENCY = REGISTRY.histogram(
+    "calendar_mcp_request_duration_seconds", "Request latency including coalescing and the wait for a pool thread", ["handler"]
+)
+_PAYLOAD_BYTES = REGISTRY.histogram(
+    "calendar_mcp_response_bytes", "Size of handler responses (UTF-8)", ["handler"], SIZE_BUCKETS
+)
+_COALESCED = REGISTRY.counter(
+    "calendar_mcp_coalesced_total", "Requests answered by joining an identical in-flight request", ["handler"]
+)
+
+
+def _instrument(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Record request, error, latency and response-size metrics for a handler.
+    
+    Applied outermost (right below the MCP registration), so requests
+    answered by joining a coalesced flight are measured like the others.
+    When INFO logging is enabled, each request also logs one "Request
+    completed" record with its duration, response size, status and the
+    events it returned, inside a request context that the handler's own
+    records (on the pool thread) share.
+    
+    Args:
+        fn: Async handler returning a JSON string
+        
+    Returns:
+        Coroutine function with the same signature
+    """
+    name = fn.__name__
+    
+    @functools.wraps(fn)
+    async def handler(*args: Any, **kwargs: Any) -> str:
+        logged = logger.isEnabledFor(logging.INFO)
+        context = (
+            request_context(tool=name, args_hash=arguments_hash(args, kwargs))
+            if logged else contextlib.nullcontext()
+        )
+        with context:
+            _REQUESTS.inc(handler=name)
+            started = time.perf_counter()
+            with _LATENCY.time(handler=name):
+                try:
+                    response = await fn(*args, **kwargs)
+                except BaseException as e:
+                    _ERRORS.inc(handler=name)
+                    if logged and isinstance(e, Exception):
+                        logger.exception("Request failed", extra={"duration_ms": _elapsed_ms(started)})
+                    raise
+            success = _is_success_response(response)
+            if not success:
+                _ERRORS.inc(handler=name)
+            size = len(response) if response.isascii() else len(response.encode("utf-8"))
+            _PAYLOAD_BYTES.observe(size, handler=name)
+            if logged:
+                logger.info("Request completed", extra={
+                    "duration_ms": _elapsed_ms(started),
+                    "bytes": size,
+                    "status": "ok" if success else "error"
+                })
+        return response
+    return handler
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _offload(fn: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+    """
+    Turn a blocking handler into an async one running on the handler pool.
+    
+    At most SERVER_MAX_CONCURRENCY handlers run at once; the rest wait in
+    the pool's queue. A call taking longer than SERVER_CALL_TIMEOUT seconds
+    (0 disables the limit) answers with an error while the work finishes in
+    the background. Calls sampled by the profiler run under cProfile. The
+    call runs in a copy of the caller's context, so it logs within the
+    request context set by ``_instrument``.
+    
+    Args:
+        fn: Handler returning a JSON string
+        
+    Returns:
+        Coroutine function with the same signature
+    """
+    name = fn.__name__
+    
+    @functools.wraps(fn)
+    async def handler(*args: Any, **kwargs: Any) -> str:
+        call = functools.partial(fn, *args, **kwargs)
+        if PROFILER.rate > 0:
+            call = functools.partial(PROFILER.run, name, arguments_hash(args, kwargs), call)
+        future = asyncio.get_running_loop().run_in_executor(
+            _handler_pool, contextvars.copy_context().run, call
+        )
+        try:
+            return await asyncio.wait_for(future, timeout=_CALL_TIMEOUT or None)
+        except asyncio.TimeoutError:
+            logger.warning(f"{name} timed out after {_CALL_TIMEOUT:g} seconds", extra={"tool": name})
+            return json.dumps({
+                "error": f"{name} timed out after {_CALL_TIMEOUT:g} seconds"
+            }, ensure_ascii=False)
+    return handler
+
+
+# Identical read requests arriving together share one handler run and its JSON
+_response_flights = AsyncSingleFlight()
+
+
+def _coalesce(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Share one in-flight run of a read-only async handler between identical calls.
+    
+    Calls are identical if they have the same handler, the same arguments
+    and see the same store change count, so a read issued after a write
+    never receives a response computed before it.
+    
+    Args:
+        fn: Async handler returning a JSON string
+        
+    Returns:
+        Coroutine function with the same signature
+    """
+    @functools.wraps(fn)
+    async def handler(*args: Any, **kwargs: Any) -> str:
+        store = _global_calendar_store
+        key = (
+            fn.__name__,
+            json.dumps([args, kwargs], sort_keys=True, default=str),
+            store.change_count if store is not None else None
+        )
+        if _response_flights.in_flight(key):
+            _COALESCED.inc(handler=fn.__name__)
+        return await _response_flights.do(key, lambda: fn(*args, **kwargs))
+    return handler
+
+
+# Handlers put their status first: {"error": ...}, {"success": false, ...}
+# or ApiResponse's {"status": "error", ...}
+_ERROR_RESPONSE = re.compile(r'\{\s*"(?:error"|success"\s*:\s*false|status"\s*:\s*"error")')
+
+
+def _is_success_response(response: str) -> bool:
+    """True unless a handler response reports an error or a failed write"""
+    return _ERROR_RESPONSE.match(response) is None
+
+
+def _cache_response(
+    key: Optional[Callable[..., Tuple[Any, ...]]] = None
+) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """
+    Serve a read-only resource handler from the store's response cache.
+    
+    Responses are keyed by handler and arguments, so each resource URI has
+    its own entry. Handlers reading a date range pass ``key`` instead, which
+    keys them on the calendar and the range the store actually resolves:
+    equivalent date spellings share an entry, and a window relative to now
+    gets a new entry as soon as the window moves rather than when the TTL
+    expires. Error responses are never cached.
+    
+    Args:
+        key: Optional function of the store and the handler's arguments
+            returning the cache key; a ValueError serves the request uncached
+        
+    Returns:
+        Decorator returning a handler with the same signature
+    """
+    def decorate(fn: Callable[..., str]) -> Callable[..., str]:
+        @functools.wraps(fn)
+        def handler(*args: Any, **kwargs: Any) -> str:
+            store = _global_calendar_store
+            if store is None:
+                # The handler creates the store; cache from the next request on
+                return fn(*args, **kwargs)
+            try:
+                if key is None:
+                    parts = (json.dumps([args, kwargs], sort_keys=True, default=str),)
+                else:
+                    parts = key(store, *args, **kwargs)
+            except ValueError:
+                # Dates the handler cannot resolve either; let it report the error
+                return fn(*args, **kwargs)
+            return store.cached_response(
+                (fn.__name__,) + parts, lambda: fn(*args, **kwargs), cacheable=_is_success_response
+            )
+        return handler
+    return decorate
+
+
+def _resource_window(start_date: str, end_date: str) -> Tuple[str, str]:
+    """
+    Pad the dates of an events://{calendar_name}/{start_date}/{end_date} URI to whole days.
+    
+    Args:
+        start_date: Start date from the URI
+        end_date: End date from the URI
+        
+    Returns:
+        Tuple of (start date, end date) to pass to the store
+    """
+    if start_date == end_date: # Shift end_date to the end of the day
+        end_date = f"{end_date}T23:59:59"
+        
+    
+    # Handle date ranges by adjusting time components
+    if start_date and len(start_date) == 10:  # YYYY-MM-DD format (10 chars)
+        start_date = f"{start_date}T00:00:00"
+        
+    if end_date and len(end_date) == 10:  # YYYY-MM-DD format (10 chars)
+        end_date = f"{end_date}T23:59:59"
+    return start_date, end_date
+
+
+def _api_window(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Resolve the dates of an api://events URI to ISO strings for the store.
+    
+    Without dates the window is today plus the following 7 days.
+    
+    Args:
+        start_date: Optional start date in any format parseable by dateparser
+        end_date: Optional end date in any format parseable by dateparser
+        
+    Returns:
+        Tuple of (start date, end date) in ISO format
+        
+    Raises:
+        ValueError: If the dates cannot be parsed or the range is inverted
+    """
+    # Parse and validate date range
+    start_dt, end_dt = create_date_range(start_date, end_date)
+    
+    # Ensure end_dt is set to end of day (23:59:59) if only date is provided
+    # This is especially important for same-day searches
+    if end_date is not None and end_dt.hour == 0 and end_dt.minute == 0 and end_dt.second == 0:
+        # Only modify if it's at the beginning of the day (likely just date was provided)
+        end_dt = end_dt.replace(hour=23, minute=59, second=59)
+    
+    # Format dates as ISO strings for the calendar store
+    return format_iso(start_dt), format_iso(end_dt)
+
+
+def _default_range_key(store: CalendarStore, calendar_name: str) -> Tuple[Any, ...]:
+    """Cache key for events://{calendar_name}: the store's default window from now"""
+    return (calendar_name,) + store.resolve_range()
+
+
+def _resource_range_key(store: CalendarStore, calendar_name: str, start_date: str, end_date: str) -> Tuple[Any, ...]:
+    """Cache key for events://{calendar_name}/{start_date}/{end_date}"""
+    return (calendar_name,) + store.resolve_range(*_resource_window(start_date, end_date))
+
+
+def _api_range_key(
+    store: CalendarStore,
+    calendar_name: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Tuple[Any, ...]:
+    """Cache key for api://events/{calendar_name} with or without dates"""
+    return (calendar_name,) + store.resolve_range(*_api_window(start_date, end_date))
+
+
+def coalescing_stats() -> Dict[str, Any]:
+    """
+    Report how many requests were answered from another request's flight.
+    
+    Returns:
+        Dictionary with handler-level ("responses") and store-level ("fetches") counters
+    """
+    store = _global_calendar_store
+    return {
+        "responses": _response_flights.stats(),
+        "fetches": store.event_flights.stats() if store is not None else None
+    }
+
+
+def _store_samples(read: Callable[[CalendarStore], Dict[str, Any]], label: str) -> Callable[[], List[Any]]:
+    """Build a collector turning numeric entries of a store stats dictionary into samples"""
+    def collect() -> List[Any]:
+        store = _global_calendar_store
+        if store is None:
+            return []
+        return [
+            ({label: key}, value) for key, value in read(store).items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+    return collect
+
+
+REGISTRY.collector(
+    "calendar_health_events_total", "Health monitor probes, refreshes and detected clock gaps",
+    "counter", _store_samples(lambda store: store.health.stats(), "event")
+)
+REGISTRY.collector(
+    "calendar_health_healthy", "1 while the calendar store is healthy",
+    "gauge", lambda: [] if _global_calendar_store is None else [
+        ({}, 1 if _global_calendar_store.health.stats()["state"] == "healthy" else 0)
+    ]
+)
+REGISTRY.collector(
+    "calendar_event_cache", "Event-by-ID cache size and hit counters",
+    "gauge", _store_samples(lambda store: store.event_cache.stats(), "stat")
+)
+REGISTRY.collector(
+    "calendar_response_cache", "Serialized response cache size, hit and invalidation counters",
+    "gauge", _store_samples(lambda store: store.response_cache.stats(), "stat")
+)
+REGISTRY.collector(
+    "calendar_fetch_coalescing", "Store-level get_events single-flight counters",
+    "gauge", _store_samples(lambda store: store.event_flights.stats(), "stat")
+)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve process metrics in the Prometheus text format"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 # Main entry point ---------------------------------------------------------
 
 if __name__ == "__main__":
@@ -113,12 +449,13 @@ if __name__ == "__main__":
     port = int(os.environ.get("SERVER_PORT", "27212"))
     transport = os.environ.get("SERVER_TRANSPORT", "sse")
     
-    print(f"Server configured with port={port}, transport={transport}")
+    configure_logging()
+    logger.info(f"Server configured with port={port}, transport={transport}")
     
     # Initialize the calendar store early to handle authorization
-    print("Initializing calendar access...")
+    logger.info("Initializing calendar access...")
     get_calendar_store()
-    print("Calendar access initialized.")
+    logger.info("Calendar access initialized.")
     
     # Run the server with the specified transport
     mcp.run(transport=transport)
@@ -127,6 +464,10 @@ if __name__ == "__main__":
 # Resources -----------------------------------------------------------------
 
 @mcp.resource("calendars://list")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response()
 def list_calendars() -> str:
     """
     List all available calendars in Calendar.app
@@ -145,6 +486,10 @@ def list_calendars() -> str:
 
 
 @mcp.resource("calendar://{name}")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response()
 def get_calendar_info(name: str) -> str:
     """
     Get information about a specific calendar
@@ -174,6 +519,10 @@ def get_calendar_info(name: str) -> str:
 
 
 @mcp.resource("events://{calendar_name}")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response(key=_default_range_key)
 def get_calendar_events(calendar_name: str) -> str:
     """
     Get events from a specific calendar
@@ -195,6 +544,10 @@ def get_calendar_events(calendar_name: str) -> str:
 
 
 @mcp.resource("events://{calendar_name}/{start_date}/{end_date}")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response(key=_resource_range_key)
 def get_calendar_events_by_date_range(
     calendar_name: str, 
     start_date: str, 
@@ -212,17 +565,7 @@ def get_calendar_events_by_date_range(
         JSON string containing events
     """
     try:
-        if start_date == end_date: # Shift end_date to the end of the day
-            end_date = f"{end_date}T23:59:59"
-            
-        
-        # Handle date ranges by adjusting time components
-        if start_date and len(start_date) == 10:  # YYYY-MM-DD format (10 chars)
-            start_date = f"{start_date}T00:00:00"
-            
-        if end_date and len(end_date) == 10:  # YYYY-MM-DD format (10 chars)
-            end_date = f"{end_date}T23:59:59"
-        
+        start_date, end_date = _resource_window(start_date, end_date)
         
         store = get_calendar_store()
         events = store.get_events(
@@ -238,7 +581,11 @@ def get_calendar_events_by_date_range(
 
 
 @mcp.resource("event://{calendar_name}/{event_id}")
-def get_event(calendar_name: str, event_id: str) -> str:
+@_instrument
+@_coalesce
+@_offload
+@_cache_response()
+def get_calendar_event(calendar_name: str, event_id: str) -> str:
     """
     Get a specific event by ID
     
@@ -250,15 +597,9 @@ def get_event(calendar_name: str, event_id: str) -> str:
         JSON string containing event details
     """
     try:
-        # Get all events and filter by ID
         store = get_calendar_store()
-        events = store.get_events(calendar_name=calendar_name)
-        event = next((e for e in events if e["id"] == event_id), None)
-        
-        if event:
-            return json.dumps(event, ensure_ascii=False)
-        else:
-            return json.dumps({"error": f"Event with ID '{event_id}' not found"}, ensure_ascii=False)
+        event = store.get_event(event_id, calendar_name=calendar_name)
+        return json.dumps(event, ensure_ascii=False)
     except CalendarStoreError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
@@ -268,6 +609,9 @@ def get_event(calendar_name: str, event_id: str) -> str:
 # Tools --------------------------------------------------------------------
 
 @mcp.tool()
+@_instrument
+@_coalesce
+@_offload
 def list_all_calendars() -> str:
     """
     List all available calendars in Calendar.app
@@ -289,19 +633,54 @@ def list_all_calendars() -> str:
 
 
 @mcp.tool()
+@_instrument
+@_coalesce
+@_offload
+def get_event(
+    event_id: str,
+    calendar_name: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Get a single event by ID, whatever its date
+    
+    Args:
+        event_id: The ID of the event
+        calendar_name: (Optional) Calendar the event must belong to
+        fields: (Optional) Event fields to return, e.g. ["summary", "start"].
+                Defaults to all fields.
+        
+    Returns:
+        JSON string containing event details
+    """
+    try:
+        store = get_calendar_store()
+        event = store.get_event(event_id, calendar_name=calendar_name, fields=fields)
+        return json.dumps(event, ensure_ascii=False)
+    except CalendarStoreError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Unexpected error: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@_instrument
+@_coalesce
+@_offload
 def search_events(
     query: str,
     calendar_name: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    duration: Optional[str] = None
+    duration: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    mode: str = "substring"
 ) -> str:
     """
     Search for events in Calendar.app, optionally within a flexible date range.
     
     Args:
-        query: Search query (case-insensitive substring match).
-               If empty, returns all events matching other criteria.
+        query: Search query. If empty, returns all events matching other criteria.
         calendar_name: (Optional) Specific calendar to search in.
         start_date: (Optional) Starting date in any format parseable by dateparser.
                     Defaults to today if no end_date and no duration given for start_date logic.
@@ -310,6 +689,15 @@ def search_events(
                   e.g., "3d", "1 week", "1 month".
                   Default is "3d" if only start_date is given or if neither start_date nor end_date is given.
                   See date parsing logic for details on how start_date, end_date, and duration interact.
+        fields: (Optional) Event fields to return, e.g. ["id", "summary", "start"].
+                Defaults to all fields: id, summary, start, end, location,
+                description, calendar, all_day, availability.
+        mode: (Optional) "substring" (default) matches the query as a case-insensitive
+              substring of the summary, description or location, including partial words
+              and Chinese/Japanese/Korean text (full-width and half-width forms are
+              treated alike). "query" matches whole
+              words, supports "quoted phrases" and OR (e.g. 'standup OR "sprint review"'),
+              and is answered from a full-text index.
         
     Returns:
         JSON string containing matching events
@@ -372,24 +760,15 @@ def search_events(
         # start_dt = now, end_dt = start_dt + 3 days.
 
         store = get_calendar_store()
-        events = store.get_events(
+        matching_events = store.search_events(
+            query,
             calendar_name=calendar_name,
             start_date=start_iso_for_store,
-            end_date=end_iso_for_store
+            end_date=end_iso_for_store,
+            fields=fields,
+            mode=mode
         )
         
-        # Filter events by query (case-insensitive)
-        # An empty query string will match all events due to '"" in event_field.lower()' being true
-        query_lower = query.lower()
-        matching_events = [
-            event for event in events
-            if (
-                query_lower in event["summary"].lower() or
-                query_lower in (event["description"] or "").lower() or
-                query_lower in (event["location"] or "").lower()
-            )
-        ]
-        
         return json.dumps({
             "events": matching_events,
             "count": len(matching_events)
@@ -403,13 +782,16 @@ def search_events(
 
 
 @mcp.tool()
+@_instrument
+@_offload
 def create_calendar_event(
     calendar_name: str,
     summary: str,
     start_date: str,
     end_date: str,
     location: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    conflicts: str = "off"
 ) -> str:
     """
     Create a new event in Calendar.app
@@ -421,24 +803,45 @@ def create_calendar_event(
         end_date: End date in format "yyyy-MM-ddTHH:mm:ss"
         location: (Optional) Event location
         description: (Optional) Event description
+        conflicts: (Optional) "off" (default) creates the event without checking;
+                   "report" creates it and lists the busy events it overlaps;
+                   "block" does not create it if it overlaps busy events
         
     Returns:
         JSON string containing the result
     """
     try:
+        if conflicts not in CONFLICT_MODES:
+            raise CalendarStoreError(
+                f"Unknown conflict mode '{conflicts}' (available: {', '.join(CONFLICT_MODES)})"
+            )
+        
         store = get_calendar_store()
+        overlaps = None
+        if conflicts == "report":
+            overlaps = store.find_conflicts(start_date, end_date)
         event_id = store.create_event(
             calendar_name=calendar_name,
             summary=summary,
             start_date=start_date,
             end_date=end_date,
             location=location,
-            description=description
+            description=description,
+            check_conflicts=conflicts == "block"
         )
         
-        return json.dumps({
+        response: Dict[str, Any] = {
             "success": True,
             "event_id": event_id
+        }
+        if conflicts != "off":
+            response["conflicts"] = overlaps or []
+        return json.dumps(response, ensure_ascii=False)
+    except EventConflictError as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+            "conflicts": e.conflicts
         }, ensure_ascii=False)
     except CalendarStoreError as e:
         return json.dumps({
@@ -453,6 +856,8 @@ def create_calendar_event(
 
 
 @mcp.tool()
+@_instrument
+@_offload
 def update_calendar_event(
     event_id: str,
     calendar_name: str,
@@ -505,6 +910,8 @@ def update_calendar_event(
 
 
 @mcp.tool()
+@_instrument
+@_offload
 def delete_calendar_event(event_id: str, calendar_name: str) -> str:
     """
     Delete an event from Calendar.app
@@ -538,6 +945,234 @@ def delete_calendar_event(event_id: str, calendar_name: str) -> str:
         }, ensure_ascii=False)
 
 
+
+def _batch_response(store_method: str, items: List[Dict[str, Any]], **options: Any) -> str:
+    """
+    Run a CalendarStore batch method and format its per-item results.
+    
+    Args:
+        store_method: Name of the batch method on CalendarStore
+        items: Item specifications passed through to the method
+        **options: Extra keyword arguments for the method
+        
+    Returns:
+        JSON string with overall success, counts and per-item results
+    """
+    try:
+        store = get_calendar_store()
+        results = getattr(store, store_method)(items, **options)
+        succeeded = sum(1 for result in results if result["success"])
+        
+        return json.dumps({
+            "success": succeeded == len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }, ensure_ascii=False)
+    except CalendarStoreError as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e)
+        }, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, ensure_ascii=False)
+
+
+@mcp.tool()
+@_instrument
+@_offload
+def create_calendar_events(events: List[Dict[str, Any]], conflicts: str = "off") -> str:
+    """
+    Create several events in Calendar.app with a single commit
+    
+    Args:
+        events: List of events, each with calendar_name, summary, start_date and
+                end_date (format "yyyy-MM-ddTHH:mm:ss") and optionally location
+                and description
+        conflicts: (Optional) "off" (default) creates the events without checking;
+                   "report" lists, per event, the busy events and other new events
+                   it overlaps; "block" also skips the events that overlap anything
+        
+    Returns:
+        JSON string containing per-event results with event IDs
+    """
+    return _batch_response("create_events", events, conflicts=conflicts)
+
+
+@mcp.tool()
+@_instrument
+@_coalesce
+@_offload
+def check_event_conflicts(events: List[Dict[str, Any]]) -> str:
+    """
+    Check proposed events for double-bookings without creating them
+    
+    Each event is compared with existing busy events in all calendars and
+    with the other proposed events. Free and all-day events never conflict.
+    
+    Args:
+        events: List of proposed events, each with start_date and end_date
+                (format "yyyy-MM-ddTHH:mm:ss"); summary and calendar_name are
+                used to describe conflicts between proposed events
+        
+    Returns:
+        JSON string containing the conflicts of each event
+    """
+    try:
+        store = get_calendar_store()
+        results = store.check_conflicts(events)
+        return json.dumps({
+            "conflicting": sum(1 for result in results if result.get("conflicts")),
+            "results": results
+        }, ensure_ascii=False)
+    except CalendarStoreError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Unexpected error: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@_instrument
+@_offload
+def update_calendar_events(updates: List[Dict[str, Any]]) -> str:
+    """
+    Update several events in Calendar.app with a single commit
+    
+    Args:
+        updates: List of updates, each with event_id and calendar_name and
+                 optionally summary, start_date, end_date, location and description
+        
+    Returns:
+        JSON string containing per-event results
+    """
+    return _batch_response("update_events", updates)
+
+
+@mcp.tool()
+@_instrument
+@_offload
+def delete_calendar_events(deletions: List[Dict[str, Any]]) -> str:
+    """
+    Delete several events from Calendar.app with a single commit
+    
+    Args:
+        deletions: List of deletions, each with event_id and calendar_name
+        
+    Returns:
+        JSON string containing per-event results
+    """
+    return _batch_response("delete_events", deletions)
+
+
+@mcp.tool()
+@_instrument
+@_coalesce
+@_offload
+def get_free_busy(
+    calendar_names: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    include_all_day: bool = False
+) -> str:
+    """
+    Get merged busy blocks and free gaps across calendars
+
+    Overlapping events from all selected calendars are merged into busy
+    blocks; events marked "free" never block time.
+
+    Args:
+        calendar_names: (Optional) Calendars to combine. Defaults to all calendars.
+        start_date: (Optional) Window start in any format parseable by dateparser. Defaults to today.
+        end_date: (Optional) Window end in any format parseable by dateparser. Defaults to 7 days after start.
+        include_all_day: (Optional) Count busy all-day events as busy time (default: False)
+
+    Returns:
+        JSON string with the busy blocks and free slots of the window
+    """
+    try:
+        start_dt, end_dt = create_date_range(start_date, end_date)
+
+        store = get_calendar_store()
+        result = store.get_free_busy(
+            calendar_names=calendar_names,
+            start_date=start_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            end_date=end_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            include_all_day=include_all_day
+        )
+        return json.dumps(result, ensure_ascii=False)
+    except ValueError as e:
+        return json.dumps({"error": f"Date error: {str(e)}"}, ensure_ascii=False)
+    except CalendarStoreError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Unexpected error: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@_instrument
+@_coalesce
+@_offload
+def find_available_slots(
+    duration_minutes: int,
+    calendar_names: Optional[List[str]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    working_hours_start: str = "09:00",
+    working_hours_end: str = "17:00",
+    buffer_minutes: int = 0,
+    days: Optional[List[str]] = None,
+    preferred_days: Optional[List[str]] = None,
+    max_results: int = 5,
+    include_all_day: bool = False
+) -> str:
+    """
+    Find meeting slots when all of the given calendars are free
+
+    Args:
+        duration_minutes: Length of the meeting in minutes
+        calendar_names: (Optional) Calendars that must all be free. Defaults to all calendars.
+        start_date: (Optional) Earliest slot start in any format parseable by dateparser. Defaults to now.
+        end_date: (Optional) Latest slot end in any format parseable by dateparser. Defaults to 7 days after start.
+        working_hours_start: (Optional) Start of the working day as "HH:MM" (default: "09:00")
+        working_hours_end: (Optional) End of the working day as "HH:MM" (default: "17:00")
+        buffer_minutes: (Optional) Free minutes required before and after existing events (default: 0)
+        days: (Optional) Weekdays slots may fall on, e.g. ["monday", "wed"]. Defaults to Monday to Friday.
+        preferred_days: (Optional) Weekdays whose slots are listed first
+        max_results: (Optional) Maximum number of slots to return (default: 5)
+        include_all_day: (Optional) Count busy all-day events as busy time (default: False)
+
+    Returns:
+        JSON string with the earliest matching slots
+    """
+    try:
+        start_dt, end_dt = create_date_range(start_date or datetime.now(), end_date)
+
+        store = get_calendar_store()
+        result = store.find_available_slots(
+            duration_minutes,
+            calendar_names=calendar_names,
+            start_date=start_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            end_date=end_dt.strftime("%Y-%m-%dT%H:%M:%S"),
+            working_hours_start=working_hours_start,
+            working_hours_end=working_hours_end,
+            buffer_minutes=buffer_minutes,
+            days=days,
+            preferred_days=preferred_days,
+            max_results=max_results,
+            include_all_day=include_all_day
+        )
+        return json.dumps(result, ensure_ascii=False)
+    except ValueError as e:
+        return json.dumps({"error": f"Date error: {str(e)}"}, ensure_ascii=False)
+    except CalendarStoreError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Unexpected error: {str(e)}"}, ensure_ascii=False)
+
+
 @mcp.prompt()
 def create_event_prompt(
     calendar_name: str,
@@ -625,23 +1260,13 @@ def search_events_prompt(
             end_date = f"{end_date}T23:59:59"
             
         store = get_calendar_store()
-        events = store.get_events(
+        matching_events = store.search_events(
+            query,
             calendar_name=calendar_name,
             start_date=start_date,
             end_date=end_date
         )
         
-        # Filter events by query (case-insensitive)
-        query = query.lower()
-        matching_events = [
-            event for event in events
-            if (
-                query in event["summary"].lower() or
-                query in (event["description"] or "").lower() or
-                query in (event["location"] or "").lower()
-            )
-        ]
-        
         # Format a human-readable response
         if not matching_events:
             return f"No events found matching '{query}'."
@@ -662,7 +1287,47 @@ def search_events_prompt(
 
 # JSON API endpoints -------------------------------------------------------
 
+def _api_event_list(batch: EventBatch, calendar_name: str) -> Dict[str, Any]:
+    """
+    Convert an EventBatch to the EventList payload of the JSON API.
+    
+    Rows are converted straight from the batch columns, in the layout of
+    ``CalendarEvent.to_dict()``, without building a model per event.
+    
+    Args:
+        batch: Events to convert
+        calendar_name: Calendar name reported for every event
+        
+    Returns:
+        Dictionary with the events and their count
+    """
+    events = []
+    for row in batch:
+        start = row.start
+        end = row.end
+        events.append({
+            "id": row.id,
+            "summary": row.summary,
+            "start_date": start,
+            "end_date": end,
+            "calendar_name": calendar_name,
+            "all_day": row.all_day,
+            "location": row.location,
+            "description": row.description,
+            "url": None,
+            "availability": row.availability,
+            "start": start,
+            "end": end,
+            "calendar": row.calendar
+        })
+    return {"events": events, "count": len(events)}
+
+
 @mcp.resource("api://calendars")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response()
 def api_list_calendars() -> str:
     """
     API endpoint to list all available calendars with JSON response
@@ -687,6 +1352,10 @@ def api_list_calendars() -> str:
 
 
 @mcp.resource("api://events/{calendar_name}")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response(key=_api_range_key)
 def api_get_events(calendar_name: str) -> str:
     """
     API endpoint to get events from a calendar with JSON response
@@ -699,29 +1368,18 @@ def api_get_events(calendar_name: str) -> str:
     """
     try:
         # Use current date range if not specified
-        start_dt, end_dt = create_date_range(None, None)
-        
-        # Format dates as ISO strings for the calendar store
-        start_iso = format_iso(start_dt)
-        end_iso = format_iso(end_dt)
+        start_iso, end_iso = _api_window()
         
         store = get_calendar_store()
-        raw_events = store.get_events(
+        batch = store.get_events(
             calendar_name=calendar_name,
             start_date=start_iso,
-            end_date=end_iso
+            end_date=end_iso,
+            as_batch=True
         )
         
-        # Convert to validated CalendarEvent objects
-        events = []
-        for raw_event in raw_events:
-            # Add calendar name to each event
-            raw_event["calendar_name"] = calendar_name
-            event = CalendarEvent(**raw_event)
-            events.append(event)
-        
         response = ApiResponse.success(
-            data=EventList(events=events, count=len(events))
+            data=_api_event_list(batch, calendar_name)
         )
         return json.dumps(response.model_dump(), ensure_ascii=False)
     except ValueError as e:
@@ -736,6 +1394,10 @@ def api_get_events(calendar_name: str) -> str:
 
 
 @mcp.resource("api://events/{calendar_name}/{start_date}/{end_date}")
+@_instrument
+@_coalesce
+@_offload
+@_cache_response(key=_api_range_key)
 def api_get_events_with_dates(calendar_name: str, start_date: str, end_date: str) -> str:
     """
     API endpoint to get events from a calendar within a date range with JSON response
@@ -750,39 +1412,18 @@ def api_get_events_with_dates(calendar_name: str, start_date: str, end_date: str
     """
     try:
         # Parse and validate date range
-        start_dt, end_dt = create_date_range(start_date, end_date)
-        
-        # Ensure end_dt is set to end of day (23:59:59) if only date is provided
-        # This is especially important for same-day searches
-        if start_dt.hour == 0 and start_dt.minute == 0 and start_dt.second == 0:
-            # Only modify if it's at the beginning of the day (likely just date was provided)
-            start_dt = start_dt.replace(hour=0, minute=0, second=0)
-            
-        if end_dt.hour == 0 and end_dt.minute == 0 and end_dt.second == 0:
-            # Only modify if it's at the beginning of the day (likely just date was provided)
-            end_dt = end_dt.replace(hour=23, minute=59, second=59)
-        
-        # Format dates as ISO strings for the calendar store
-        start_iso = format_iso(start_dt)
-        end_iso = format_iso(end_dt)
+        start_iso, end_iso = _api_window(start_date, end_date)
         
         store = get_calendar_store()
-        raw_events = store.get_events(
+        batch = store.get_events(
             calendar_name=calendar_name,
             start_date=start_iso,
-            end_date=end_iso
+            end_date=end_iso,
+            as_batch=True
         )
         
-        # Convert to validated CalendarEvent objects
-        events = []
-        for raw_event in raw_events:
-            # Add calendar name to each event
-            raw_event["calendar_name"] = calendar_name
-            event = CalendarEvent(**raw_event)
-            events.append(event)
-        
         response = ApiResponse.success(
-            data=EventList(events=events, count=len(events))
+            data=_api_event_list(batch, calendar_name)
         )
         return json.dumps(response.model_dump(), ensure_ascii=False)
     except ValueError as e:
@@ -797,6 +1438,8 @@ def api_get_events_with_dates(calendar_name: str, start_date: str, end_date: str
 
 
 @mcp.resource("api://events/create/{calendar_name}/{summary}/{start_date}/{end_date}")
+@_instrument
+@_offload
 def api_create_event_path(calendar_name: str, summary: str, start_date: str, end_date: str) -> str:
     """
     API endpoint to create a new event with JSON response using path parameters
@@ -849,6 +1492,8 @@ def api_create_event_path(calendar_name: str, summary: str, start_date: str, end
 
 
 @mcp.resource("api://events/update/{event_id}/{calendar_name}")
+@_instrument
+@_offload
 def api_update_event_path(event_id: str, calendar_name: str) -> str:
     """
     API endpoint to update an event with JSON response using path parameters
@@ -897,6 +1542,8 @@ def api_update_event_path(event_id: str, calendar_name: str) -> str:
 
 
 @mcp.resource("api://events/delete/{event_id}/{calendar_name}")
+@_instrument
+@_offload
 def api_delete_event_path(event_id: str, calendar_name: str) -> str:
     """
     API endpoint to delete an event with JSON response using path parameters
@@ -0,0 +1,125 @@
+"""
+Request coalescing ("single flight").
+
+When several callers ask for the same thing at the same time, only the
+first one (the leader) does the work; the others wait for the leader and
+share its result. Nothing is cached: once the leader finishes, the next
+request starts a new flight.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Callable, Awaitable, Hashable, Tuple
+
+
+class _FlightStats:
+    """Counters shared by the thread and asyncio variants"""
+
+    def __init__(self) -> None:
+        self.led = 0
+        self.shared = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the leader and follower counts and the share of coalesced calls"""
+        calls = self.led + self.shared
+        return {
+            "calls": calls,
+            "executed": self.led,
+            "coalesced": self.shared,
+            "hit_rate": self.shared / calls if calls else 0.0
+        }
+
+
+class SingleFlight(_FlightStats):
+    """Coalesces concurrent calls with the same key across threads"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` unless an identical call is already running.
+
+        Args:
+            key: Identity of the call
+            fn: Work to run if this caller becomes the leader
+
+        Returns:
+            Tuple of (result, shared), where shared is True if the result came
+            from another caller's flight and must be treated as read-only
+
+        Raises:
+            Whatever ``fn`` raised, in the leader and every follower
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+                self.led += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return call.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(_FlightStats):
+    """
+    Coalesces concurrent coroutine calls with the same key on one event loop.
+
+    The shared work runs in its own task, which every caller (the first
+    one included) awaits through ``asyncio.shield``: a caller that is
+    cancelled stops waiting without cancelling the work the others wait for.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """True if a call with this key is running (a ``do`` now would share it)"""
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine factory run if no identical call is in flight
+
+        Returns:
+            The (possibly shared) result
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+        else:
+            call = self._calls[key] = asyncio.ensure_future(self._run(key, fn))
+            # Mark failures as retrieved even if every caller stopped waiting
+            call.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self.led += 1
+        return await asyncio.shield(call)
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        finally:
+            # Ends the flight as soon as the work does, so later calls start a new one
+            if self._calls.get(key) is asyncio.current_task():
+                del self._calls[key]
@@ -0,0 +1,324 @@
+"""
+Inverted indexes for event search.
+
+TextIndex answers token queries made of words and "quoted phrases". Terms
+next to each other must all match (AND), and the keyword OR separates
+alternatives:
+
+    standup OR "sprint review"
+    budget "q3 planning" OR offsite
+
+Words match whole tokens, case-insensitively.
+
+TrigramIndex answers substring queries, including partial words and CJK
+text that has no whitespace to split on. Text is compared after NFKC
+normalization and case folding.
+"""
+import re
+import unicodedata
+from typing import List, Dict, Set, Tuple, Hashable, Iterable, Sequence
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for substring matching (NFKC, case-folded)"""
+    if not text:
+        return ""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded word tokens"""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _contains_phrase(tokens: Sequence[str], phrase: Tuple[str, ...]) -> bool:
+    """Check whether the phrase occurs as consecutive tokens"""
+    n = len(phrase)
+    first = phrase[0]
+    for i in range(len(tokens) - n + 1):
+        if tokens[i] == first and tuple(tokens[i:i + n]) == phrase:
+            return True
+    return False
+
+
+class TextQuery:
+    """Parsed search query: alternatives (OR) of term lists (AND)"""
+    __slots__ = ("clauses",)
+
+    def __init__(self, clauses: List[List[Tuple[str, ...]]]) -> None:
+        """
+        Initialize the query.
+
+        Args:
+            clauses: Alternatives, each a list of terms; a term of several tokens is a phrase
+        """
+        self.clauses = clauses
+
+    @classmethod
+    def parse(cls, query: str) -> "TextQuery":
+        """
+        Parse a query string.
+
+        Args:
+            query: Words, "quoted phrases" and OR keywords
+
+        Returns:
+            Parsed query (with no clauses if the query has no words)
+        """
+        clauses: List[List[Tuple[str, ...]]] = []
+        current: List[Tuple[str, ...]] = []
+        for match in _QUERY_RE.finditer(query or ""):
+            phrase, word = match.groups()
+            if word == "OR":
+                if current:
+                    clauses.append(current)
+                current = []
+                continue
+            if word == "AND":
+                continue
+            # A word like "e-mail" tokenizes into several tokens and acts as a phrase
+            term = tuple(tokenize(phrase if phrase is not None else word))
+            if term:
+                current.append(term)
+        if current:
+            clauses.append(current)
+        return cls(clauses)
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the query has no terms and therefore matches everything"""
+        return not self.clauses
+
+    def matches(self, fields: Iterable[Sequence[str]]) -> bool:
+        """
+        Check the query against tokenized fields.
+
+        Phrases never span two fields.
+
+        Args:
+            fields: Token lists, one per searchable field
+        """
+        if not self.clauses:
+            return True
+        fields = list(fields)
+        vocabulary = set()
+        for tokens in fields:
+            vocabulary.update(tokens)
+        for clause in self.clauses:
+            if all(self._term_matches(term, fields, vocabulary) for term in clause):
+                return True
+        return False
+
+    @staticmethod
+    def _term_matches(term: Tuple[str, ...], fields: List[Sequence[str]], vocabulary: Set[str]) -> bool:
+        if len(term) == 1:
+            return term[0] in vocabulary
+        if not vocabulary.issuperset(term):
+            return False
+        return any(_contains_phrase(tokens, term) for tokens in fields)
+
+
+class TextIndex:
+    """
+    Inverted index from tokens to document keys.
+
+    Each document keeps its per-field token lists so it can be removed
+    incrementally and phrases can be verified.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._docs: Dict[Hashable, Tuple[Tuple[str, ...], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    def add(self, key: Hashable, texts: Iterable[str]) -> None:
+        """
+        Index a document, replacing any previous version.
+
+        Args:
+            key: Document key
+            texts: Searchable field values
+        """
+        if key in self._docs:
+            self.remove(key)
+        fields = tuple(tuple(tokenize(text)) for text in texts)
+        self._docs[key] = fields
+        for tokens in fields:
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the key was indexed
+        """
+        fields = self._docs.pop(key, None)
+        if fields is None:
+            return False
+        for tokens in fields:
+            for token in tokens:
+                posting = self._postings.get(token)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[token]
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents"""
+        self._postings.clear()
+        self._docs.clear()
+
+    def search(self, query: TextQuery) -> Set[Hashable]:
+        """
+        Find the documents matching a query.
+
+        Posting lists are intersected smallest first, and phrases are only
+        verified against the surviving candidates.
+
+        Returns:
+            Keys of matching documents
+        """
+        if query.is_empty:
+            return set(self._docs)
+
+        result: Set[Hashable] = set()
+        for clause in query.clauses:
+            tokens = {token for term in clause for token in term}
+            postings = sorted((self._postings.get(token, set()) for token in tokens), key=len)
+            if not postings or not postings[0]:
+                continue
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    break
+
+            phrases = [term for term in clause if len(term) > 1]
+            for key in candidates:
+                if key in result:
+                    continue
+                fields = self._docs[key]
+                if all(any(_contains_phrase(tokens, phrase) for tokens in fields) for phrase in phrases):
+                    result.add(key)
+        return result
+
+
+class TrigramIndex:
+    """
+    Character n-gram index for substring search.
+
+    Every field contributes its 1-, 2- and 3-character substrings, so
+    needles of any length have index keys: short ones (common for CJK words)
+    use their own gram, longer ones intersect their trigrams. Candidates are
+    then verified with a real substring test, so results are exactly those of
+    ``needle in field`` on normalized text.
+    """
+
+    GRAM = 3
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._docs: Dict[Hashable, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    @classmethod
+    def _grams(cls, text: str) -> Set[str]:
+        grams = set()
+        n = len(text)
+        for i in range(n):
+            for size in range(1, cls.GRAM + 1):
+                if i + size > n:
+                    break
+                grams.add(text[i:i + size])
+        return grams
+
+    def add(self, key: Hashable, texts: Iterable[str]) -> None:
+        """
+        Index a document, replacing any previous version.
+
+        Args:
+            key: Document key
+            texts: Searchable field values
+        """
+        if key in self._docs:
+            self.remove(key)
+        fields = tuple(normalize_text(text) for text in texts)
+        self._docs[key] = fields
+        grams: Set[str] = set()
+        for text in fields:
+            grams.update(self._grams(text))
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the key was indexed
+        """
+        fields = self._docs.pop(key, None)
+        if fields is None:
+            return False
+        grams: Set[str] = set()
+        for text in fields:
+            grams.update(self._grams(text))
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents"""
+        self._postings.clear()
+        self._docs.clear()
+
+    def search(self, needle: str) -> Set[Hashable]:
+        """
+        Find the documents with a field containing the needle.
+
+        Args:
+            needle: Text to look for (normalized here); empty matches everything
+
+        Returns:
+            Keys of matching documents
+        """
+        needle = normalize_text(needle)
+        if not needle:
+            return set(self._docs)
+
+        if len(needle) <= self.GRAM:
+            # The gram itself is a key, and every holder contains it
+            return set(self._postings.get(needle, ()))
+
+        keys = {needle[i:i + self.GRAM] for i in range(len(needle) - self.GRAM + 1)}
+        postings = sorted((self._postings.get(gram, set()) for gram in keys), key=len)
+        if not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return candidates
+        return {key for key in candidates if any(needle in text for text in self._docs[key])}
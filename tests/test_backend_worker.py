@@ -0,0 +1,148 @@
+"""
+Tests for running a backend on a dedicated worker thread.
+"""
+import copy
+import datetime
+import threading
+from collections import Counter
+
+import pytest
+
+from calendar_sse_mcp.backend_worker import WorkerBackend, prefetch
+from calendar_sse_mcp.backends import BackendError, EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore
+
+
+class _TracedEvent:
+    """Event handle recording which attributes are read, and on which thread"""
+
+    def __init__(self, record, reads):
+        object.__setattr__(self, "_record", record)
+        object.__setattr__(self, "_reads", reads)
+
+    def __getattr__(self, name):
+        self._reads.append((name, threading.current_thread().name))
+        return getattr(self._record, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._record, name, value)
+
+
+class _TracedBackend(InMemoryBackend):
+    """In-memory backend whose events trace attribute reads"""
+
+    def __init__(self, separate_handles=False):
+        super().__init__(calendars=("Work",))
+        self.reads = []
+        self.separate_handles = separate_handles
+
+    def events_in_range(self, start, end, calendar_ids=None, attributes=None):
+        return [_TracedEvent(record, self.reads) for record in super().events_in_range(start, end, calendar_ids)]
+
+    def worker_handle(self):
+        # A handle of its own per fetch thread, like EventKit's per-thread stores
+        return copy.copy(self) if self.separate_handles else self
+
+
+def _at(day, hour=9):
+    return datetime.datetime(2026, 10, day, hour).timestamp()
+
+
+def _load(backend, days=60):
+    calendar_id = backend.calendars()[0].identifier
+    backend.load_events(
+        EventRecord(calendar_id=calendar_id, title=f"Event {i}", start=_at(1) + i * 86400,
+                    end=_at(1) + i * 86400 + 3600, notes="agenda", location="Room")
+        for i in range(days)
+    )
+
+
+@pytest.fixture
+def traced():
+    backend = _TracedBackend()
+    _load(backend)
+    worker = WorkerBackend(lambda: backend, name="test-backend")
+    yield worker, backend
+    worker.close()
+
+
+def test_fetch_reads_only_projected_attributes(traced):
+    worker, backend = traced
+    events = worker.events_in_range(_at(1, 0), _at(5, 0), attributes={"title"})
+    read = {name for name, _ in backend.reads}
+    assert read == {"identifier", "calendar_id", "start", "end", "title"}
+    assert all(thread == "test-backend" for _, thread in backend.reads)
+
+    # Other attributes are read lazily, still on the worker
+    backend.reads.clear()
+    assert events[0].notes == "agenda"
+    assert backend.reads == [("notes", "test-backend")]
+    assert events[0].notes == "agenda"
+    assert len(backend.reads) == 1
+
+
+def test_prefetch_reads_missing_attributes_in_one_call(traced):
+    worker, backend = traced
+    events = worker.events_in_range(_at(1, 0), _at(10, 0), attributes=())
+    backend.reads.clear()
+    prefetch(events, ("notes", "location"))
+    assert Counter(name for name, _ in backend.reads) == {"notes": len(events), "location": len(events)}
+    backend.reads.clear()
+    assert [event.location for event in events] == ["Room"] * len(events)
+    assert backend.reads == []
+
+
+def test_store_projects_requested_fields(traced):
+    worker, backend = traced
+    store = CalendarStore(quiet=True, backend=worker)
+    try:
+        backend.reads.clear()
+        events = store.get_events("Work", "2026-10-01", "2026-10-10", fields=["summary"])
+        assert len(events) == 10
+        assert "notes" not in {name for name, _ in backend.reads}
+
+        # Fields the index did not fetch are loaded on demand, on the worker
+        events = store.get_events("Work", "2026-10-01", "2026-10-10")
+        assert {event["description"] for event in events} == {"agenda"}
+        assert {thread for _, thread in backend.reads} == {"test-backend"}
+    finally:
+        store.close()
+
+
+def test_separate_handles_run_on_their_own_threads():
+    backend = _TracedBackend(separate_handles=True)
+    _load(backend)
+    worker = WorkerBackend(lambda: backend, name="test-backend")
+    store = CalendarStore(quiet=True, backend=worker, cache=False)
+    store.fetch_workers = 4
+    store.shard_days = 7
+    try:
+        events = store.get_events("Work", "2026-10-01", "2026-11-29", fields=["summary", "description"])
+        assert len(events) == 60
+        threads = {thread for _, thread in backend.reads}
+        assert threads and all(thread.startswith("test-backend-fetch") for thread in threads)
+    finally:
+        store.close()
+        worker.close()
+    assert not [t for t in threading.enumerate() if t.name.startswith("test-backend")]
+
+
+def test_writes_are_applied_on_the_worker(traced):
+    worker, backend = traced
+    calendar_id = worker.calendars()[0].identifier
+    event = worker.new_event(calendar_id)
+    event.title = "Created"
+    event.start, event.end = _at(20), _at(20, 10)
+    worker.save_event(event)
+    assert event.identifier
+    assert worker.event_with_identifier(event.identifier).title == "Created"
+
+    with pytest.raises(AttributeError):
+        event.identifier = "other"
+
+
+def test_stopped_worker_fails_instead_of_hanging():
+    worker = WorkerBackend(lambda: InMemoryBackend(), name="test-backend")
+    worker.close()
+    with pytest.raises(BackendError):
+        worker.calendars()
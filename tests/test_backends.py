@@ -0,0 +1,47 @@
+"""
+Tests for bulk loading into the stand-in backends.
+"""
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import BackendError, EventRecord, InMemoryBackend, SQLiteBackend
+
+
+def _at(day, hour=0):
+    return datetime.datetime(2026, 10, day, hour).timestamp()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request):
+    if request.param == "memory":
+        return InMemoryBackend(calendars=("Work",))
+    return SQLiteBackend(calendars=("Work",))
+
+
+def test_rejected_load_leaves_the_backend_unchanged(backend):
+    work = backend.calendars()[0].identifier
+    backend.load_events([EventRecord(calendar_id=work, title="Kept", start=_at(3, 9), end=_at(3, 10), identifier="K")])
+
+    with pytest.raises(BackendError):
+        backend.load_events([
+            EventRecord(calendar_id=work, title="Replaced", start=_at(3, 9), end=_at(3, 10), identifier="K"),
+            EventRecord(calendar_id=work, title="New", start=_at(4, 9), end=_at(4, 10), identifier="N"),
+            EventRecord(calendar_id="missing", title="Orphan", start=_at(5, 9), end=_at(5, 10)),
+        ])
+
+    assert backend.event_with_identifier("K").title == "Kept"
+    assert backend.event_with_identifier("N") is None
+    assert [e.title for e in backend.events_in_range(_at(1), _at(31))] == ["Kept"]
+
+
+def test_load_replaces_events_and_keeps_range_order(backend):
+    work = backend.calendars()[0].identifier
+    backend.load_events(
+        EventRecord(calendar_id=work, title=f"Day {day}", start=_at(day, 9), end=_at(day, 10), identifier=f"E{day}")
+        for day in (7, 2, 5)
+    )
+    backend.load_events([EventRecord(calendar_id=work, title="Moved", start=_at(1, 9), end=_at(1, 10), identifier="E5")])
+
+    assert [e.title for e in backend.events_in_range(_at(1), _at(31))] == ["Moved", "Day 2", "Day 7"]
+    assert [e.title for e in backend.events_in_range(_at(5), _at(6))] == []
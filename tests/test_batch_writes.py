@@ -0,0 +1,129 @@
+"""
+Tests for staged batch writes: one commit, partial failures and rollback.
+"""
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import BackendError, EventRecord, InMemoryBackend, SQLiteBackend
+from calendar_sse_mcp.calendar_store import CalendarStore
+
+
+def _at(day, hour=0):
+    return datetime.datetime(2026, 10, day, hour).timestamp()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request):
+    if request.param == "memory":
+        backend = InMemoryBackend(calendars=("Work", "Home"))
+    else:
+        backend = SQLiteBackend(calendars=("Work", "Home"))
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    backend.load_events([
+        EventRecord(calendar_id=ids["Work"], title="Standup", start=_at(5, 9), end=_at(5, 10), identifier="A"),
+        EventRecord(calendar_id=ids["Home"], title="Dinner", start=_at(6, 19), end=_at(6, 21), identifier="B"),
+    ])
+    return backend
+
+
+@pytest.fixture
+def store(backend):
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def _listen(backend):
+    changes = []
+    backend.add_change_listener(changes.append)
+    return changes
+
+
+def test_staged_writes_notify_once_on_commit(backend):
+    changes = _listen(backend)
+    ids = {info.title: info.identifier for info in backend.calendars()}
+
+    work = backend.event_with_identifier("A")
+    work.title = "Moved standup"
+    work.start, work.end = _at(7, 9), _at(7, 10)
+    backend.save_event(work, commit=False)
+    backend.remove_event(backend.event_with_identifier("B"), commit=False)
+    assert changes == []
+
+    backend.commit()
+    assert len(changes) == 1
+    assert changes[0].calendar_ids == {ids["Work"], ids["Home"]}
+    assert set(changes[0].ranges) == {
+        (_at(5, 9), _at(5, 10)), (_at(7, 9), _at(7, 10)), (_at(6, 19), _at(6, 21))
+    }
+
+
+def test_reset_discards_staged_writes(backend):
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    work = backend.event_with_identifier("A")
+    work.title = "Changed"
+    backend.save_event(work, commit=False)
+    backend.remove_event(backend.event_with_identifier("B"), commit=False)
+    added = backend.new_event(ids["Home"])
+    added.start, added.end = _at(8, 12), _at(8, 13)
+    backend.save_event(added, commit=False)
+    assert backend.event_with_identifier("A").title == "Changed"
+
+    backend.reset()
+    assert backend.event_with_identifier("A").title == "Standup"
+    assert backend.event_with_identifier("B").title == "Dinner"
+    assert backend.event_with_identifier(added.identifier) is None
+    assert [e.identifier for e in backend.events_in_range(_at(1), _at(31))] == ["A", "B"]
+
+    # Nothing is left staged for the next commit to deliver
+    changes = _listen(backend)
+    backend.commit()
+    assert changes == []
+
+
+def test_batch_update_commits_and_refreshes_cached_events(store):
+    assert store.get_event("A")["summary"] == "Standup"
+
+    results = store.update_events([
+        {"event_id": "A", "calendar_name": "Work", "summary": "Retro"},
+        {"event_id": "B", "calendar_name": "Home", "location": "Kitchen"},
+    ])
+    assert [r["success"] for r in results] == [True, True]
+    assert store.get_event("A")["summary"] == "Retro"
+    assert store.get_event("B")["location"] == "Kitchen"
+
+
+def test_batch_partial_failure_keeps_the_valid_items(store):
+    results = store.create_events([
+        {"calendar_name": "Work", "summary": "Review", "start_date": "2026-10-12T10:00:00",
+         "end_date": "2026-10-12T11:00:00"},
+        {"calendar_name": "Nowhere", "summary": "Lost", "start_date": "2026-10-12T10:00:00",
+         "end_date": "2026-10-12T11:00:00"},
+        {"calendar_name": "Work", "summary": "No end", "start_date": "2026-10-12T10:00:00"},
+    ])
+    assert [r["success"] for r in results] == [True, False, False]
+    assert "not found" in results[1]["error"]
+    assert "end_date" in results[2]["error"]
+
+    titles = [e["summary"] for e in store.get_events("Work", "2026-10-12", "2026-10-12")]
+    assert titles == ["Review"]
+
+
+def test_failed_commit_rolls_back_the_batch(store, backend, monkeypatch):
+    assert [e["summary"] for e in store.get_events(None, "2026-10-01", "2026-10-31")] == ["Standup", "Dinner"]
+
+    def fail():
+        raise BackendError("disk full")
+    monkeypatch.setattr(backend, "commit", fail)
+
+    results = store.delete_events([
+        {"event_id": "A", "calendar_name": "Work"},
+        {"event_id": "missing", "calendar_name": "Work"},
+    ])
+    assert [r["success"] for r in results] == [False, False]
+    assert results[0]["error"] == "Failed to commit batch: disk full"
+    assert "not found" in results[1]["error"]
+
+    assert store.get_event("A")["summary"] == "Standup"
+    assert [e["summary"] for e in store.get_events(None, "2026-10-01", "2026-10-31")] == ["Standup", "Dinner"]
@@ -0,0 +1,52 @@
+"""
+Tests for calendar name and identifier lookup.
+"""
+from calendar_sse_mcp.backends import CalendarInfo
+from calendar_sse_mcp.calendar_registry import CalendarRegistry
+
+
+def _calendar(identifier, title, source="Local"):
+    return CalendarInfo(identifier=identifier, title=title, source=source)
+
+
+def test_duplicate_titles_resolve_by_account():
+    registry = CalendarRegistry(lambda: [
+        _calendar("B", "Work", "iCloud"), _calendar("A", "Work", "Exchange"), _calendar("C", "Home")
+    ])
+    assert registry.get("Work").identifier == "A"
+    assert registry.get("Work (iCloud)").identifier == "B"
+    assert registry.get("C").title == "Home"
+    assert registry.matches("Work", "B")
+    assert registry.titles() == ["Work", "Work", "Home"]
+
+
+def test_listing_is_cached_until_invalidated():
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return [_calendar("A", f"Calendar {len(loads)}")]
+
+    registry = CalendarRegistry(loader)
+    assert registry.titles() == ["Calendar 1"]
+    assert registry.titles() == ["Calendar 1"]
+    registry.invalidate()
+    assert registry.titles() == ["Calendar 2"]
+    assert len(loads) == 2
+
+
+def test_change_during_load_discards_the_listing():
+    listing = [[_calendar("A", "Old")]]
+    registry = None
+
+    def loader():
+        current = listing[0]
+        if current[0].title == "Old":
+            # The calendar is renamed, and its notification arrives, mid-load
+            listing[0] = [_calendar("A", "New")]
+            registry.invalidate()
+        return current
+
+    registry = CalendarRegistry(loader)
+    assert registry.titles() == ["New"]
+    assert registry.by_identifier("A").title == "New"
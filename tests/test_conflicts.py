@@ -0,0 +1,90 @@
+"""
+Tests for conflict reports and blocking when creating events.
+"""
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore, CalendarStoreError, EventConflictError
+
+
+def _at(hour, minute=0, day=14):
+    return datetime.datetime(2026, 10, day, hour, minute).timestamp()
+
+
+def _iso(hour, minute=0, day=14):
+    return f"2026-10-{day:02d}T{hour:02d}:{minute:02d}:00"
+
+
+@pytest.fixture
+def store():
+    backend = InMemoryBackend(calendars=("Work", "Home"))
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    backend.load_events([
+        EventRecord(calendar_id=ids["Work"], title="Review", start=_at(10), end=_at(11), identifier="R"),
+        EventRecord(calendar_id=ids["Home"], title="Plumber", start=_at(10, 30), end=_at(12), identifier="P"),
+        EventRecord(calendar_id=ids["Work"], title="Focus", start=_at(13), end=_at(14), busy=False),
+        EventRecord(calendar_id=ids["Work"], title="Conference", start=_at(0), end=_at(0, day=15), all_day=True),
+    ])
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def test_find_conflicts_reports_busy_overlaps_only(store):
+    conflicts = store.find_conflicts(_iso(10, 45), _iso(13, 30))
+    assert [c["id"] for c in conflicts] == ["R", "P"]
+    assert set(conflicts[0]) == {"id", "summary", "start", "end", "calendar"}
+    assert conflicts[1]["calendar"] == "Home"
+
+    assert [c["id"] for c in store.find_conflicts(_iso(10, 45), _iso(13, 30), ["Work"])] == ["R"]
+    # Touching is not overlapping; free and all-day events never conflict
+    assert store.find_conflicts(_iso(12), _iso(15)) == []
+    assert store.find_conflicts(_iso(9), _iso(10)) == []
+
+
+def test_create_event_blocks_on_conflict(store):
+    with pytest.raises(EventConflictError, match="'Review'") as info:
+        store.create_event("Work", "Clash", _iso(10, 15), _iso(10, 45), check_conflicts=True)
+    assert [c["id"] for c in info.value.conflicts] == ["R", "P"]
+    assert all(e["summary"] != "Clash" for e in store.get_events("Work", "2026-10-14", "2026-10-14"))
+
+    created = store.create_event("Work", "Clash", _iso(10, 15), _iso(10, 45))
+    assert store.get_event(created)["summary"] == "Clash"
+    assert store.create_event("Work", "Free slot", _iso(12), _iso(13), check_conflicts=True)
+
+
+def test_batch_conflict_report_includes_proposed_events(store):
+    events = [
+        {"calendar_name": "Work", "summary": "A", "start_date": _iso(15), "end_date": _iso(16)},
+        {"calendar_name": "Work", "summary": "B", "start_date": _iso(15, 30), "end_date": _iso(16, 30)},
+        {"calendar_name": "Home", "summary": "C", "start_date": _iso(11, 30), "end_date": _iso(12, 30)},
+        {"calendar_name": "Home", "summary": "D"},
+    ]
+    checked = store.check_conflicts(events)
+    assert [c["index"] for c in checked[0]["conflicts"]] == [1]
+    assert [c["index"] for c in checked[1]["conflicts"]] == [0]
+    assert [c["id"] for c in checked[2]["conflicts"]] == ["P"]
+    assert "start_date" in checked[3]["error"]
+
+    results = store.create_events(events[:3], conflicts="report")
+    assert [r["success"] for r in results] == [True, True, True]
+    assert [len(r["conflicts"]) for r in results] == [1, 1, 1]
+
+
+def test_batch_block_mode_creates_only_clear_events(store):
+    events = [
+        {"calendar_name": "Work", "summary": "Clear", "start_date": _iso(16), "end_date": _iso(17)},
+        {"calendar_name": "Work", "summary": "Blocked", "start_date": _iso(10), "end_date": _iso(10, 30)},
+    ]
+    results = store.create_events(events, conflicts="block")
+    assert [r["success"] for r in results] == [True, False]
+    assert results[1]["error"] == "Event overlaps 1 busy event(s)"
+    assert [c["id"] for c in results[1]["conflicts"]] == ["R"]
+
+    titles = {e["summary"] for e in store.get_events("Work", "2026-10-14", "2026-10-14")}
+    assert "Clear" in titles and "Blocked" not in titles
+
+    with pytest.raises(CalendarStoreError, match="Unknown conflict mode"):
+        store.create_events(events, conflicts="warn")
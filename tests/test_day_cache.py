@@ -0,0 +1,99 @@
+"""
+Tests for filling the event index in whole days with a per-calendar day LRU.
+"""
+import datetime
+import threading
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore
+from calendar_sse_mcp.event_index import CalendarIndex, day_span
+
+
+def _at(day, hour=0, minute=0):
+    return datetime.datetime(2026, 10, day, hour, minute).timestamp()
+
+
+class _CountingBackend(InMemoryBackend):
+    """In-memory backend recording the ranges it is queried for"""
+
+    def __init__(self):
+        super().__init__(calendars=("Work",))
+        self.queries = []
+        self._queries_lock = threading.Lock()
+
+    def events_in_range(self, start, end, calendar_ids=None, attributes=None):
+        with self._queries_lock:
+            self.queries.append((start, end))
+        return super().events_in_range(start, end, calendar_ids, attributes)
+
+
+@pytest.fixture
+def backend():
+    backend = _CountingBackend()
+    work = backend.calendars()[0].identifier
+    backend.load_events(
+        EventRecord(calendar_id=work, title=f"Day {day}", start=_at(day, 9), end=_at(day, 10))
+        for day in range(1, 31)
+    )
+    return backend
+
+
+def _store(backend, monkeypatch, max_days=None):
+    if max_days is not None:
+        monkeypatch.setenv("CALENDAR_CACHE_MAX_DAYS", str(max_days))
+    return CalendarStore(quiet=True, backend=backend)
+
+
+def test_day_span_widens_to_midnights():
+    assert day_span(_at(10, 8, 30), _at(10, 17)) == (_at(10), _at(11))
+    assert day_span(_at(10, 8), _at(12)) == (_at(10), _at(12))
+
+
+def test_queries_fill_whole_days_and_only_fetch_gaps(backend, monkeypatch):
+    store = _store(backend, monkeypatch)
+    try:
+        store.get_events("Work", "2026-10-10T08:00:00", "2026-10-10T12:00:00")
+        assert backend.queries == [(_at(10), _at(11))]
+
+        # Another window within the same day is answered from memory
+        events = store.get_events("Work", "2026-10-10T09:30:00", "2026-10-10T18:00:00")
+        assert [e["summary"] for e in events] == ["Day 10"]
+        assert len(backend.queries) == 1
+
+        # A wider window fetches only the days not yet covered
+        events = store.get_events("Work", "2026-10-09", "2026-10-12")
+        assert [e["summary"] for e in events] == ["Day 9", "Day 10", "Day 11", "Day 12"]
+        assert sorted(backend.queries[1:]) == [(_at(9), _at(10)), (_at(11), _at(13))]
+    finally:
+        store.close()
+
+
+def test_least_recently_used_days_are_evicted(backend, monkeypatch):
+    store = _store(backend, monkeypatch, max_days=2)
+    try:
+        for day in ("2026-10-01", "2026-10-02", "2026-10-03"):
+            store.get_events("Work", day, day)
+        assert len(backend.queries) == 3
+
+        store.get_events("Work", "2026-10-03", "2026-10-03")
+        assert len(backend.queries) == 3
+        events = store.get_events("Work", "2026-10-01", "2026-10-01")
+        assert [e["summary"] for e in events] == ["Day 1"]
+        assert backend.queries[-1] == (_at(1), _at(2))
+    finally:
+        store.close()
+
+
+def test_calendar_index_trims_oldest_days_first():
+    index = CalendarIndex(max_days=3)
+    for day in (1, 2, 3):
+        index.add_range(_at(day), _at(day + 1), [(f"e{day}", _at(day, 9), _at(day, 10), f"Day {day}")])
+    index.touch(_at(1), _at(2))
+    index.add_range(_at(4), _at(5), [("e4", _at(4, 9), _at(4, 10), "Day 4")])
+
+    assert index.trim() == 1
+    assert index.day_count == 3
+    assert index.query(_at(1), _at(5)) == ["Day 1", "Day 3", "Day 4"]
+    assert index.missing(_at(1), _at(5)) == [(_at(2), _at(3))]
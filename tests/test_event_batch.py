@@ -0,0 +1,83 @@
+"""
+Tests for columnar EventBatch results and field selection.
+"""
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore, CalendarStoreError
+from calendar_sse_mcp.event_batch import EventBatch
+
+
+def _at(day, hour=0):
+    return datetime.datetime(2026, 10, day, hour).timestamp()
+
+
+@pytest.fixture
+def store():
+    backend = InMemoryBackend(calendars=("Work", "Home"))
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    backend.load_events(
+        [
+            EventRecord(calendar_id=ids["Work"], title="Standup", start=_at(day, 9), end=_at(day, 9) + 900,
+                        location="Room 1", notes="")
+            for day in range(1, 11)
+        ] + [
+            EventRecord(calendar_id=ids["Home"], title="Holiday", start=_at(4), end=_at(5), all_day=True,
+                        busy=False, notes="Beach"),
+            EventRecord(calendar_id=ids["Home"], title="Dentist", start=_at(6, 14), end=_at(6, 15),
+                        location="Main St", notes="Bring forms"),
+        ]
+    )
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def test_batch_rows_match_event_dictionaries(store):
+    events = store.get_events(None, "2026-10-01", "2026-10-10")
+    batch = store.get_events(None, "2026-10-01", "2026-10-10", as_batch=True)
+
+    assert isinstance(batch, EventBatch)
+    assert len(batch) == len(events) == 12
+    assert batch.to_dicts() == events
+    assert [row.to_dict() for row in batch] == events
+    assert batch[-1].to_dict() == events[-1]
+    with pytest.raises(IndexError):
+        batch[len(batch)]
+
+
+def test_batch_columns(store):
+    batch = store.get_events(None, "2026-10-01", "2026-10-10", as_batch=True)
+
+    assert list(batch.start_timestamps) == [row.start_ts for row in batch]
+    assert list(batch.end_timestamps) == [row.end_ts for row in batch]
+    assert all(isinstance(value, int) for value in batch.start_timestamps)
+
+    # Repeated values are stored once
+    assert sorted(batch.calendars) == ["Home", "Work"]
+    assert batch.strings.count("Standup") == 1
+    assert batch.strings.count("Room 1") == 1
+
+    holiday = next(row for row in batch if row.summary == "Holiday")
+    assert holiday.all_day and holiday.availability == "free"
+    assert holiday.calendar == "Home" and holiday.description == "Beach"
+
+
+def test_field_selection(store):
+    fields = ["start", "summary"]
+    events = store.get_events("Home", "2026-10-01", "2026-10-10", fields=fields)
+    batch = store.get_events("Home", "2026-10-01", "2026-10-10", fields=fields, as_batch=True)
+
+    # Fields come back in the canonical order, whatever order they were asked in
+    assert [list(event) for event in events] == [["summary", "start"]] * 2
+    assert batch.fields == ("summary", "start")
+    assert batch.to_dicts() == events
+
+    # Columns that were not selected keep their defaults
+    row = batch[0]
+    assert row.id == "" and row.location == "" and row.end_ts is None
+
+    with pytest.raises(CalendarStoreError, match="Unknown event field"):
+        store.get_events("Home", fields=["summary", "attendees"])
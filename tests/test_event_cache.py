@@ -0,0 +1,90 @@
+"""
+Tests for event lookups by identifier and the EventCache behind them.
+"""
+import dataclasses
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore, CalendarStoreError
+from calendar_sse_mcp.event_cache import EventCache
+
+
+def _at(year, month, day, hour=0):
+    return datetime.datetime(year, month, day, hour).timestamp()
+
+
+@pytest.fixture
+def backend():
+    backend = InMemoryBackend(calendars=("Work", "Home"))
+    work = backend.calendars()[0].identifier
+    backend.load_events([
+        EventRecord(calendar_id=work, title="Kickoff", start=_at(2019, 3, 4, 9), end=_at(2019, 3, 4, 10),
+                    location="HQ", last_modified=1.0, identifier="OLD"),
+    ])
+    return backend
+
+
+@pytest.fixture
+def store(backend):
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def test_cache_entries_are_checked_against_last_modified():
+    cache = EventCache(max_size=2)
+    cache.put("a", 1.0, {"summary": "A"})
+    assert cache.get("a", 1.0) == {"summary": "A"}
+    assert cache.get("a", 2.0) is None
+
+    # Callers get copies
+    cache.get("a", 1.0)["summary"] = "changed"
+    assert cache.get("a", 1.0) == {"summary": "A"}
+
+    cache.put("b", 1.0, {"summary": "B"})
+    cache.get("a", 1.0)
+    cache.put("c", 1.0, {"summary": "C"})
+    assert cache.get("b", 1.0) is None
+    assert cache.get("a", 1.0) is not None
+    assert cache.stats()["size"] == 2
+
+    disabled = EventCache(max_size=0)
+    disabled.put("a", 1.0, {"summary": "A"})
+    assert disabled.get("a", 1.0) is None
+
+
+def test_get_event_finds_events_outside_any_window(store):
+    event = store.get_event("OLD")
+    assert event["summary"] == "Kickoff"
+    assert event["calendar"] == "Work"
+    assert store.get_event("OLD", "Work", fields=["location", "id"]) == {"id": "OLD", "location": "HQ"}
+
+    with pytest.raises(CalendarStoreError, match="not in calendar 'Home'"):
+        store.get_event("OLD", "Home")
+    with pytest.raises(CalendarStoreError, match="not found"):
+        store.get_event("NOPE")
+
+
+def test_edits_are_seen_through_last_modified(store, backend):
+    store.get_event("OLD")
+    hits = store.event_cache.stats()["hits"]
+    assert store.get_event("OLD")["summary"] == "Kickoff"
+    assert store.event_cache.stats()["hits"] == hits + 1
+
+    # An edit from elsewhere bumps the last-modified date
+    record = dataclasses.replace(backend.event_with_identifier("OLD"), title="Kickoff (moved)", last_modified=2.0)
+    backend.load_events([record])
+    assert store.get_event("OLD")["summary"] == "Kickoff (moved)"
+
+
+def test_store_writes_drop_cached_events(store):
+    store.get_event("OLD")
+    store.update_event("OLD", "Work", summary="Renamed")
+    assert store.get_event("OLD")["summary"] == "Renamed"
+
+    store.delete_event("OLD", "Work")
+    with pytest.raises(CalendarStoreError, match="not found"):
+        store.get_event("OLD")
+    assert len(store.event_cache) == 0
@@ -0,0 +1,72 @@
+"""
+Tests for the interval and per-calendar event indexes.
+"""
+import random
+
+import pytest
+
+from calendar_sse_mcp.event_index import EventIndex, IntervalIndex
+
+
+def _brute_force(intervals, start, end):
+    return sorted(key for key, (s, e) in intervals.items() if s < end and start < e)
+
+
+@pytest.mark.parametrize("size", [5, 15, 16, 17, 100, 1000])
+def test_overlap_matches_brute_force(size):
+    rng = random.Random(size)
+    index = IntervalIndex()
+    intervals = {}
+    for key in range(size):
+        start = float(rng.randint(0, 500))
+        end = start + rng.choice([0, 1, 5, 30, 200])
+        index.add(key, start, end, key)
+        intervals[key] = (start, end)
+
+    for _ in range(200):
+        start = float(rng.randint(-10, 520))
+        end = start + rng.randint(1, 100)
+        assert sorted(index.overlap(start, end)) == _brute_force(intervals, start, end)
+
+
+@pytest.mark.parametrize("size", [5, 50])
+def test_touching_intervals_do_not_overlap(size):
+    index = IntervalIndex()
+    for key in range(size):
+        index.add(key, key * 10.0, key * 10.0 + 10.0, key)
+
+    # [20, 30) touches the intervals ending at 20 and starting at 30
+    assert index.overlap(20.0, 30.0) == [2]
+    assert index.overlap(19.0, 20.0) == [1]
+    assert index.overlap(29.5, 30.5) == [2, 3]
+
+
+def test_results_follow_updates_in_start_order():
+    index = IntervalIndex()
+    for key in range(40):
+        index.add(key, float(40 - key), float(40 - key) + 5.0, key)
+    assert index.overlap(10.0, 12.0) == [34, 33, 32, 31, 30, 29]
+
+    index.remove(30)
+    index.add(34, 100.0, 101.0, "moved")
+    assert index.overlap(10.0, 12.0) == [33, 32, 31, 29]
+    assert index.overlap_items(100.0, 100.5) == [(100.0, 101.0, "moved")]
+    assert index.bounds(34) == (100.0, 101.0)
+    assert 30 not in index
+
+
+def test_add_range_is_dropped_after_invalidation():
+    index = EventIndex()
+    generation = index.generation("work")
+    index.invalidate(["work"], [(0.0, 10.0)])
+    assert not index.add_range("work", generation, 0.0, 86400.0, [("a", 1.0, 2.0, "a")])
+
+    generation = index.generation("work")
+    other = index.generation("home")
+    index.invalidate(["home"])
+    assert index.add_range("work", generation, 0.0, 86400.0, [("a", 1.0, 2.0, "a")])
+    assert not index.add_range("home", other, 0.0, 86400.0, [])
+
+    generation = index.generation("work")
+    index.clear()
+    assert not index.add_range("work", generation, 0.0, 86400.0, [])
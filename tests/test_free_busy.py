@@ -0,0 +1,91 @@
+"""
+Tests for the free/busy merge and overlap sweep, against brute-force references.
+"""
+import random
+
+import numpy as np
+import pytest
+
+from calendar_sse_mcp.free_busy import free_gaps, merge_busy, overlap_pairs
+
+
+def _random_intervals(rng, count, span=200):
+    starts = [float(rng.randint(0, span)) for _ in range(count)]
+    ends = [start + rng.choice([0, 0, 1, 3, 10, 40]) for start in starts]
+    return starts, ends
+
+
+def _busy_minutes(starts, ends, window_start, window_end):
+    """Integer unit cells [t, t + 1) covered by any interval inside the window"""
+    busy = set()
+    for start, end in zip(starts, ends):
+        busy.update(range(int(max(start, window_start)), int(min(end, window_end))))
+    return busy
+
+
+def _runs(cells):
+    """Maximal runs of consecutive cells as (start, end) pairs"""
+    runs = []
+    for cell in sorted(cells):
+        if runs and runs[-1][1] == cell:
+            runs[-1][1] = cell + 1
+        else:
+            runs.append([cell, cell + 1])
+    return [tuple(map(float, run)) for run in runs]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_merge_busy_matches_brute_force(seed):
+    rng = random.Random(seed)
+    starts, ends = _random_intervals(rng, rng.randint(0, 60))
+    window_start, window_end = 20.0, 180.0
+
+    block_starts, block_ends = merge_busy(np.array(starts), np.array(ends), window_start, window_end)
+    busy = _busy_minutes(starts, ends, window_start, window_end)
+    assert list(zip(block_starts.tolist(), block_ends.tolist())) == _runs(busy)
+
+    gap_starts, gap_ends = free_gaps(block_starts, block_ends, window_start, window_end)
+    free = set(range(int(window_start), int(window_end))) - busy
+    assert list(zip(gap_starts.tolist(), gap_ends.tolist())) == _runs(free)
+
+
+def test_touching_intervals_merge_into_one_block():
+    block_starts, block_ends = merge_busy(np.array([0.0, 10.0, 30.0]), np.array([10.0, 20.0, 40.0]), 0.0, 100.0)
+    assert block_starts.tolist() == [0.0, 30.0]
+    assert block_ends.tolist() == [20.0, 40.0]
+
+
+def test_merge_busy_with_nothing_in_window():
+    block_starts, block_ends = merge_busy(np.array([0.0]), np.array([5.0]), 10.0, 20.0)
+    assert block_starts.size == 0 and block_ends.size == 0
+    gap_starts, gap_ends = free_gaps(block_starts, block_ends, 10.0, 20.0)
+    assert gap_starts.tolist() == [10.0] and gap_ends.tolist() == [20.0]
+
+
+def _overlapping_pairs(starts, ends, probes):
+    pairs = set()
+    for i in range(len(starts)):
+        if not probes[i]:
+            continue
+        for j in range(len(starts)):
+            if i != j and starts[i] < ends[j] and starts[j] < ends[i]:
+                pairs.add((i, j))
+    return pairs
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_overlap_pairs_matches_brute_force(seed):
+    rng = random.Random(seed)
+    starts, ends = _random_intervals(rng, rng.randint(0, 80), span=100)
+    probes = [rng.random() < 0.3 for _ in starts]
+
+    pairs = overlap_pairs(starts, ends, probes)
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == _overlapping_pairs(starts, ends, probes)
+
+
+def test_overlap_pairs_edges():
+    # Touching, an empty interval at another's start, and one inside another
+    starts = [0.0, 10.0, 10.0, 15.0]
+    ends = [10.0, 20.0, 10.0, 15.0]
+    assert sorted(overlap_pairs(starts, ends, [True] * 4)) == [(1, 3), (3, 1)]
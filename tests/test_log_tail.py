@@ -0,0 +1,102 @@
+"""
+Tests for reading and filtering the server's log files.
+"""
+import datetime
+import json
+
+import pytest
+
+from calendar_sse_mcp import log_tail
+from calendar_sse_mcp.log_tail import LogFilter, _FollowedFile, reverse_lines, tail_lines
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 7, 64 * 1024])
+@pytest.mark.parametrize("content", [
+    b"",
+    b"\n",
+    b"one",
+    b"one\n",
+    b"one\ntwo",
+    b"one\ntwo\n",
+    b"\n\nthree\n\n",
+    b"alpha\r\nbeta\r\n",
+    "日本語\nline\n".encode("utf-8"),
+])
+def test_reverse_lines_matches_forward_read(tmp_path, content, block_size):
+    path = tmp_path / "log"
+    path.write_bytes(content)
+    expected = content.decode("utf-8").splitlines()
+    assert list(reverse_lines(path, block_size=block_size)) == expected[::-1]
+
+
+def test_reverse_lines_long_lines_across_blocks(tmp_path):
+    lines = [f"{i}:" + "x" * (i * 37 % 200) for i in range(300)]
+    path = tmp_path / "log"
+    path.write_text("\n".join(lines))
+    assert list(reverse_lines(path, block_size=64)) == lines[::-1]
+
+
+def _record(level, moment, message):
+    return json.dumps({"time": moment.isoformat(), "level": level, "logger": "calendar_sse_mcp", "message": message})
+
+
+def test_tail_lines_filters_by_level_and_time(tmp_path):
+    start = datetime.datetime(2026, 10, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    levels = ["debug", "info", "warning", "error"]
+    lines = [_record(levels[i % 4], start + datetime.timedelta(minutes=i), f"m{i}") for i in range(40)]
+    path = tmp_path / "server.log"
+    path.write_text("\n".join(lines + ["plain text"]) + "\n")
+
+    assert tail_lines(path, 2) == [lines[-1], "plain text"]
+    assert tail_lines(path, 3, LogFilter("error")) == [lines[31], lines[35], lines[39]]
+
+    window = LogFilter("warning", since=start + datetime.timedelta(minutes=30),
+                       until=start + datetime.timedelta(minutes=36))
+    assert tail_lines(path, 100, window) == [lines[30], lines[31], lines[34], lines[35]]
+
+
+def test_followed_file_survives_rotation_and_truncation(tmp_path):
+    path = tmp_path / "server.log"
+    path.write_text("old\n")
+    followed = _FollowedFile(path, from_start=False)
+    try:
+        with open(path, "a") as f:
+            f.write("first\nsecond")
+        assert followed.poll() == ["first"]
+
+        with open(path, "a") as f:
+            f.write(" half\n")
+        path.rename(tmp_path / "server.log.1")
+        path.write_text("rotated\n")
+        assert followed.poll() == ["second half", "rotated"]
+
+        path.write_text("")
+        assert followed.poll() == []
+        path.write_text("again\n")
+        assert followed.poll() == ["again"]
+    finally:
+        followed.close()
+
+
+def test_followed_file_keeps_lines_written_during_rotation(tmp_path, monkeypatch):
+    path = tmp_path / "server.log"
+    path.write_text("")
+    followed = _FollowedFile(path, from_start=False)
+    real_stat = log_tail.os.stat
+
+    def rotate_then_stat(target, *args, **kwargs):
+        # The writer logs once more after poll() has drained, then rotates
+        with open(path, "a") as f:
+            f.write("last old line\n")
+        path.rename(tmp_path / "server.log.1")
+        path.write_text("first new line\n")
+        monkeypatch.setattr(log_tail.os, "stat", real_stat)
+        return real_stat(target, *args, **kwargs)
+
+    try:
+        with open(path, "a") as f:
+            f.write("before\n")
+        monkeypatch.setattr(log_tail.os, "stat", rotate_then_stat)
+        assert followed.poll() == ["before", "last old line", "first new line"]
+    finally:
+        followed.close()
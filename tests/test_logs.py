@@ -0,0 +1,37 @@
+"""
+Tests for routing the package's log records.
+"""
+import json
+import logging
+
+import pytest
+
+from calendar_sse_mcp.logs import PACKAGE_LOGGER, configure_cli_logging, configure_logging, stop_logging
+
+
+@pytest.fixture
+def package_logger():
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    handlers, level = list(logger.handlers), logger.level
+    yield logging.getLogger(f"{PACKAGE_LOGGER}.test")
+    stop_logging()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def test_cli_prints_warnings_only(package_logger, capsys):
+    configure_cli_logging()
+    package_logger.info("Request completed")
+    package_logger.warning("Calendar access denied")
+    assert capsys.readouterr().err == "Calendar access denied\n"
+
+
+def test_server_logging_replaces_cli_output(package_logger, capsys, tmp_path):
+    configure_cli_logging()
+    path = configure_logging(log_file=str(tmp_path / "server.log"), level="info")
+    package_logger.info("Request completed", extra={"status": "ok"})
+    stop_logging()
+
+    assert capsys.readouterr().err == ""
+    record = json.loads(path.read_text().splitlines()[-1])
+    assert record["message"] == "Request completed" and record["status"] == "ok"
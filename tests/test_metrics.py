@@ -0,0 +1,69 @@
+"""
+Tests for the Prometheus exposition served from /metrics.
+"""
+import asyncio
+import json
+
+from starlette.testclient import TestClient
+
+from calendar_sse_mcp import server
+from calendar_sse_mcp.metrics import MetricsRegistry
+
+
+def test_counters_and_histograms_render_in_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests", ["handler"])
+    assert registry.counter("demo_requests_total", "Requests", ["handler"]) is requests
+    requests.inc(handler="list")
+    requests.inc(2, handler='say "hi"')
+    latency = registry.histogram("demo_seconds", "Latency", ["handler"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value, handler="list")
+
+    lines = registry.render().splitlines()
+    assert lines[:4] == [
+        "# HELP demo_requests_total Requests",
+        "# TYPE demo_requests_total counter",
+        'demo_requests_total{handler="list"} 1',
+        'demo_requests_total{handler="say \\"hi\\""} 2',
+    ]
+    assert lines[4:] == [
+        "# HELP demo_seconds Latency",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{handler="list",le="0.1"} 1',
+        'demo_seconds_bucket{handler="list",le="1"} 2',
+        'demo_seconds_bucket{handler="list",le="+Inf"} 3',
+        'demo_seconds_sum{handler="list"} 3.55',
+        'demo_seconds_count{handler="list"} 3',
+    ]
+
+
+def test_collectors_are_read_at_render_time():
+    registry = MetricsRegistry()
+    size = [3]
+    registry.collector("demo_cache", "Cache size", "gauge", lambda: [({"stat": "size"}, size[0])])
+    registry.collector("demo_broken", "Fails", "gauge", lambda: 1 / 0)
+
+    assert 'demo_cache{stat="size"} 3' in registry.render()
+    size[0] = 5
+    text = registry.render()
+    assert 'demo_cache{stat="size"} 5' in text
+    assert "demo_broken" not in text
+
+
+def test_metrics_route_reports_handler_requests():
+    @server._instrument
+    async def demo_metrics_tool():
+        return json.dumps({"error": "nope"})
+
+    asyncio.run(demo_metrics_tool())
+    asyncio.run(demo_metrics_tool())
+
+    response = TestClient(server.mcp.sse_app()).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert 'calendar_mcp_requests_total{handler="demo_metrics_tool"} 2' in lines
+    assert 'calendar_mcp_request_errors_total{handler="demo_metrics_tool"} 2' in lines
+    assert 'calendar_mcp_request_duration_seconds_count{handler="demo_metrics_tool"} 2' in lines
+    assert "# TYPE calendar_mcp_response_bytes histogram" in lines
@@ -0,0 +1,93 @@
+"""
+Tests for running blocking handlers on the bounded handler pool.
+"""
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from calendar_sse_mcp import server
+
+_REQUEST = contextvars.ContextVar("request", default=None)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test-handler")
+    monkeypatch.setattr(server, "_handler_pool", pool)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_slow_call_times_out_without_blocking_the_loop(pool, monkeypatch):
+    monkeypatch.setattr(server, "_CALL_TIMEOUT", 0.1)
+    release = threading.Event()
+    finished = threading.Event()
+
+    @server._offload
+    def slow_tool():
+        release.wait(5)
+        finished.set()
+        return json.dumps({"ok": True})
+
+    @server._offload
+    def fast_tool():
+        return json.dumps({"ok": True})
+
+    async def run():
+        slow = asyncio.ensure_future(slow_tool())
+        # The loop keeps serving other calls while the slow one blocks its thread
+        assert json.loads(await fast_tool()) == {"ok": True}
+        return await slow
+
+    started = time.perf_counter()
+    response = asyncio.run(run())
+    assert time.perf_counter() - started < 2
+    assert json.loads(response) == {"error": "slow_tool timed out after 0.1 seconds"}
+    assert not server._is_success_response(response)
+
+    # The work itself still completes in the background
+    release.set()
+    assert finished.wait(5)
+
+
+def test_pool_bounds_concurrency(pool, monkeypatch):
+    monkeypatch.setattr(server, "_CALL_TIMEOUT", 0)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    @server._offload
+    def tool(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(i)
+        return json.dumps({"i": i})
+
+    async def run():
+        return await asyncio.gather(*(tool(i) for i in range(6)))
+
+    responses = asyncio.run(run())
+    assert [json.loads(r)["i"] for r in responses] == list(range(6))
+    assert max(peak) == 2
+
+
+def test_calls_run_in_the_callers_context(pool):
+    @server._offload
+    def tool():
+        return json.dumps({"request": _REQUEST.get(), "thread": threading.current_thread().name})
+
+    async def run():
+        _REQUEST.set("r-1")
+        return json.loads(await tool())
+
+    result = asyncio.run(run())
+    assert result["request"] == "r-1"
+    assert result["thread"].startswith("test-handler")
@@ -0,0 +1,76 @@
+"""
+Tests for sampling handler calls with cProfile and keeping the slowest.
+"""
+import time
+
+import pytest
+
+from calendar_sse_mcp import profiler
+from calendar_sse_mcp.profiler import CallProfiler, arguments_hash
+
+
+def _sleep_for(seconds):
+    def call():
+        time.sleep(seconds)
+        return seconds
+    return call
+
+
+def test_only_sampled_calls_are_profiled(tmp_path, monkeypatch):
+    calls = CallProfiler(rate=0.5, directory=tmp_path)
+    draws = iter([0.7, 0.2, 0.5, 0.49])
+    monkeypatch.setattr(profiler.random, "random", lambda: next(draws))
+
+    assert [calls.run("tool", "h", lambda: i) for i in range(4)] == [0, 1, 2, 3]
+    assert len(calls.profiles()) == 2
+
+    disabled = CallProfiler(rate=0.0, directory=tmp_path / "off")
+    assert disabled.run("tool", "h", lambda: "ok") == "ok"
+    assert disabled.profiles() == []
+
+
+def test_keeps_the_slowest_profiles(tmp_path):
+    calls = CallProfiler(rate=1.0, directory=tmp_path, keep=2)
+    for seconds in (0.02, 0.08, 0.05, 0.01):
+        calls.run("get_events", arguments_hash((seconds,), {}), _sleep_for(seconds))
+
+    kept = calls.profiles()
+    assert len(kept) == 2
+    assert kept[0]["duration"] >= 0.08 > kept[1]["duration"] >= 0.05
+    assert {entry["handler"] for entry in kept} == {"get_events"}
+    assert kept[0]["args_hash"] == arguments_hash((0.08,), {})
+    assert len(list(tmp_path.glob("*.prof"))) == len(list(tmp_path.glob("*.json"))) == 2
+
+    # Another profiler over the same directory sees the same profiles
+    assert CallProfiler(rate=1.0, directory=tmp_path, keep=2).profiles() == kept
+
+    assert "sleep" in calls.report(kept[0]["id"], sort="tottime", lines=5)
+    with pytest.raises(KeyError):
+        calls.report("missing")
+
+    assert calls.clear() == 2
+    assert calls.profiles() == [] and list(tmp_path.iterdir()) == []
+
+
+def test_calls_run_unprofiled_while_another_is_profiled(tmp_path):
+    calls = CallProfiler(rate=1.0, directory=tmp_path)
+    with profiler._ACTIVE:
+        assert calls.run("tool", "h", lambda: "ok") == "ok"
+    assert calls.profiles() == []
+
+
+def test_failing_calls_are_profiled_and_reraised(tmp_path):
+    calls = CallProfiler(rate=1.0, directory=tmp_path)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        calls.run("tool", "h", fail)
+    assert len(calls.profiles()) == 1
+
+
+def test_arguments_hash_is_stable():
+    assert arguments_hash(("Work",), {"b": 1, "a": 2}) == arguments_hash(("Work",), {"a": 2, "b": 1})
+    assert arguments_hash(("Work",), {}) != arguments_hash(("Home",), {})
+    assert len(arguments_hash((), {})) == 12
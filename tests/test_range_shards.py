@@ -0,0 +1,88 @@
+"""
+Tests for splitting wide range queries into per-calendar, per-window shards.
+"""
+import datetime
+import random
+import threading
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore
+
+DAY = 24 * 60 * 60
+
+
+class _CountingBackend(InMemoryBackend):
+    """In-memory backend recording every range query"""
+
+    def __init__(self):
+        super().__init__(calendars=("Work", "Home", "Team"))
+        self.queries = []
+        self._queries_lock = threading.Lock()
+
+    def events_in_range(self, start, end, calendar_ids=None, attributes=None):
+        with self._queries_lock:
+            self.queries.append((tuple(calendar_ids) if calendar_ids is not None else None, start, end))
+        return super().events_in_range(start, end, calendar_ids, attributes)
+
+
+def _at(year, month, day, hour=0):
+    return datetime.datetime(year, month, day, hour).timestamp()
+
+
+@pytest.fixture
+def backend():
+    backend = _CountingBackend()
+    ids = [info.identifier for info in backend.calendars()]
+    rng = random.Random(9)
+    origin = _at(2025, 1, 1)
+    records = []
+    for i in range(400):
+        start = origin + rng.randrange(0, 720) * DAY + rng.randrange(0, 24) * 3600
+        # Mostly short events, some lasting weeks so they cross shard windows
+        length = rng.choice([3600, 7200, 3 * DAY, 45 * DAY])
+        records.append(EventRecord(calendar_id=rng.choice(ids), title=f"Event {i}", start=start, end=start + length))
+    backend.load_events(records)
+    return backend
+
+
+def _store(backend, workers, shard_days=30):
+    store = CalendarStore(quiet=True, backend=backend, cache=False)
+    store.fetch_workers = workers
+    store.shard_days = shard_days
+    return store
+
+
+def test_sharded_fetch_matches_a_single_query(backend):
+    plain = _store(backend, workers=1)
+    sharded = _store(backend, workers=4)
+    try:
+        expected = plain.get_events(None, "2025-03-01", "2026-08-31")
+        backend.queries.clear()
+        events = sharded.get_events(None, "2025-03-01", "2026-08-31")
+    finally:
+        plain.close()
+        sharded.close()
+
+    # Every event once, even those overlapping several windows
+    ids = [event["id"] for event in events]
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(event["id"] for event in expected)
+    assert [event["start"] for event in events] == sorted(event["start"] for event in events)
+
+    # One query per calendar and 30-day window
+    windows = {(start, end) for _, start, end in backend.queries}
+    assert all(len(calendars) == 1 for calendars, _, _ in backend.queries)
+    assert len(backend.queries) == 3 * len(windows)
+    assert max(end - start for start, end in windows) <= 30 * DAY
+
+
+def test_short_ranges_are_not_sharded(backend):
+    store = _store(backend, workers=4)
+    try:
+        backend.queries.clear()
+        store.get_events("Work", "2025-03-01", "2025-03-20")
+    finally:
+        store.close()
+    assert len(backend.queries) == 1
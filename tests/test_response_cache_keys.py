@@ -0,0 +1,72 @@
+"""
+Tests for keying cached range resources on the range the store resolves.
+"""
+import datetime
+import json
+
+import pytest
+
+from calendar_sse_mcp import calendar_store, server
+from calendar_sse_mcp.backends import InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = CalendarStore(quiet=True, backend=InMemoryBackend(calendars=("Work",)))
+    monkeypatch.setattr(server, "_global_calendar_store", store)
+    yield store
+    store.close()
+
+
+def _counting(key):
+    calls = []
+
+    @server._cache_response(key=key)
+    def handler(calendar_name, start_date=None, end_date=None):
+        calls.append((start_date, end_date))
+        return json.dumps([len(calls)])
+
+    return handler, calls
+
+
+def test_equivalent_dates_share_an_entry(store):
+    handler, calls = _counting(server._resource_range_key)
+
+    first = handler("Work", "2026-10-10", "2026-10-10")
+    assert handler("Work", "2026-10-10T00:00:00", "2026-10-10T23:59:59") == first
+    assert handler(calendar_name="Work", start_date="2026-10-10T00:00", end_date="2026-10-10") == first
+    assert len(calls) == 1
+
+    handler("Work", "2026-10-10", "2026-10-11")
+    assert len(calls) == 2
+
+
+def test_api_dates_resolve_before_keying(store):
+    handler, calls = _counting(server._api_range_key)
+
+    handler("Work", "2026-10-10", "2026-10-12")
+    handler("Work", "10 October 2026", "October 12, 2026")
+    assert len(calls) == 1
+
+
+def test_unparseable_dates_are_served_uncached(store):
+    handler, calls = _counting(server._api_range_key)
+
+    handler("Work", "2026-10-12", "2026-10-10")
+    handler("Work", "2026-10-12", "2026-10-10")
+    assert len(calls) == 2
+
+
+def test_default_window_moves_with_the_clock(store, monkeypatch):
+    handler, calls = _counting(server._default_range_key)
+    now = datetime.datetime(2026, 10, 17, 12).timestamp()
+    monkeypatch.setattr(calendar_store.time, "time", lambda: now)
+
+    handler("Work")
+    handler("Work")
+    assert len(calls) == 1
+
+    now += 60
+    handler("Work")
+    assert len(calls) == 2
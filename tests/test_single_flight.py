@@ -0,0 +1,125 @@
+"""
+Tests for request coalescing.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from calendar_sse_mcp.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_threads_share_the_leaders_result():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    runs = []
+    results = []
+
+    def work():
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", work)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", work))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.shared < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(runs) == 1
+    assert sorted(results) == [("result", False)] + [("result", True)] * 3
+    assert flight.stats()["coalesced"] == 3
+    # The flight is over, so the next call runs again
+    assert flight.do("key", lambda: "next") == ("next", False)
+
+
+def test_thread_failure_ends_the_flight():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: 1) == (1, False)
+
+
+def test_followers_survive_leader_cancellation():
+    async def scenario():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await release.wait()
+            return "ok"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        assert leader.cancelled()
+        assert flight.in_flight("key")
+
+        release.set()
+        assert await asyncio.gather(*followers) == ["ok"] * 3
+        assert runs == [1]
+        assert not flight.in_flight("key")
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_every_caller_still_ends_the_flight():
+    async def scenario():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            raise ValueError("boom")
+
+        caller = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # The failed flight is gone, and its error did not leak to a new caller
+        assert not flight.in_flight("key")
+
+        async def fresh():
+            return "fresh"
+
+        assert await flight.do("key", fresh) == "fresh"
+
+    asyncio.run(scenario())
+
+
+def test_async_failure_reaches_followers():
+    async def scenario():
+        flight = AsyncSingleFlight()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(flight.do("key", work), flight.do("key", work), return_exceptions=True)
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert flight.stats()["executed"] == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,87 @@
+"""
+Tests for finding meeting slots common to several calendars.
+"""
+import datetime
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend
+from calendar_sse_mcp.calendar_store import CalendarStore, CalendarStoreError
+
+# 2026-10-12 is a Monday
+MONDAY = "2026-10-12"
+
+
+def _at(day, hour, minute=0):
+    return datetime.datetime(2026, 10, day, hour, minute).timestamp()
+
+
+@pytest.fixture
+def store():
+    backend = InMemoryBackend(calendars=("Work", "Home"))
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    backend.load_events([
+        EventRecord(calendar_id=ids["Work"], title="Planning", start=_at(12, 10), end=_at(12, 11)),
+        EventRecord(calendar_id=ids["Home"], title="School run", start=_at(12, 13), end=_at(12, 14)),
+        EventRecord(calendar_id=ids["Home"], title="Tentative", start=_at(12, 15), end=_at(12, 16), busy=False),
+        EventRecord(calendar_id=ids["Work"], title="Offsite", start=_at(13, 0), end=_at(14, 0), all_day=True),
+    ])
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def _slots(result):
+    return [(slot["start"][11:16], slot["end"][11:16]) for slot in result["slots"]]
+
+
+def test_slots_avoid_every_calendar_within_working_hours(store):
+    result = store.find_available_slots(60, start_date=MONDAY, end_date=MONDAY,
+                                        working_hours_start="09:00", working_hours_end="17:00")
+    assert result["calendars"] == ["Work", "Home"]
+    # Free events do not block; slots run back to back from 15-minute boundaries
+    assert _slots(result) == [("09:00", "10:00"), ("11:00", "12:00"), ("12:00", "13:00"),
+                              ("14:00", "15:00"), ("15:00", "16:00")]
+    assert result["count"] == 5
+
+    work_only = store.find_available_slots(60, ["Work"], MONDAY, MONDAY, "12:00", "15:00")
+    assert _slots(work_only) == [("12:00", "13:00"), ("13:00", "14:00"), ("14:00", "15:00")]
+
+
+def test_buffer_keeps_time_free_around_events(store):
+    result = store.find_available_slots(60, ["Work"], MONDAY, MONDAY, "09:00", "12:30", buffer_minutes=15)
+    # 09:00-09:45 is too short; after the meeting the next boundary is 11:15
+    assert _slots(result) == [("11:15", "12:15")]
+
+    result = store.find_available_slots(30, ["Work"], MONDAY, MONDAY, "09:00", "12:00", buffer_minutes=15)
+    assert _slots(result) == [("09:00", "09:30"), ("11:15", "11:45")]
+
+
+def test_weekdays_and_all_day_events(store):
+    weekend = store.find_available_slots(60, ["Work"], "2026-10-10", "2026-10-11", "09:00", "11:00")
+    assert weekend["slots"] == []
+    saturday = store.find_available_slots(60, ["Work"], "2026-10-10", "2026-10-11", "09:00", "11:00",
+                                          days=["sat"])
+    assert [slot["start"] for slot in saturday["slots"]] == ["2026-10-10T09:00:00", "2026-10-10T10:00:00"]
+
+    # All-day events only block time when asked to
+    tuesday = "2026-10-13"
+    assert store.find_available_slots(60, ["Work"], tuesday, tuesday, "09:00", "10:00")["count"] == 1
+    assert store.find_available_slots(60, ["Work"], tuesday, tuesday, "09:00", "10:00",
+                                      include_all_day=True)["count"] == 0
+
+
+def test_preferred_days_are_listed_first(store):
+    result = store.find_available_slots(60, ["Work"], MONDAY, "2026-10-13", "09:00", "10:00",
+                                        preferred_days=["tuesday"])
+    assert [slot["start"][:10] for slot in result["slots"]] == ["2026-10-13", MONDAY]
+
+
+def test_invalid_constraints(store):
+    with pytest.raises(CalendarStoreError, match="working_hours_end"):
+        store.find_available_slots(60, start_date=MONDAY, end_date=MONDAY,
+                                   working_hours_start="17:00", working_hours_end="09:00")
+    with pytest.raises(CalendarStoreError, match="Unknown weekday"):
+        store.find_available_slots(60, start_date=MONDAY, end_date=MONDAY, days=["someday"])
+    with pytest.raises(CalendarStoreError, match="not found"):
+        store.find_available_slots(60, ["Nowhere"], MONDAY, MONDAY)
@@ -0,0 +1,91 @@
+"""
+Tests for invalidating CalendarStore caches from backend change notifications.
+"""
+import datetime
+import json
+
+import pytest
+
+from calendar_sse_mcp.backends import EventRecord, InMemoryBackend, StoreChange
+from calendar_sse_mcp.calendar_store import CalendarStore
+
+
+def _at(day, hour=0):
+    return datetime.datetime(2026, 10, day, hour).timestamp()
+
+
+@pytest.fixture
+def backend():
+    backend = InMemoryBackend(calendars=("Work", "Home"))
+    ids = {info.title: info.identifier for info in backend.calendars()}
+    backend.load_events(
+        EventRecord(calendar_id=ids[title], title=f"{title} {day}", start=_at(day, 9), end=_at(day, 10))
+        for title in ids
+        for day in range(1, 31)
+    )
+    return backend
+
+
+@pytest.fixture
+def store(backend):
+    store = CalendarStore(quiet=True, backend=backend)
+    yield store
+    store.close()
+
+
+def _ids(backend):
+    return {info.title: info.identifier for info in backend.calendars()}
+
+
+def _cache(store, calendar, start, end):
+    """Build and cache a response reading one calendar's events"""
+    key = (calendar, start, end)
+    store.cached_response(key, lambda: json.dumps(store.get_events(calendar, start, end)))
+    return key
+
+
+def test_scoped_change_keeps_other_calendars_and_dates(backend, store):
+    ids = _ids(backend)
+    work_early = _cache(store, "Work", "2026-10-01", "2026-10-05")
+    work_month = _cache(store, "Work", "2026-10-01", "2026-10-31")
+    home_month = _cache(store, "Home", "2026-10-01", "2026-10-31")
+
+    backend._notify(StoreChange(calendar_ids=frozenset([ids["Work"]]), ranges=((_at(10, 9), _at(10, 10)),)))
+
+    assert store.response_cache.get(work_month) is None
+    assert store.response_cache.get(work_early) is not None
+    assert store.response_cache.get(home_month) is not None
+
+    work = store.event_index.calendar(ids["Work"])
+    home = store.event_index.calendar(ids["Home"])
+    assert work.missing(_at(10), _at(11))
+    assert not work.missing(_at(20), _at(21))
+    assert not home.missing(_at(10), _at(11))
+
+
+def test_unscoped_change_drops_everything(backend, store):
+    ids = _ids(backend)
+    key = _cache(store, "Home", "2026-10-01", "2026-10-31")
+
+    backend._notify(StoreChange())
+
+    assert store.response_cache.get(key) is None
+    assert store.event_index.calendar(ids["Home"]).missing(_at(10), _at(11))
+
+
+def test_calendar_change_drops_responses(backend, store):
+    key = _cache(store, "Home", "2026-10-01", "2026-10-31")
+    backend.add_calendar("Team")
+    assert store.response_cache.get(key) is None
+    assert "Team" in store.get_all_calendars()
+
+
+def test_external_write_is_visible(backend, store):
+    ids = _ids(backend)
+    assert len(store.get_events("Work", "2026-10-10", "2026-10-10")) == 1
+
+    backend.load_events([EventRecord(calendar_id=ids["Work"], title="Added", start=_at(10, 14), end=_at(10, 15))])
+
+    titles = [event["summary"] for event in store.get_events("Work", "2026-10-10", "2026-10-10")]
+    assert sorted(titles) == ["Added", "Work 10"]
+    assert len(store.get_events("Home", "2026-10-10", "2026-10-10")) == 1
@@ -0,0 +1,73 @@
+"""
+Tests for the substring (trigram) index.
+"""
+import random
+
+import pytest
+
+from calendar_sse_mcp.text_index import TrigramIndex, normalize_text
+
+DOCS = {
+    "standup": ["Daily Standup", "Room A"],
+    "review": ["Design review", "会议室 北京"],
+    "lunch": ["Lunch", ""],
+    "ab": ["ab", "x"],
+}
+
+
+@pytest.fixture
+def index():
+    index = TrigramIndex()
+    for key, texts in DOCS.items():
+        index.add(key, texts)
+    return index
+
+
+def _brute_force(needle):
+    needle = normalize_text(needle)
+    return {key for key, texts in DOCS.items() if any(needle in normalize_text(text) for text in texts)}
+
+
+@pytest.mark.parametrize("needle", ["a", "A", "x", "北", "北京", "ab", "un", "rev", "q", "ly s"])
+def test_short_needles(index, needle):
+    assert index.search(needle) == _brute_force(needle)
+
+
+def test_empty_needle_matches_everything(index):
+    assert index.search("") == set(DOCS)
+
+
+def test_long_needles_are_verified(index):
+    assert index.search("standup") == {"standup"}
+    assert index.search("DESIGN REV") == {"review"}
+    assert index.search("lunchab") == set()
+
+
+def test_candidates_need_the_whole_needle():
+    index = TrigramIndex()
+    index.add("split", ["abc bcd"])
+    # Both trigrams of "abcd" are indexed for the document, the needle is not
+    assert index.search("abcd") == set()
+    assert index.search("c bc") == {"split"}
+
+
+def test_remove_and_replace(index):
+    index.remove("review")
+    assert index.search("北") == set()
+    index.add("lunch", ["Team lunch"])
+    assert index.search("team") == {"lunch"}
+    assert index.search("x") == {"ab"}
+    assert len(index) == 3
+
+
+def test_random_needles_match_brute_force():
+    rng = random.Random(7)
+    alphabet = "abcé会议 "
+    docs = {key: ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))] for key in range(200)}
+    index = TrigramIndex()
+    for key, texts in docs.items():
+        index.add(key, texts)
+    for _ in range(300):
+        needle = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+        expected = {key for key, texts in docs.items() if normalize_text(needle) in normalize_text(texts[0])}
+        assert index.search(needle) == expected